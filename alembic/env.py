@@ -1,14 +1,24 @@
+import os
 from logging.config import fileConfig
 from sqlalchemy import engine_from_config, pool
 from alembic import context
 from app.database_base import Base  # <-- Import Base directly from database_base
+from app.config import normalize_database_url
 target_metadata = Base.metadata
 
 config = context.config
 
-if config.config_file_name is not None:
+# app.schema migrates from inside the running server and keeps its logging
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
     fileConfig(config.config_file_name)
 
+# Migrate the database the app is configured for (DATABASE_URL) when it is set,
+# or the one app.schema passes in
+database_url = config.attributes.get("database_url") or os.getenv("DATABASE_URL")
+if database_url:
+    # ConfigParser treats "%" as interpolation; escape it for encoded passwords
+    config.set_main_option("sqlalchemy.url", normalize_database_url(database_url).replace("%", "%%"))
+
 # This is the important line for autogenerate
 target_metadata = Base.metadata
 
@@ -0,0 +1,46 @@
+"""add vital_observations table
+
+Revision ID: b3f7d9e1c5a2
+Revises: a8c2e4f6b0d1
+Create Date: 2026-10-17 22:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f7d9e1c5a2'
+down_revision: Union[str, Sequence[str], None] = 'a8c2e4f6b0d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Vitals of existing entries are loaded separately:
+    #   python -m app.health_progress.vitals.services
+    op.create_table(
+        'vital_observations',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('condition_type', sa.String(length=32), nullable=False),
+        sa.Column('entry_id', sa.Integer(), nullable=False),
+        sa.Column('patient_id', sa.String(length=64), nullable=False),
+        sa.Column('vital', sa.String(length=32), nullable=False),
+        sa.Column('value', sa.Float(), nullable=False),
+        sa.Column('observed_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('condition_type', 'entry_id', 'vital', name='uq_vital_observations_entry_vital'),
+    )
+    op.create_index(
+        'ix_vital_observations_patient_vital_time', 'vital_observations',
+        ['patient_id', 'vital', 'observed_at'], postgresql_include=['value'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_vital_observations_patient_vital_time', table_name='vital_observations')
+    op.drop_table('vital_observations')
@@ -0,0 +1,67 @@
+"""add tracker keyset pagination indexes
+
+Revision ID: b7e2a4c91d05
+Revises: 623c30ce9e64
+Create Date: 2026-10-17 16:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2a4c91d05'
+down_revision: Union[str, Sequence[str], None] = '623c30ce9e64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, timestamp column) ordered newest-first by the /entries listings
+TRACKER_SORT_COLUMNS = [
+    ('abdominal_entries', 'created_at'),
+    ('bariatric_entries', 'submitted_at'),
+    ('burn_care_entries', 'created_at'),
+    ('cancer_entries', 'submitted_at'),
+    ('cardiac_surgery_entries', 'created_at'),
+    ('cesarean_section_entries', 'created_at'),
+    ('diabetes_entries', 'created_at'),
+    ('general_entries', 'submitted_at'),
+    ('gynecologic_surgery_entries', 'created_at'),
+    ('heart_entries', 'created_at'),
+    ('hypertension_entries', 'created_at'),
+    ('kidney_entries', 'submitted_at'),
+    ('orthopedic_surgery_entries', 'created_at'),
+    ('urological_surgery_entries', 'created_at'),
+    ('prenatal_entries', 'submitted_at'),
+    ('postnatal_entries', 'submitted_at'),
+]
+
+
+def _existing_tables():
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+    tables = _existing_tables()
+    for table, column in TRACKER_SORT_COLUMNS:
+        # Tracker tables are created on first startup; new databases get the
+        # index from the model definition instead
+        if table not in tables:
+            continue
+        if is_postgresql:
+            columns = [sa.text(f'{column} DESC NULLS LAST'), sa.text('id DESC')]
+        else:
+            columns = [column, 'id']
+        op.create_index(f'ix_{table}_{column}_id', table, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    tables = _existing_tables()
+    for table, column in TRACKER_SORT_COLUMNS:
+        if table in tables:
+            op.drop_index(f'ix_{table}_{column}_id', table_name=table, if_exists=True)
@@ -0,0 +1,40 @@
+"""add medical_record lookup indexes
+
+Revision ID: c3f8d1a6e274
+Revises: b7e2a4c91d05
+Create Date: 2026-10-17 16:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f8d1a6e274'
+down_revision: Union[str, Sequence[str], None] = 'b7e2a4c91d05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_medical_record_patient_category_date', ['patient_id', 'category', 'date']),
+    ('ix_medical_record_category_date', ['category', 'date']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if 'medical_record' not in sa.inspect(op.get_bind()).get_table_names():
+        return
+    for name, columns in INDEXES:
+        op.create_index(name, 'medical_record', columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if 'medical_record' not in sa.inspect(op.get_bind()).get_table_names():
+        return
+    for name, _ in INDEXES:
+        op.drop_index(name, table_name='medical_record', if_exists=True)
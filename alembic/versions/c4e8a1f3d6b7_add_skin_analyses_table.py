@@ -0,0 +1,41 @@
+"""add skin_analyses table
+
+Revision ID: c4e8a1f3d6b7
+Revises: b3f7d9e1c5a2
+Create Date: 2026-10-17 23:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a1f3d6b7'
+down_revision: Union[str, Sequence[str], None] = 'b3f7d9e1c5a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'skin_analyses',
+        sa.Column('id', sa.String(length=36), nullable=False),
+        sa.Column('status', sa.String(length=16), nullable=False),
+        sa.Column('filename', sa.String(length=255), nullable=True),
+        sa.Column('file_size', sa.Integer(), nullable=True),
+        sa.Column('results', sa.JSON(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_skin_analyses_status_created', 'skin_analyses', ['status', 'created_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_skin_analyses_status_created', table_name='skin_analyses')
+    op.drop_table('skin_analyses')
@@ -0,0 +1,108 @@
+"""add (patient_id, submission_date) indexes to tracker tables
+
+Revision ID: d41b9e7c2a58
+Revises: c3f8d1a6e274
+Create Date: 2026-10-17 17:10:00.000000
+
+"""
+import logging
+from typing import List, Sequence, Tuple, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41b9e7c2a58'
+down_revision: Union[str, Sequence[str], None] = 'c3f8d1a6e274'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+
+# Trackers whose write path already keeps one entry per patient per day
+# (reject, replace or update) get a unique index; the rest still accept
+# several entries a day and get a plain lookup index.
+UNIQUE_DAILY_TABLES = [
+    'abdominal_entries',
+    'bariatric_entries',
+    'burn_care_entries',
+    'prenatal_entries',
+    'postnatal_entries',
+]
+
+INDEXED_DAILY_TABLES = [
+    'cancer_entries',
+    'cardiac_surgery_entries',
+    'cesarean_section_entries',
+    'diabetes_entries',
+    'general_entries',
+    'gynecologic_surgery_entries',
+    'heart_entries',
+    'hypertension_entries',
+    'kidney_entries',
+    'orthopedic_surgery_entries',
+    'urological_surgery_entries',
+]
+
+COLUMNS = ['patient_id', 'submission_date']
+
+# Duplicate keys listed in the error, per table
+DUPLICATES_SHOWN = 20
+
+
+def _duplicate_keys(table: str) -> List[Tuple]:
+    return op.get_bind().execute(sa.text(
+        f"SELECT patient_id, submission_date, COUNT(*) FROM {table} "
+        f"GROUP BY patient_id, submission_date HAVING COUNT(*) > 1 "
+        f"ORDER BY patient_id, submission_date LIMIT {DUPLICATES_SHOWN + 1}"
+    )).all()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+
+    # Never delete patient data in a migration: stop, name the duplicates and
+    # let them be merged by hand. The daily upsert relies on these indexes
+    # being unique once this revision is applied.
+    duplicates = {}
+    for table in UNIQUE_DAILY_TABLES:
+        if table in tables:
+            keys = _duplicate_keys(table)
+            if keys:
+                duplicates[table] = keys
+    if duplicates:
+        lines = []
+        for table, keys in duplicates.items():
+            shown = ", ".join(f"({patient_id}, {day}) x{count}" for patient_id, day, count in keys[:DUPLICATES_SHOWN])
+            more = " ..." if len(keys) > DUPLICATES_SHOWN else ""
+            lines.append(f"  {table}: {shown}{more}")
+        message = ("Duplicate (patient_id, submission_date) rows; merge them and re-run the upgrade:\n"
+                   + "\n".join(lines))
+        logger.error(f"❌ {message}")
+        raise RuntimeError(message)
+
+    for table in UNIQUE_DAILY_TABLES:
+        if table in tables:
+            op.create_index(f'uq_{table}_patient_day', table, COLUMNS, unique=True, if_not_exists=True)
+
+    for table in INDEXED_DAILY_TABLES:
+        if table in tables:
+            op.create_index(f'ix_{table}_patient_day', table, COLUMNS, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+
+    for table in UNIQUE_DAILY_TABLES:
+        if table in tables:
+            op.drop_index(f'uq_{table}_patient_day', table_name=table, if_exists=True)
+            # Left by earlier builds of this revision on tables that had duplicates
+            op.drop_index(f'ix_{table}_patient_day', table_name=table, if_exists=True)
+
+    for table in INDEXED_DAILY_TABLES:
+        if table in tables:
+            op.drop_index(f'ix_{table}_patient_day', table_name=table, if_exists=True)
@@ -0,0 +1,54 @@
+"""add triage_items table
+
+Revision ID: e5a90c3d7b14
+Revises: d41b9e7c2a58
+Create Date: 2026-10-17 18:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a90c3d7b14'
+down_revision: Union[str, Sequence[str], None] = 'd41b9e7c2a58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+OPEN_ITEMS = sa.text('resolved_at IS NULL')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing entries are queued separately:
+    #   python -m app.health_progress.triage.services --days 30
+    op.create_table(
+        'triage_items',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('condition_type', sa.String(length=32), nullable=False),
+        sa.Column('entry_id', sa.Integer(), nullable=False),
+        sa.Column('patient_id', sa.String(length=64), nullable=False),
+        sa.Column('patient_name', sa.String(length=255), nullable=True),
+        sa.Column('urgency', sa.String(length=10), nullable=False),
+        sa.Column('urgency_rank', sa.SmallInteger(), nullable=False),
+        sa.Column('submitted_at', sa.DateTime(), nullable=False),
+        sa.Column('resolved_at', sa.DateTime(), nullable=True),
+        sa.Column('resolved_by', sa.String(length=255), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('condition_type', 'entry_id', name='uq_triage_items_entry'),
+    )
+    op.create_index('ix_triage_items_patient_id', 'triage_items', ['patient_id'])
+    op.create_index(
+        'ix_triage_items_open_queue', 'triage_items', ['urgency_rank', 'submitted_at', 'id'],
+        postgresql_where=OPEN_ITEMS, sqlite_where=OPEN_ITEMS,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_triage_items_open_queue', table_name='triage_items')
+    op.drop_index('ix_triage_items_patient_id', table_name='triage_items')
+    op.drop_table('triage_items')
@@ -0,0 +1,35 @@
+"""add medical_record patient/date index
+
+Revision ID: e8b3c5d7f9a1
+Revises: c4e8a1f3d6b7
+Create Date: 2026-10-18 09:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b3c5d7f9a1'
+down_revision: Union[str, Sequence[str], None] = 'c4e8a1f3d6b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if 'medical_record' not in sa.inspect(op.get_bind()).get_table_names():
+        return
+    # The per-patient listing without a category orders by (date, id); the
+    # (patient_id, category, date) index cannot serve that order
+    op.create_index('ix_medical_record_patient_date', 'medical_record',
+                    ['patient_id', 'date', 'id'], if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if 'medical_record' not in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.drop_index('ix_medical_record_patient_date', table_name='medical_record', if_exists=True)
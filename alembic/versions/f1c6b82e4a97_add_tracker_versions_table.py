@@ -0,0 +1,35 @@
+"""add tracker_versions table
+
+Revision ID: f1c6b82e4a97
+Revises: e5a90c3d7b14
+Create Date: 2026-10-17 19:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c6b82e4a97'
+down_revision: Union[str, Sequence[str], None] = 'e5a90c3d7b14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Starts empty: every scope is at version 0 until its first write
+    op.create_table(
+        'tracker_versions',
+        sa.Column('scope', sa.String(length=160), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('scope'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('tracker_versions')
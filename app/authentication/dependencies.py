@@ -25,4 +25,14 @@ def require_staff(current_user: User = Depends(get_current_user)):
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Requires staff role (admin or doctor)"
         )
-    return current_user
\ No newline at end of file
+    return current_user
+# Staff, or the patient whose records the route's {patient_id} names
+def require_staff_or_self(patient_id: str, current_user: User = Depends(get_current_user)):
+    if current_user.role in [UserRole.ADMIN, UserRole.DOCTOR]:
+        return current_user
+    if current_user.role == UserRole.PATIENT and str(current_user.id) == str(patient_id):
+        return current_user
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Requires staff role or the patient's own account"
+    )
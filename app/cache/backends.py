@@ -0,0 +1,113 @@
+# app/cache/backends.py
+"""
+Storage for the response cache.
+
+Values are bytes with a TTL. Invalidation is by tag generation: every tag
+(a table name such as "heart_entries") has a counter, cache keys embed the
+current counters of their tags, and invalidating a tag increments its
+counter. Old entries are never looked up again and age out, so invalidation
+is O(1) however many keys a tag covers.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+
+class LRUCache:
+    """In-process backend: bounded, least-recently-used eviction, per-entry TTL"""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, value)
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    async def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: bytes, ttl: float):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    async def generations(self, tags: Iterable[str]) -> List[int]:
+        with self._lock:
+            return [self._generations.get(tag, 0) for tag in tags]
+
+    def bump(self, tags: Iterable[str]):
+        """Sync: called from commit hooks in request threads"""
+        with self._lock:
+            for tag in tags:
+                self._generations[tag] = self._generations.get(tag, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def size(self) -> int:
+        return len(self._entries)
+
+    async def close(self):
+        pass
+
+
+class RedisCache:
+    """Shared backend on a Redis-compatible server (needs the `redis` package)"""
+
+    name = "redis"
+
+    def __init__(self, url: str, prefix: str = "cache:"):
+        import redis
+        import redis.asyncio
+
+        self.prefix = prefix
+        self._client = redis.asyncio.Redis.from_url(url)
+        # Commit hooks are synchronous
+        self._sync_client = redis.Redis.from_url(url)
+        self.evictions = 0  # Redis evicts on its own (maxmemory-policy)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._client.get(self.prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: float):
+        await self._client.set(self.prefix + key, value, px=int(ttl * 1000))
+
+    async def generations(self, tags: Iterable[str]) -> List[int]:
+        tags = list(tags)
+        if not tags:
+            return []
+        values = await self._client.mget([f"{self.prefix}gen:{tag}" for tag in tags])
+        return [int(value or 0) for value in values]
+
+    def bump(self, tags: Iterable[str]):
+        pipe = self._sync_client.pipeline(transaction=False)
+        for tag in tags:
+            pipe.incr(f"{self.prefix}gen:{tag}")
+        pipe.execute()
+
+    def clear(self):
+        for key in self._sync_client.scan_iter(match=f"{self.prefix}*"):
+            self._sync_client.delete(key)
+
+    def size(self) -> Optional[int]:
+        return None  # not tracked per prefix
+
+    async def close(self):
+        await self._client.aclose()
+        self._sync_client.close()
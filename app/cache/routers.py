@@ -0,0 +1,14 @@
+# app/cache/routers.py
+from fastapi import APIRouter, Depends
+
+from app.authentication.dependencies import require_staff
+from app.models import User
+from .services import cache_stats
+
+router = APIRouter()
+
+# GET /api/cache/stats
+@router.get("/stats")
+def get_cache_stats(current_user: User = Depends(require_staff)):
+    """Hit/miss counters of this worker's response cache, per namespace"""
+    return cache_stats()
@@ -0,0 +1,261 @@
+# app/cache/services.py
+"""
+Response cache for read-heavy endpoints.
+
+Routes opt in with a decorator placed under the route decorator:
+
+    @router.get("/entries")
+    @cached_route("heart.entries", tags=["heart_entries"])
+    async def get_all_heart_entries(...): ...
+
+Other code caches values with `await get_or_set(key, compute, tags=[...])`.
+
+Tags are table names. A Session hook records which tables every transaction
+wrote and invalidates those tags right after commit, so any ORM write
+(tracker services, sync or async, user and appointment changes) refreshes
+the cached reads that depend on it. Statements that bypass the ORM call
+`invalidate` themselves.
+
+Concurrent misses of one key in a process share a single computation, so a
+dashboard refresh storm costs one query.
+"""
+import asyncio
+import functools
+import inspect
+import json
+import logging
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Sequence
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.cache.backends import LRUCache, RedisCache
+from app.config import CACHE_DEFAULT_TTL, CACHE_MAX_ENTRIES, CACHE_URL
+
+logger = logging.getLogger(__name__)
+
+PENDING_KEY = "cache_tags"
+
+_backend = None
+_inflight: Dict[str, asyncio.Future] = {}
+stats = {"hits": Counter(), "misses": Counter(), "invalidations": Counter()}
+
+
+def get_backend():
+    """Process-wide backend chosen by CACHE_URL"""
+    global _backend
+    if _backend is None:
+        _backend = RedisCache(CACHE_URL) if CACHE_URL else LRUCache(CACHE_MAX_ENTRIES)
+    return _backend
+
+
+def set_backend(backend):
+    """Swap the backend (tests, or a custom store)"""
+    global _backend
+    _backend = backend
+
+
+async def close_backend():
+    global _backend
+    if _backend is not None:
+        await _backend.close()
+        _backend = None
+
+
+def cache_stats() -> Dict[str, Any]:
+    hits, misses = sum(stats["hits"].values()), sum(stats["misses"].values())
+    backend = get_backend()
+    return {
+        "backend": backend.name,
+        "entries": backend.size(),
+        "evictions": backend.evictions,
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else None,
+        "namespaces": {
+            namespace: {"hits": stats["hits"][namespace], "misses": stats["misses"][namespace]}
+            for namespace in sorted(set(stats["hits"]) | set(stats["misses"]))
+        },
+        "invalidations": dict(stats["invalidations"]),
+    }
+
+
+def invalidate(tags: Iterable[str]):
+    """Drop every cached value tagged with one of `tags`"""
+    tags = sorted(set(tags))
+    if not tags:
+        return
+    try:
+        get_backend().bump(tags)
+    except Exception as e:
+        logger.error(f"❌ CACHE: Invalidating {tags} failed: {e}")
+        return
+    stats["invalidations"].update(tags)
+
+
+async def _versioned_key(key: str, tags: Sequence[str]) -> str:
+    if not tags:
+        return key
+    generations = await get_backend().generations(tags)
+    return key + "#" + ".".join(str(g) for g in generations)
+
+
+async def _fetch(namespace: str, key: str, tags: Sequence[str], ttl: Optional[float],
+                 compute: Callable[[], Awaitable[Optional[bytes]]]) -> tuple:
+    """(value, hit). `compute` returning None means "do not cache this one" """
+    if not hooks_installed():
+        # Nothing would invalidate what we store (scripts, tests): do not cache
+        return await compute(), False
+
+    backend = get_backend()
+    full_key = await _versioned_key(key, tags)
+
+    value = await backend.get(full_key)
+    if value is not None:
+        stats["hits"][namespace] += 1
+        return value, True
+
+    pending = _inflight.get(full_key)
+    if pending is not None:
+        # Someone in this process is already computing it
+        stats["hits"][namespace] += 1
+        return await asyncio.shield(pending), True
+
+    stats["misses"][namespace] += 1
+    future = asyncio.get_running_loop().create_future()
+    _inflight[full_key] = future
+    try:
+        value = await compute()
+        if value is not None:
+            # Stored under the generations read before computing: a write that
+            # committed meanwhile already moved readers to a new key
+            await backend.set(full_key, value, ttl or CACHE_DEFAULT_TTL)
+        future.set_result(value)
+        return value, False
+    except BaseException as e:
+        future.set_exception(e)
+        future.exception()  # waiters re-raise it; do not log it as unretrieved
+        raise
+    finally:
+        _inflight.pop(full_key, None)
+
+
+async def get_or_set(key: str, compute: Callable[[], Any], tags: Sequence[str] = (),
+                     ttl: Optional[float] = None, namespace: Optional[str] = None) -> Any:
+    """Cached JSON-serializable value; `compute` may be sync or async"""
+    async def render():
+        result = compute()
+        if inspect.isawaitable(result):
+            result = await result
+        return json.dumps(jsonable_encoder(result)).encode()
+
+    value, _ = await _fetch(namespace or key.split(":")[0], key, tuple(tags), ttl, render)
+    return json.loads(value)
+
+
+def request_key(namespace: str, request: Request) -> str:
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    return f"{namespace}:{request.url.path}?{query}"
+
+
+def cached_route(namespace: str, tags: Sequence[str] = (), ttl: Optional[float] = None):
+    """
+    Cache the JSON body of a GET endpoint per path and query string.
+
+    For endpoints that return plain data without a response_model (the body
+    is rendered here, exactly as FastAPI would). Headers set by dependencies
+    (e.g. ETag) are kept; X-Cache says HIT or MISS. Errors are not cached.
+    """
+    tags = tuple(tags)
+
+    def decorate(endpoint):
+        is_async = asyncio.iscoroutinefunction(endpoint)
+        signature = inspect.signature(endpoint)
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args, _cache_request: Request, _cache_response: Response, **kwargs):
+            async def compute():
+                if is_async:
+                    result = await endpoint(*args, **kwargs)
+                else:
+                    result = await run_in_threadpool(endpoint, *args, **kwargs)
+                if isinstance(result, Response):
+                    raise _Uncacheable(result)
+                return JSONResponse(content=jsonable_encoder(result)).body
+
+            try:
+                body, hit = await _fetch(namespace, request_key(namespace, _cache_request), tags, ttl, compute)
+            except _Uncacheable as passthrough:
+                return passthrough.response
+
+            headers = dict(_cache_response.headers)
+            headers["X-Cache"] = "HIT" if hit else "MISS"
+            return Response(content=body, media_type="application/json", headers=headers)
+
+        # FastAPI reads the signature: add the request and the shared response
+        wrapper.__signature__ = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter("_cache_request", inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+            inspect.Parameter("_cache_response", inspect.Parameter.KEYWORD_ONLY, annotation=Response),
+        ])
+        return wrapper
+
+    return decorate
+
+
+class _Uncacheable(Exception):
+    """The endpoint built its own Response; hand it back untouched"""
+
+    def __init__(self, response: Response):
+        self.response = response
+
+
+# ---------------------------------------------------------------- write hooks
+
+def note_table_write(db: Session, table_name: str):
+    """Invalidate `table_name` when `db` commits (for Core statements)"""
+    if hooks_installed():
+        db.info.setdefault(PENDING_KEY, set()).add(table_name)
+
+
+def _after_flush(session, flush_context):
+    pending = session.info.setdefault(PENDING_KEY, set())
+    for obj in (*session.new, *session.deleted):
+        pending.add(obj.__table__.name)
+    for obj in session.dirty:
+        if session.is_modified(obj):
+            pending.add(obj.__table__.name)
+
+
+def _after_commit(session):
+    invalidate(session.info.pop(PENDING_KEY, ()))
+
+
+def _after_rollback(session):
+    session.info.pop(PENDING_KEY, None)
+
+
+_HOOKS = (("after_flush", _after_flush), ("after_commit", _after_commit), ("after_rollback", _after_rollback))
+
+
+def install_cache_hooks():
+    """Invalidate cached reads of every table a committed transaction wrote (idempotent)"""
+    for name, hook in _HOOKS:
+        if not event.contains(Session, name, hook):
+            # First in line: live-update listeners must not re-read stale cache entries
+            event.listen(Session, name, hook, insert=True)
+
+
+def remove_cache_hooks():
+    for name, hook in _HOOKS:
+        if event.contains(Session, name, hook):
+            event.remove(Session, name, hook)
+
+
+def hooks_installed() -> bool:
+    return event.contains(Session, "after_commit", _after_commit)
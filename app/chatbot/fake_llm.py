@@ -0,0 +1,51 @@
+# app/chatbot/fake_llm.py
+"""
+Minimal OpenAI-compatible chat server for tests and local load runs.
+
+    FAKE_LLM_DELAY_MS=2000 uvicorn app.chatbot.fake_llm:app --port 8089
+    OPENAI_BASE_URL=http://localhost:8089/v1 uvicorn main:app
+
+It answers `POST /v1/chat/completions` with "echo: <last user message>"
+after `delay` seconds, and fails the first `failures` calls with
+`failure_status` so retries can be exercised.
+"""
+import asyncio
+import os
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+def create_app(delay: float = 0.0, failures: int = 0, failure_status: int = 503) -> FastAPI:
+    fake = FastAPI(title="Fake LLM")
+    fake.state.calls = 0
+    fake.state.failures = failures
+
+    @fake.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        fake.state.calls += 1
+        if fake.state.failures > 0:
+            fake.state.failures -= 1
+            return JSONResponse({"error": {"message": "injected failure", "type": "server_error"}},
+                                status_code=failure_status)
+        await asyncio.sleep(delay)
+        user = [m["content"] for m in body["messages"] if m["role"] == "user"]
+        return {
+            "id": f"chatcmpl-fake-{fake.state.calls}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body["model"],
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": f"echo: {user[-1] if user else ''}"},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+        }
+
+    return fake
+
+
+app = create_app(delay=float(os.getenv("FAKE_LLM_DELAY_MS", "0")) / 1000)
@@ -0,0 +1,118 @@
+# app/chatbot/llm.py
+"""
+Shared, non-blocking client for the chatbot's LLM calls.
+
+One `AsyncOpenAI` client per worker, created on first use, keeps its HTTP
+connections alive between requests. Completions wait on the event loop, so a
+slow one no longer holds up other requests; a semaphore caps how many run at
+once, every attempt has a timeout, and timeouts, connection errors, 429s and
+5xx answers are retried with exponential backoff and full jitter (honouring
+Retry-After when the server sends one).
+"""
+import asyncio
+import logging
+import os
+import random
+from typing import Dict, List, Optional
+
+import httpx
+import openai
+
+from app.config import CHATBOT_CONCURRENCY, CHATBOT_MAX_RETRIES, CHATBOT_MODEL, CHATBOT_TIMEOUT, OPENAI_BASE_URL
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE = (openai.APITimeoutError, openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError)
+BACKOFF_BASE = 0.5   # seconds; attempt n waits up to BACKOFF_BASE * 2**n
+BACKOFF_CAP = 8.0
+
+
+class ChatUnavailable(Exception):
+    """No completion: all slots busy for too long, or the LLM kept failing"""
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    response = getattr(error, "response", None)
+    value = response.headers.get("retry-after") if response is not None else None
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+class ChatClient:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        model: str = CHATBOT_MODEL,
+        concurrency: int = CHATBOT_CONCURRENCY,
+        timeout: float = CHATBOT_TIMEOUT,
+        max_retries: int = CHATBOT_MAX_RETRIES,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
+        self.model = model
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self._slots = asyncio.Semaphore(concurrency)
+        self._http = http_client or httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+        )
+        self._client = openai.AsyncOpenAI(
+            api_key=api_key or os.getenv("OPENAI_API_KEY") or "missing",
+            base_url=base_url or None,
+            timeout=httpx.Timeout(timeout, connect=min(timeout, 5.0)),
+            max_retries=0,  # retried here, with jitter and under the concurrency cap
+            http_client=self._http,
+        )
+
+    async def complete(self, messages: List[Dict[str, str]], max_tokens: int = 300, temperature: float = 0.7) -> str:
+        """Text of one chat completion"""
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.timeout)
+        except asyncio.TimeoutError:
+            raise ChatUnavailable("All chat slots stayed busy")
+        try:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    response = await self._client.chat.completions.create(
+                        model=self.model, messages=messages, max_tokens=max_tokens, temperature=temperature,
+                    )
+                    return (response.choices[0].message.content or "").strip()
+                except RETRYABLE as e:
+                    if attempt == self.max_retries:
+                        raise ChatUnavailable(f"LLM call failed after {attempt + 1} attempts: {e}") from e
+                    delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+                    delay = max(delay, min(_retry_after(e) or 0, BACKOFF_CAP))
+                    logger.warning(f"⚠️ CHATBOT: {type(e).__name__}, retrying in {delay:.2f}s")
+                    await asyncio.sleep(delay)
+        finally:
+            self._slots.release()
+
+    async def close(self):
+        await self._client.close()
+        await self._http.aclose()
+
+
+_client: Optional[ChatClient] = None
+
+
+def get_chat_client() -> ChatClient:
+    """Worker-wide client, created inside the running event loop on first use"""
+    global _client
+    if _client is None:
+        _client = ChatClient(base_url=OPENAI_BASE_URL)
+    return _client
+
+
+def set_chat_client(client: Optional[ChatClient]):
+    """Swap the client (tests, or another OpenAI-compatible server)"""
+    global _client
+    _client = client
+
+
+async def close_chat_client():
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
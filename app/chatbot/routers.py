@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException, Depends, Query
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from .schemas import (
     ChatRequest, ChatResponse, ChatLogRead,
     CheckInCreate, CheckInRead, ProgressSummary
@@ -26,14 +27,16 @@ async def chatbot_endpoint(
     Supports multilingual responses via `language` query parameter.
     """
     try:
-        reply = get_chatbot_response(
+        reply = await get_chatbot_response(
             message=request.message,
             language=language,
             user_id=request.user_id
         )
 
         # Save chat log with language
-        save_chat_log(
+        # Sync session: keep the commit off the event loop
+        await run_in_threadpool(
+            save_chat_log,
             db=db,
             user_id=request.user_id,
             message=request.message,
@@ -59,14 +62,15 @@ async def symptom_checker_endpoint(
     Receives symptom descriptions and provides AI-guided responses.
     """
     try:
-        reply = get_chatbot_response(
+        reply = await get_chatbot_response(
             message=request.message,
             language=language,
             user_id=request.user_id
         )
 
         # Save chat log with language and note as symptom check
-        save_chat_log(
+        await run_in_threadpool(
+            save_chat_log,
             db=db,
             user_id=request.user_id,
             message=request.message,
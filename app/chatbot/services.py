@@ -1,7 +1,6 @@
 from sqlalchemy.orm import Session
 from .models import ChatLog, CheckIn
-import openai  # for GPT-3.5 integration
-import os
+from .llm import get_chat_client
 from langdetect import detect
 
 # -----------------------------
@@ -58,7 +57,7 @@ def match_faq(message: str, language: str):
 # -----------------------------
 # Core Chatbot Response
 # -----------------------------
-def get_chatbot_response(message: str, language: str = None, user_id: str = None, mode: str = "chat") -> str:
+async def get_chatbot_response(message: str, language: str = None, user_id: str = None, mode: str = "chat") -> str:
     """
     Returns response to user message.
     mode="chat" for general chatbot
@@ -98,10 +97,8 @@ def get_chatbot_response(message: str, language: str = None, user_id: str = None
             }
             return responses.get(language, responses["en"])
 
-    # 4) AI/NLP response using GPT-3.5
+    # 4) AI/NLP response from the shared async LLM client
     try:
-        openai.api_key = os.getenv("OPENAI_API_KEY")
-
         if mode == "symptom_checker":
             system_prompt = (
                 f"You are a helpful medical assistant. "
@@ -112,17 +109,14 @@ def get_chatbot_response(message: str, language: str = None, user_id: str = None
         else:
             system_prompt = f"You are a helpful assistant responding in {language}."
 
-        response = openai.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
+        return await get_chat_client().complete(
+            [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": message}
             ],
             max_tokens=300,
             temperature=0.7
         )
-        ai_message = response.choices[0].message.content.strip()
-        return ai_message
     except Exception as e:
         print(f"OpenAI API error: {e}")
         return "An error occurred. Please try again later."
@@ -1,2 +1,100 @@
-DATABASE_URL = "sqlite:///./test.db"
+import os
 
+
+def normalize_database_url(url: str) -> str:
+    # Heroku/Render style URLs use the "postgres://" scheme SQLAlchemy no longer accepts
+    if url.startswith("postgres://"):
+        return "postgresql://" + url[len("postgres://"):]
+    return url
+
+
+# Render (and most hosts) provide DATABASE_URL; local development falls back to SQLite
+DATABASE_URL = normalize_database_url(os.getenv("DATABASE_URL", "sqlite:///./hospiapp.db"))
+
+# PostgreSQL connection pool, per worker process
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # seconds; below typical idle-connection cutoffs
+
+# SQLite: how long a writer waits for the lock before "database is locked"
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+
+# Apply Alembic migrations when the server starts. Off by default: migrating is
+# an explicit step, `python -m app.schema` (render.yaml runs it before each
+# deploy; run it once by hand before starting a local server).
+RUN_MIGRATIONS_ON_STARTUP = os.getenv("RUN_MIGRATIONS_ON_STARTUP", "0") == "1"
+
+# Skin analysis micro-batching: a forward pass runs when SKIN_BATCH_SIZE images
+# are waiting or SKIN_BATCH_WAIT_MS after the first one; beyond
+# SKIN_QUEUE_DEPTH pending images uploads get 429
+SKIN_BATCH_SIZE = int(os.getenv("SKIN_BATCH_SIZE", "8"))
+SKIN_BATCH_WAIT_MS = float(os.getenv("SKIN_BATCH_WAIT_MS", "10"))
+SKIN_QUEUE_DEPTH = int(os.getenv("SKIN_QUEUE_DEPTH", "64"))
+
+# Skin model runtime: "keras" (full TensorFlow, float32) or "tflite" (the
+# quantized artifact from `python -m app.skin_analysis.convert`); an empty
+# SKIN_TFLITE_MODEL_PATH means the file next to the .keras model
+SKIN_MODEL_BACKEND = os.getenv("SKIN_MODEL_BACKEND", "keras")
+SKIN_TFLITE_MODEL_PATH = os.getenv("SKIN_TFLITE_MODEL_PATH", "")
+
+# Model versions: `<version>.keras` / `<version>.tflite` files in
+# SKIN_MODEL_DIR (empty: app/skin_analysis). SKIN_MODEL_VERSION is loaded at
+# startup (empty: the bundled model); admins switch versions at runtime with
+# POST /api/skin-analysis/models/{version}/activate
+SKIN_MODEL_DIR = os.getenv("SKIN_MODEL_DIR", "")
+SKIN_MODEL_VERSION = os.getenv("SKIN_MODEL_VERSION", "")
+
+# Skin uploads: larger files get 413 without being read to the end; images
+# are decoded on SKIN_DECODE_WORKERS threads
+SKIN_MAX_UPLOAD_BYTES = int(os.getenv("SKIN_MAX_UPLOAD_BYTES", str(15 * 1024 * 1024)))
+SKIN_DECODE_WORKERS = int(os.getenv("SKIN_DECODE_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# Skin analysis results live in the skin_analyses table. Jobs still pending
+# after SKIN_JOB_TIMEOUT seconds died with their worker and read as failed;
+# results older than SKIN_ANALYSIS_RETENTION_DAYS are removed by
+# `python -m app.skin_analysis.jobs`
+SKIN_JOB_TIMEOUT = float(os.getenv("SKIN_JOB_TIMEOUT", "300"))
+SKIN_ANALYSIS_RETENTION_DAYS = int(os.getenv("SKIN_ANALYSIS_RETENTION_DAYS", "30"))
+
+# Repeat uploads of the same image reuse its prediction: an in-process LRU of
+# SKIN_PREDICTION_CACHE_ENTRIES, plus JSON files in SKIN_PREDICTION_CACHE_DIR
+# when set (shared by the workers of one host, kept across restarts)
+SKIN_PREDICTION_CACHE_ENTRIES = int(os.getenv("SKIN_PREDICTION_CACHE_ENTRIES", "1024"))
+SKIN_PREDICTION_CACHE_DIR = os.getenv("SKIN_PREDICTION_CACHE_DIR", "")
+SKIN_PREDICTION_CACHE_DISK_ENTRIES = int(os.getenv("SKIN_PREDICTION_CACHE_DISK_ENTRIES", "20000"))
+
+# Live tracker events for the staff dashboard. Empty: in-process broker (one
+# worker). With several workers point this at a Redis-compatible server,
+# e.g. redis://localhost:6379/0 (needs the `redis` package)
+EVENT_BROKER_URL = os.getenv("EVENT_BROKER_URL", "")
+# Events kept for clients that reconnect with Last-Event-ID
+EVENT_HISTORY_SIZE = int(os.getenv("EVENT_HISTORY_SIZE", "1000"))
+
+# Response cache. Empty CACHE_URL: in-process LRU (per worker); with several
+# workers use a Redis-compatible server so invalidations reach every worker
+CACHE_URL = os.getenv("CACHE_URL", "")
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "2048"))
+CACHE_DEFAULT_TTL = float(os.getenv("CACHE_DEFAULT_TTL", "60"))  # seconds
+
+# Offline sync: most entries one POST /api/health-progress/bulk may carry
+BULK_MAX_ENTRIES = int(os.getenv("BULK_MAX_ENTRIES", "2000"))
+
+# Streaming exports: rows fetched per server-side cursor round trip (and per
+# Parquet row group)
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "2000"))
+
+# Patient timeline: per-table queries run at most this many at a time per
+# request (each holds a pooled connection)
+TIMELINE_CONCURRENCY = int(os.getenv("TIMELINE_CONCURRENCY", "6"))
+
+# Chatbot LLM calls: one shared async client per worker. At most
+# CHATBOT_CONCURRENCY completions run at once (others wait up to
+# CHATBOT_TIMEOUT for a slot); failures are retried CHATBOT_MAX_RETRIES times
+# with jittered backoff. OPENAI_BASE_URL points at any OpenAI-compatible
+# server, e.g. the fake one: uvicorn app.chatbot.fake_llm:app --port 8089
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "")
+CHATBOT_MODEL = os.getenv("CHATBOT_MODEL", "gpt-3.5-turbo")
+CHATBOT_CONCURRENCY = int(os.getenv("CHATBOT_CONCURRENCY", "8"))
+CHATBOT_TIMEOUT = float(os.getenv("CHATBOT_TIMEOUT", "20"))  # seconds per attempt
+CHATBOT_MAX_RETRIES = int(os.getenv("CHATBOT_MAX_RETRIES", "2"))
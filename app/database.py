@@ -1,10 +1,78 @@
-from sqlalchemy import create_engine
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from app.config import (
+    DATABASE_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    SQLITE_BUSY_TIMEOUT_MS,
+)
 from app.database_base import Base  # <-- use database_base.py
 
-DATABASE_URL = "sqlite:///./hospiapp.db"
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+POOL_SETTINGS = dict(
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+)
+
+
+def _use_sqlite_pragmas(engine):
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        # WAL lets readers run alongside the single writer, so several
+        # uvicorn workers can share the file without "database is locked"
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.close()
+
+
+def create_db_engine(url: str):
+    """
+    Engine for `url`: WAL + busy timeout on SQLite, a tuned pool elsewhere.
+    """
+    if url.startswith("sqlite"):
+        engine = create_engine(
+            url,
+            connect_args={"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000},
+        )
+        _use_sqlite_pragmas(engine)
+        return engine
+
+    return create_engine(url, **POOL_SETTINGS)
+
+
+def async_database_url(url: str) -> str:
+    """Same database through its asyncio driver: aiosqlite locally, asyncpg in production"""
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://"):]
+    if url.startswith("postgresql://") or url.startswith("postgresql+psycopg2://"):
+        return "postgresql+asyncpg://" + url.split("://", 1)[1]
+    return url
+
+
+def create_async_db_engine(url: str) -> AsyncEngine:
+    """
+    Async counterpart of create_db_engine, with the same pragmas and pool settings.
+    """
+    url = async_database_url(url)
+    if url.startswith("sqlite"):
+        engine = create_async_engine(url, connect_args={"timeout": SQLITE_BUSY_TIMEOUT_MS / 1000})
+        _use_sqlite_pragmas(engine.sync_engine)
+        return engine
+
+    return create_async_engine(url, **POOL_SETTINGS)
+
+
+engine = create_db_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def get_db():
@@ -14,5 +82,29 @@ def get_db():
     finally:
         db.close()
 
-# optional: create tables
-Base.metadata.create_all(bind=engine)
\ No newline at end of file
+
+# The async engine is only built on first use, so the sync-only code paths
+# (scripts, alembic, tests) do not need aiosqlite/asyncpg installed
+_async_engine: Optional[AsyncEngine] = None
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
+
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_db_engine(DATABASE_URL)
+    return _async_engine
+
+
+async def dispose_async_engine():
+    """Close the async pool on shutdown (no-op if no async route ran)"""
+    global _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """Async routes use this instead of get_db so queries don't block the event loop"""
+    async with AsyncSessionLocal(bind=get_async_engine()) as db:
+        yield db
@@ -1,9 +1,13 @@
-from sqlalchemy import Column, Integer, String, JSON, DateTime
+from sqlalchemy import Column, Integer, String, JSON, DateTime, Index
 from sqlalchemy.sql import func
 from app.database import Base
+from app.health_progress.pagination import keyset_indexes
 
 class AbdominalEntry(Base):
     __tablename__ = "abdominal_entries"
+    __table_args__ = keyset_indexes("abdominal_entries", "created_at") + (
+        Index("uq_abdominal_entries_patient_day", "patient_id", "submission_date", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     patient_id = Column(Integer, index=True, nullable=False)
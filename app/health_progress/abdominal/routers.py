@@ -1,19 +1,24 @@
 from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
+from app.health_progress.pagination import PageParams, page_params
+from app.health_progress.versions.conditional import entries_etag, patient_etag
 from . import schemas, services
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-def get_abdominal_service(db: Session = Depends(get_db)) -> services.AbdominalProgressService:
-    return services.AbdominalProgressService(db)
+def get_abdominal_service(db: AsyncSession = Depends(get_async_db)) -> services.AsyncAbdominalProgressService:
+    return services.AsyncAbdominalProgressService(db)
+
+# Columns the listings render; the rest of the row is not loaded
+LIST_COLUMNS = ["id", "patient_id", "patient_name", "common_data", "condition_data", "created_at"]
 
 @router.post("/abdominal-entries", response_model=schemas.AbdominalEntryResponse)
 async def create_abdominal_entry(
     entry_data: dict,  # ✅ CHANGED: Accept raw JSON instead of Pydantic schema
-    abdominal_service: services.AbdominalProgressService = Depends(get_abdominal_service)
+    abdominal_service: services.AsyncAbdominalProgressService = Depends(get_abdominal_service)
 ):
     """
     Create a new abdominal surgery progress entry from mobile app JSON data
@@ -22,14 +27,14 @@ async def create_abdominal_entry(
         logger.info(f"📝 Creating abdominal progress entry for patient {entry_data.get('patient_id')}")
         
         # Check for existing entry
-        if abdominal_service.check_existing_entry(entry_data.get('patient_id'), entry_data.get('submission_date')):
+        if await abdominal_service.check_existing_entry(entry_data.get('patient_id'), entry_data.get('submission_date')):
             raise HTTPException(
                 status_code=400, 
                 detail=f"Abdominal progress entry already exists for patient {entry_data.get('patient_id')} on {entry_data.get('submission_date')}"
             )
         
         # Create entry with raw JSON data
-        db_entry = abdominal_service.create_entry(entry_data)
+        db_entry = await abdominal_service.create_entry(entry_data)
         
         # Prepare response
         response_data = schemas.AbdominalEntryResponse(
@@ -51,16 +56,16 @@ async def create_abdominal_entry(
         logger.error(f"❌ Error creating abdominal progress entry: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to create abdominal progress entry: {str(e)}")
 
-@router.get("/abdominal-entries/patient/{patient_id}")
+@router.get("/abdominal-entries/patient/{patient_id}", dependencies=[Depends(patient_etag("abdominal"))])
 async def get_patient_abdominal_entries(
     patient_id: int,
-    abdominal_service: services.AbdominalProgressService = Depends(get_abdominal_service)
+    abdominal_service: services.AsyncAbdominalProgressService = Depends(get_abdominal_service)
 ):
     """
     Get all abdominal progress entries for a specific patient
     """
     try:
-        entries = abdominal_service.get_patient_entries(patient_id)
+        entries = await abdominal_service.get_patient_entries(patient_id)
         return {
             "patient_id": patient_id,
             "entries": entries,
@@ -70,31 +75,32 @@ async def get_patient_abdominal_entries(
         logger.error(f"❌ Error fetching abdominal entries: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to fetch abdominal progress entries")
 
-@router.get("/abdominal-entries/check/{patient_id}/{date}")
+@router.get("/abdominal-entries/check/{patient_id}/{date}", dependencies=[Depends(patient_etag("abdominal"))])
 async def check_abdominal_entry_exists(
     patient_id: int,
     date: str,
-    abdominal_service: services.AbdominalProgressService = Depends(get_abdominal_service)
+    abdominal_service: services.AsyncAbdominalProgressService = Depends(get_abdominal_service)
 ):
     """
     Check if an abdominal entry exists for a patient on a specific date
     """
     try:
-        exists = abdominal_service.check_existing_entry(patient_id, date)
+        exists = await abdominal_service.check_existing_entry(patient_id, date)
         return {"exists": exists}
     except Exception as e:
         logger.error(f"❌ Error checking abdominal entry: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to check abdominal entry")
 
-@router.get("/abdominal-entries")
+@router.get("/abdominal-entries", dependencies=[Depends(entries_etag("abdominal"))])
 async def get_all_abdominal_entries(
-    abdominal_service: services.AbdominalProgressService = Depends(get_abdominal_service)
+    page: PageParams = Depends(page_params),
+    abdominal_service: services.AsyncAbdominalProgressService = Depends(get_abdominal_service)
 ):
     """
-    Get all abdominal progress entries for the dashboard
+    Get abdominal progress entries for the dashboard, newest first, one page at a time
     """
     try:
-        entries = abdominal_service.get_all_entries()
+        entries, next_cursor = await abdominal_service.get_all_entries(page, columns=LIST_COLUMNS)
         
         # Format the response for the dashboard
         formatted_entries = []
@@ -111,7 +117,8 @@ async def get_all_abdominal_entries(
         
         return {
             "entries": formatted_entries,
-            "count": len(formatted_entries)
+            "count": len(formatted_entries),
+            "next_cursor": next_cursor
         }
         
     except Exception as e:
@@ -119,9 +126,10 @@ async def get_all_abdominal_entries(
         raise HTTPException(status_code=500, detail="Failed to fetch abdominal entries")
 
 
-@router.get("/abdominal/entries")
-async def get_all_abdominal_entries():
-    """Get all abdominal surgery entries"""
-    query = "SELECT * FROM abdominal_surgery_entries ORDER BY submission_date DESC, created_at DESC"
-    entries = await database.fetch_all(query)
-    return {"entries": entries}
\ No newline at end of file
+@router.get("/abdominal/entries", dependencies=[Depends(entries_etag("abdominal"))])
+async def get_abdominal_surgery_entries(
+    page: PageParams = Depends(page_params),
+    abdominal_service: services.AsyncAbdominalProgressService = Depends(get_abdominal_service)
+):
+    """Get abdominal surgery entries (same pages as /abdominal-entries)"""
+    return await get_all_abdominal_entries(page, abdominal_service)
\ No newline at end of file
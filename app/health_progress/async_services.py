@@ -0,0 +1,75 @@
+# app/health_progress/async_services.py
+"""
+AsyncSession front for the tracker repositories.
+
+AsyncTrackerService runs the methods of a TrackerRepository
+(app/health_progress/repository.py) through `AsyncSession.run_sync`: the
+same queries, pagination, projection, timing and write hooks, executed on
+the async driver so a route awaits them instead of blocking the event loop.
+Each tracker only names its repository:
+
+    class AsyncKidneyProgressService(AsyncTrackerService):
+        repository = KidneyProgressService
+
+Rows come back fully loaded (or loaded as far as `columns=` asks); touching
+an attribute that was not loaded raises instead of querying.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.health_progress.pagination import PageParams
+from app.health_progress.repository import TrackerRepository
+
+
+class AsyncTrackerService:
+    repository: Type[TrackerRepository] = TrackerRepository
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @property
+    def model(self):
+        return self.repository.model
+
+    @property
+    def label(self) -> str:
+        return self.repository.label
+
+    async def _run(self, method: str, *args, **kwargs):
+        def call(session):
+            return getattr(self.repository(session), method)(*args, **kwargs)
+        return await self.db.run_sync(call)
+
+    async def create_entry(self, entry_data: Dict[str, Any]):
+        return await self._run("create_entry", entry_data)
+
+    async def create_entries(self, entries_data: Iterable[Dict[str, Any]]) -> List[Any]:
+        return await self._run("create_entries", list(entries_data))
+
+    async def get_all_entries(self, page: PageParams, columns: Optional[Iterable[str]] = None) -> Tuple[List[Any], Optional[str]]:
+        return await self._run("get_all_entries", page, columns=columns)
+
+    async def get_entry(self, patient_id: Any, date_str: Any):
+        return await self._run("get_entry", patient_id, date_str)
+
+    async def get_entry_by_id(self, entry_id: int):
+        return await self._run("get_entry_by_id", entry_id)
+
+    async def check_existing_entry(self, patient_id: Any, date_str: Any) -> bool:
+        return await self._run("check_existing_entry", patient_id, date_str)
+
+    async def get_patient_entries(self, patient_id: Any, limit: Optional[int] = None, columns: Optional[Iterable[str]] = None) -> List[Any]:
+        return await self._run("get_patient_entries", patient_id, limit=limit, columns=columns)
+
+    async def get_patient_page(self, patient_id: Any, page: PageParams, columns: Optional[Iterable[str]] = None) -> Tuple[List[Any], Optional[str]]:
+        return await self._run("get_patient_page", patient_id, page, columns=columns)
+
+    async def get_recent_entries(self, limit: int = 50, columns: Optional[Iterable[str]] = None) -> List[Any]:
+        return await self._run("get_recent_entries", limit=limit, columns=columns)
+
+    async def update_entry(self, entry_id: int, update_data: Dict[str, Any]):
+        return await self._run("update_entry", entry_id, update_data)
+
+    async def delete_entry(self, entry_id: int) -> bool:
+        return await self._run("delete_entry", entry_id)
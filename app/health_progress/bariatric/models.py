@@ -1,12 +1,16 @@
 # app/health_progress/bariatric/models.py - TEMPORARY FIX
-from sqlalchemy import Column, Integer, String, DateTime, JSON
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Index
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
+from app.health_progress.pagination import keyset_indexes
 
 Base = declarative_base()
 
 class BariatricEntry(Base):
     __tablename__ = "bariatric_entries"
+    __table_args__ = keyset_indexes("bariatric_entries", "submitted_at") + (
+        Index("uq_bariatric_entries_patient_day", "patient_id", "submission_date", unique=True),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     patient_id = Column(Integer, nullable=False)
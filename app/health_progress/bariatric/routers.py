@@ -1,41 +1,46 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date
-from app.database import get_db
+from app.database import get_async_db
+from app.health_progress.pagination import PageParams, page_params
+from app.cache.services import cached_route
+from app.health_progress.versions.conditional import entries_etag, patient_etag
 from . import services, schemas
 
 # ✅ ROUTER MUST BE DEFINED FIRST
 router = APIRouter(prefix="/bariatric-entries", tags=["Bariatric Progress"])
 
-def get_bariatric_service(db: Session = Depends(get_db)):
-    return services.BariatricProgressService(db)
+def get_bariatric_service(db: AsyncSession = Depends(get_async_db)):
+    return services.AsyncBariatricProgressService(db)
 
 # ✅ ENDPOINT 1: Check specific entry (consistent with burn care pattern)
-@router.get("/{patient_id}/{date}")
+@router.get("/{patient_id}/{date}", dependencies=[Depends(patient_etag("bariatric"))])
 async def check_bariatric_entry(
     patient_id: str,
     date: date,
-    bariatric_service: services.BariatricProgressService = Depends(get_bariatric_service)
+    bariatric_service: services.AsyncBariatricProgressService = Depends(get_bariatric_service)
 ):
     """
     Check if bariatric entry exists for specific patient and date
     """
     try:
-        exists = bariatric_service.check_existing_entry(patient_id, date)
+        exists = await bariatric_service.check_existing_entry(patient_id, date)
         return {"exists": exists, "patient_id": patient_id, "date": date}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error checking bariatric entry: {str(e)}")
 
 # ✅ ENDPOINT 2: Get all entries for dashboard
-@router.get("")
+@router.get("", dependencies=[Depends(entries_etag("bariatric"))])
+@cached_route("bariatric.entries", tags=["bariatric_entries"])
 async def get_all_bariatric_entries(
-    bariatric_service: services.BariatricProgressService = Depends(get_bariatric_service)
+    page: PageParams = Depends(page_params),
+    bariatric_service: services.AsyncBariatricProgressService = Depends(get_bariatric_service)
 ):
     """
     Get ALL bariatric entries for dashboard
     """
     try:
-        entries = bariatric_service.get_all_entries()
+        entries, next_cursor = await bariatric_service.get_all_entries(page)
         
         formatted_entries = []
         for entry in entries:
@@ -54,6 +59,7 @@ async def get_all_bariatric_entries(
         return {
             "entries": formatted_entries,
             "total": len(entries),
+            "next_cursor": next_cursor,
             "condition_type": "bariatric"
         }
         
@@ -64,7 +70,7 @@ async def get_all_bariatric_entries(
 @router.post("", response_model=schemas.BariatricEntryResponse)
 async def create_bariatric_entry(
     entry_data: schemas.BariatricEntryCreate,
-    bariatric_service: services.BariatricProgressService = Depends(get_bariatric_service)
+    bariatric_service: services.AsyncBariatricProgressService = Depends(get_bariatric_service)
 ):
     """
     Create NEW bariatric progress entry OR REPLACE existing same-day entry
@@ -87,11 +93,11 @@ async def create_bariatric_entry(
             raise HTTPException(status_code=422, detail="submissionDate is required")
         
         # ✅ CHECK FOR EXISTING ENTRY - Allow replacement for same date
-        existing_entry = bariatric_service.check_existing_entry(patient_id, submission_date)
+        existing_entry = await bariatric_service.get_entry(patient_id, submission_date)
         if existing_entry:
             print(f"🔄 BARIATRIC: Replacing existing entry for {submission_date}")
             # Delete existing entry to replace it (same date replacement)
-            bariatric_service.delete_entry(existing_entry.id)
+            await bariatric_service.delete_entry(existing_entry.id)
         
         # BUILD COMMON DATA - use whatever exists
         common_data = {}
@@ -133,7 +139,7 @@ async def create_bariatric_entry(
         
         print("🔧 BARIATRIC: Final data for DB:", db_data)
         
-        db_entry = bariatric_service.create_entry(db_data)
+        db_entry = await bariatric_service.create_entry(db_data)
         
         return schemas.BariatricEntryResponse(
             id=db_entry.id,
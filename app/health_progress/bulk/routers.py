@@ -0,0 +1,31 @@
+# app/health_progress/bulk/routers.py
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from .schemas import BulkRequest, BulkResponse
+from .services import BulkIngestService
+
+router = APIRouter()
+
+def get_bulk_service(db: Session = Depends(get_db)):
+    return BulkIngestService(db)
+
+# POST /api/health-progress/bulk
+@router.post("", response_model=BulkResponse)
+def create_bulk_entries(request: BulkRequest, bulk_service: BulkIngestService = Depends(get_bulk_service)):
+    """
+    Entries a device queued while offline, of any condition, in one request:
+
+        {"entries": [{"condition_type": "kidney", "client_id": "a1",
+                      "entry": {"patient_id": 7, "submission_date": "2025-05-01", ...}}, ...]}
+
+    One result per entry, in order: created (with its id), exists (already
+    stored for that patient and day, with the stored id), duplicate (repeats
+    an earlier entry of the batch) or invalid (with the reason). Invalid
+    entries do not stop the others.
+    """
+    try:
+        return bulk_service.ingest(request.entries)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to store entries: {str(e)}")
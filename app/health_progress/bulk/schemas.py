@@ -0,0 +1,36 @@
+# app/health_progress/bulk/schemas.py
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from app.config import BULK_MAX_ENTRIES
+
+
+class BulkEntry(BaseModel):
+    condition_type: str
+    # Echoed back so the device can match results to its outbox
+    client_id: Optional[str] = None
+    # The submission, shaped like the tracker service stores it (patient_id,
+    # submission_date, ... and common_data/condition_data for JSON trackers)
+    entry: Dict[str, Any]
+
+
+class BulkRequest(BaseModel):
+    entries: List[BulkEntry] = Field(..., max_length=BULK_MAX_ENTRIES)
+
+
+class BulkItemResult(BaseModel):
+    index: int
+    condition_type: str
+    client_id: Optional[str] = None
+    status: str  # created | exists | duplicate | invalid
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+
+class BulkResponse(BaseModel):
+    created: int
+    exists: int
+    duplicate: int
+    invalid: int
+    results: List[BulkItemResult]
@@ -0,0 +1,189 @@
+# app/health_progress/bulk/services.py
+"""
+Batch ingestion of tracker entries synced by devices that were offline.
+
+One request carries entries of any condition. The batch is validated in one
+pass (each entry is built by its tracker's `build_entry`, exactly as a
+single POST would), deduplicated on (patient_id, submission_date) within
+itself and against the database with one query per condition, and the new
+rows of each condition are written with one executemany INSERT. Everything
+commits in one transaction.
+
+Replaying a batch is safe: entries already stored come back as "exists" with
+their id, so a device can retry after a dropped connection.
+"""
+import logging
+from collections import defaultdict
+from datetime import date
+from typing import Any, Dict, List, Sequence, Tuple
+
+from sqlalchemy import Date, Integer, insert, select
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import Session
+
+from app.health_progress.abdominal.services import AbdominalProgressService
+from app.health_progress.bariatric.services import BariatricProgressService
+from app.health_progress.bulk.schemas import BulkEntry
+from app.health_progress.burn_care.services import BurnCareRepository
+from app.health_progress.cancer.services import CancerProgressService
+from app.health_progress.cardiac.services import CardiacProgressService
+from app.health_progress.cesarean.services import CesareanProgressService
+from app.health_progress.diabetes.services import DiabetesProgressService
+from app.health_progress.general.services import GeneralProgressService
+from app.health_progress.gynecologic.services import GynecologicProgressService
+from app.health_progress.heart.services import HeartProgressService
+from app.health_progress.hooks import bulk_insert_write
+from app.health_progress.hypertension.services import HypertensionProgressService
+from app.health_progress.kidney.services import KidneyProgressService
+from app.health_progress.orthopedic.services import OrthopedicProgressService
+from app.health_progress.registry import TrackerSpec, get_tracker
+from app.health_progress.urological.services import UrologicalProgressService
+from app.health_progress.versions.services import patient_scope
+
+logger = logging.getLogger(__name__)
+
+# Trackers that take bulk entries: the ones built by a TrackerRepository
+REPOSITORIES = {
+    "abdominal": AbdominalProgressService,
+    "bariatric": BariatricProgressService,
+    "burn_care": BurnCareRepository,
+    "cancer": CancerProgressService,
+    "cardiac": CardiacProgressService,
+    "cesarean": CesareanProgressService,
+    "diabetes": DiabetesProgressService,
+    "general_health": GeneralProgressService,
+    "gynecologic": GynecologicProgressService,
+    "heart": HeartProgressService,
+    "hypertension": HypertensionProgressService,
+    "kidney": KidneyProgressService,
+    "orthopedic": OrthopedicProgressService,
+    "urological": UrologicalProgressService,
+}
+
+
+class _Invalid(ValueError):
+    pass
+
+
+def _integer_patient_id(spec: TrackerSpec) -> bool:
+    return isinstance(spec.model.patient_id.type, Integer)
+
+
+def _date_column(spec: TrackerSpec) -> bool:
+    return isinstance(spec.model.submission_date.type, Date)
+
+
+def _row(spec: TrackerSpec, repository, entry_data: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+    """Column values of one submission and its dedupe key; raises _Invalid"""
+    patient_id = entry_data.get("patient_id")
+    if patient_id is None or str(patient_id).strip() == "":
+        raise _Invalid("patient_id is required")
+    if _integer_patient_id(spec) and not str(patient_id).strip().isdigit():
+        raise _Invalid(f"patient_id must be a number, got {patient_id!r}")
+
+    submission_date = entry_data.get("submission_date")
+    try:
+        day = submission_date if isinstance(submission_date, date) else date.fromisoformat(str(submission_date))
+    except ValueError:
+        raise _Invalid(f"submission_date must be YYYY-MM-DD, got {submission_date!r}")
+
+    try:
+        entry = repository.build_entry({**entry_data, "submission_date": day.isoformat()})
+    except Exception as e:
+        raise _Invalid(f"Could not build {spec.condition_type} entry: {e}")
+
+    columns = spec.model.__table__.columns
+    values = {k: v for k, v in sa_inspect(entry).dict.items() if k in columns and k != "id"}
+    patient_id = str(values["patient_id"]).strip()
+    values["patient_id"] = int(patient_id) if _integer_patient_id(spec) else patient_id
+    values["submission_date"] = day if _date_column(spec) else day.isoformat()
+    return values, f"{patient_scope(spec, values['patient_id'])}:{day.isoformat()}"
+
+
+def _stored_keys(db: Session, spec: TrackerSpec, rows: Sequence[Dict[str, Any]]) -> Dict[str, int]:
+    """Dedupe key -> id of entries already stored for the patients and days in `rows`"""
+    model = spec.model
+    stored = db.execute(
+        select(model.id, model.patient_id, model.submission_date).where(
+            model.patient_id.in_({row["patient_id"] for row in rows}),
+            model.submission_date.in_({row["submission_date"] for row in rows}),
+        )
+    ).all()
+    keys = {}
+    for entry_id, patient_id, submission_date in stored:
+        day = submission_date.isoformat() if isinstance(submission_date, date) else submission_date
+        keys.setdefault(f"{patient_scope(spec, patient_id)}:{day}", entry_id)
+    return keys
+
+
+class BulkIngestService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def ingest(self, items: Sequence[BulkEntry]) -> Dict[str, Any]:
+        """Store every new, valid entry of `items`; one result per item, in order"""
+        results: List[Dict[str, Any]] = [
+            {"index": i, "condition_type": item.condition_type, "client_id": item.client_id, "status": "invalid"}
+            for i, item in enumerate(items)
+        ]
+
+        # 1. Validate and build, dropping repeats of a patient-day within the batch
+        pending: Dict[str, List[Tuple[int, str, Dict[str, Any]]]] = defaultdict(list)
+        first_seen: Dict[str, int] = {}
+        repositories = {}
+        for i, item in enumerate(items):
+            spec = get_tracker(item.condition_type)
+            repository_class = REPOSITORIES.get(item.condition_type)
+            if spec is None or repository_class is None:
+                results[i]["error"] = f"Unsupported condition_type {item.condition_type!r}"
+                continue
+            if item.condition_type not in repositories:
+                repositories[item.condition_type] = repository_class(self.db)
+            try:
+                values, key = _row(spec, repositories[item.condition_type], item.entry)
+            except _Invalid as e:
+                results[i]["error"] = str(e)
+                continue
+
+            if key in first_seen:
+                results[i].update(status="duplicate", error=f"Same patient and day as item {first_seen[key]}")
+                continue
+            first_seen[key] = i
+            pending[item.condition_type].append((i, key, values))
+
+        # 2. Skip what is already stored, 3. insert the rest: one statement per condition
+        try:
+            for condition_type, batch in pending.items():
+                spec = get_tracker(condition_type)
+                stored = _stored_keys(self.db, spec, [values for _, _, values in batch])
+                new = []
+                for i, key, values in batch:
+                    if key in stored:
+                        results[i].update(status="exists", id=stored[key])
+                    else:
+                        new.append((i, values))
+                if not new:
+                    continue
+
+                saved = self.db.scalars(
+                    insert(spec.model).returning(spec.model, sort_by_parameter_order=True),
+                    [values for _, values in new],
+                ).all()
+                # Bulk INSERT skips mapper and flush events
+                bulk_insert_write(self.db, spec.model, saved)
+                for (i, _), entry in zip(new, saved):
+                    results[i].update(status="created", id=entry.id)
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"❌ BULK SERVICES: Batch of {len(items)} entries failed: {e}")
+            raise Exception(f"Error storing bulk entries: {e}")
+
+        summary = {status: 0 for status in ("created", "exists", "duplicate", "invalid")}
+        for result in results:
+            summary[result["status"]] += 1
+        logger.info(
+            f"📦 BULK SERVICES: {len(items)} entries, {summary['created']} created, "
+            f"{summary['exists']} already stored, {summary['duplicate'] + summary['invalid']} rejected"
+        )
+        return {**summary, "results": results}
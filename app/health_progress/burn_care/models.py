@@ -1,11 +1,15 @@
-from sqlalchemy import Column, Integer, String, DateTime, JSON, Date
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Date, Index
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
+from app.health_progress.pagination import keyset_indexes
 
 Base = declarative_base()
 
 class BurnCareEntry(Base):
     __tablename__ = "burn_care_entries"
+    __table_args__ = keyset_indexes("burn_care_entries", "created_at") + (
+        Index("uq_burn_care_entries_patient_day", "patient_id", "submission_date", unique=True),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     patient_id = Column(String)
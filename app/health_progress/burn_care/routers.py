@@ -5,9 +5,11 @@ import json
 import logging
 
 from app.database import get_db
+from app.health_progress.pagination import PageParams, page_params
 from app.health_progress.burn_care.models import BurnCareEntry
 from app.health_progress.burn_care.schemas import BurnCareCreate, BurnCareResponse, BurnCareCheckResponse
 from app.health_progress.burn_care.services import BurnCareService
+from app.health_progress.versions.conditional import entries_etag, patient_etag
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -64,7 +66,7 @@ async def debug_burn_care_entry(request: Request, db: Session = Depends(get_db))
         return {"error": f"Debug endpoint failed: {str(e)}"}
 
 @router.post("/burn-care/entries", response_model=BurnCareResponse)
-async def create_burn_care_entry(
+def create_burn_care_entry(
     entry: BurnCareCreate,
     db: Session = Depends(get_db)
 ):
@@ -140,8 +142,8 @@ async def create_burn_care_entry(
             detail=f"Failed to create burn care entry: {str(e)}"
         )
 
-@router.get("/burn-care/entries/{patient_id}/{date}", response_model=BurnCareCheckResponse)
-async def check_existing_entry(
+@router.get("/burn-care/entries/{patient_id}/{date}", response_model=BurnCareCheckResponse, dependencies=[Depends(patient_etag("burn_care"))])
+def check_existing_entry(
     patient_id: str,
     date: date,
     db: Session = Depends(get_db)
@@ -174,17 +176,16 @@ async def check_existing_entry(
             detail=f"Error checking for existing entry: {str(e)}"
         )
 
-@router.get("/burn-care/entries")
-async def get_all_burn_care_entries(
-    skip: int = 0,
-    limit: int = 100,
+@router.get("/burn-care/entries", dependencies=[Depends(entries_etag("burn_care"))])
+def get_all_burn_care_entries(
+    page: PageParams = Depends(page_params),
     db: Session = Depends(get_db)
 ):
     """
-    Get ALL burn care entries for dashboard with pagination
+    Get burn care entries for dashboard, newest first, with cursor pagination
     """
     try:
-        entries = BurnCareService.get_all_burn_care_entries(db, skip=skip, limit=limit)
+        entries, next_cursor = BurnCareService.get_all_burn_care_entries(db, page)
         
         formatted_entries = []
         for entry in entries:
@@ -201,14 +202,11 @@ async def get_all_burn_care_entries(
                 "updated_at": entry.updated_at.isoformat() if entry.updated_at else None
             })
         
-        total_count = db.query(BurnCareEntry).count()
-        
         return {
             "entries": formatted_entries,
-            "total": total_count,
-            "skip": skip,
-            "limit": limit,
+            "limit": page.limit,
             "returned": len(entries),
+            "next_cursor": next_cursor,
             "condition_type": "burn_care"
         }
         
@@ -219,8 +217,8 @@ async def get_all_burn_care_entries(
             detail=f"Error retrieving burn care entries: {str(e)}"
         )
 
-@router.get("/burn-care/entries/patient/{patient_id}")
-async def get_patient_burn_care_entries(
+@router.get("/burn-care/entries/patient/{patient_id}", dependencies=[Depends(patient_etag("burn_care"))])
+def get_patient_burn_care_entries(
     patient_id: str,
     skip: int = 0,
     limit: int = 50,
@@ -277,8 +275,8 @@ async def get_patient_burn_care_entries(
             detail=f"Error retrieving patient entries: {str(e)}"
         )
 
-@router.get("/burn-care/entries/{entry_id}", response_model=BurnCareResponse)
-async def get_burn_care_entry(
+@router.get("/burn-care/entries/{entry_id}", response_model=BurnCareResponse, dependencies=[Depends(entries_etag("burn_care"))])
+def get_burn_care_entry(
     entry_id: int,
     db: Session = Depends(get_db)
 ):
@@ -1,8 +1,16 @@
 from sqlalchemy.orm import Session
 from datetime import date
+from app.health_progress.pagination import PageParams
+from app.health_progress.repository import TrackerRepository
 from .models import BurnCareEntry
 from .schemas import BurnCareCreate
 
+class BurnCareRepository(TrackerRepository):
+    model = BurnCareEntry
+    timestamp_field = "created_at"
+    label = "BURN_CARE"
+
+
 class BurnCareService:
     
     @staticmethod
@@ -78,11 +86,9 @@ class BurnCareService:
     
     @staticmethod
     def check_existing_entry(db: Session, patient_id: str, date: date):
-        return db.query(BurnCareEntry).filter(
-            BurnCareEntry.patient_id == patient_id,
-            BurnCareEntry.submission_date == date
-        ).first()
+        return BurnCareRepository(db).get_entry(patient_id, date)
     
     @staticmethod
-    def get_all_burn_care_entries(db: Session):
-        return db.query(BurnCareEntry).all()
\ No newline at end of file
+    def get_all_burn_care_entries(db: Session, page: PageParams):
+        """One newest-first page of entries and the cursor of the next page"""
+        return BurnCareRepository(db).get_all_entries(page)
\ No newline at end of file
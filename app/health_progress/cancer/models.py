@@ -1,11 +1,15 @@
-from sqlalchemy import Column, Integer, String, DateTime, JSON, Text
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Text, Index
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
+from app.health_progress.pagination import keyset_indexes
 
 Base = declarative_base()
 
 class CancerEntry(Base):
     __tablename__ = "cancer_entries"
+    __table_args__ = keyset_indexes("cancer_entries", "submitted_at") + (
+        Index("ix_cancer_entries_patient_day", "patient_id", "submission_date"),
+    )
     
     # Basic info
     id = Column(Integer, primary_key=True, index=True)
@@ -1,21 +1,20 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.database import get_db
-from .models import CancerEntry
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
+from app.health_progress.pagination import PageParams, page_params
+from app.cache.services import cached_route
+from app.health_progress.versions.conditional import entries_etag, patient_etag
 from . import services, schemas
 
 router = APIRouter()
 
-def get_db_session(db: Session = Depends(get_db)):
-    return db
-
-def get_cancer_service(db: Session = Depends(get_db)):
-    return services.CancerProgressService(db)
+def get_cancer_service(db: AsyncSession = Depends(get_async_db)):
+    return services.AsyncCancerProgressService(db)
 
 @router.post("/entries", response_model=schemas.CancerEntryResponse)
 async def create_cancer_entry(
     data: dict,  # ✅ Accept raw dict like kidney
-    service: services.CancerProgressService = Depends(get_cancer_service)
+    service: services.AsyncCancerProgressService = Depends(get_cancer_service)
 ):
     """Create a new cancer entry with flattened structure"""
     try:
@@ -23,7 +22,7 @@ async def create_cancer_entry(
         print("🔍 RECEIVED RAW DATA:", data)
         
         # ✅ Use service to handle the data mapping and creation
-        db_entry = service.create_entry(data)
+        db_entry = await service.create_entry(data)
         
         # ✅ Return the response with proper FLATTENED structure
         return schemas.CancerEntryResponse(
@@ -57,11 +56,15 @@ async def create_cancer_entry(
         print(f"❌ CANCER ROUTER: Error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to create entry: {str(e)}")
 
-@router.get("/entries")
-async def get_all_cancer_entries(db: Session = Depends(get_db_session)):
+@router.get("/entries", dependencies=[Depends(entries_etag("cancer"))])
+@cached_route("cancer.entries", tags=["cancer_entries"])
+async def get_all_cancer_entries(
+    page: PageParams = Depends(page_params),
+    service: services.AsyncCancerProgressService = Depends(get_cancer_service)
+):
     """Get all cancer entries"""
     try:
-        entries = db.query(CancerEntry).all()
+        entries, next_cursor = await service.get_all_entries(page)
         
         return {
             "entries": [
@@ -93,20 +96,18 @@ async def get_all_cancer_entries(db: Session = Depends(get_db_session)):
                 }
                 for entry in entries
             ],
-            "total": len(entries)
+            "total": len(entries),
+            "next_cursor": next_cursor
         }
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get entries: {str(e)}")
 
-@router.get("/entries/{patient_id}/{date}")
-async def get_cancer_entry(patient_id: int, date: str, db: Session = Depends(get_db_session)):
+@router.get("/entries/{patient_id}/{date}", dependencies=[Depends(patient_etag("cancer"))])
+async def get_cancer_entry(patient_id: int, date: str, service: services.AsyncCancerProgressService = Depends(get_cancer_service)):
     """Get specific cancer entry for patient and date"""
     try:
-        entry = db.query(CancerEntry).filter(
-            CancerEntry.patient_id == patient_id,
-            CancerEntry.submission_date == date
-        ).first()
+        entry = await service.get_entry(patient_id, date)
         
         if not entry:
             return {
@@ -149,27 +150,22 @@ async def get_cancer_entry(patient_id: int, date: str, db: Session = Depends(get
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get entry: {str(e)}")
 
-@router.get("/check/{patient_id}/{date}")
-async def check_cancer_entry(patient_id: int, date: str, db: Session = Depends(get_db_session)):
+@router.get("/check/{patient_id}/{date}", dependencies=[Depends(patient_etag("cancer"))])
+async def check_cancer_entry(patient_id: int, date: str, service: services.AsyncCancerProgressService = Depends(get_cancer_service)):
     """Check if cancer entry exists"""
     try:
-        exists = db.query(CancerEntry).filter(
-            CancerEntry.patient_id == patient_id,
-            CancerEntry.submission_date == date
-        ).first() is not None
+        exists = await service.get_entry(patient_id, date) is not None
         
         return {"exists": exists, "patient_id": patient_id, "date": date}
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to check entry: {str(e)}")
 
-@router.get("/patient/{patient_id}")
-async def get_patient_cancer_entries(patient_id: int, db: Session = Depends(get_db_session)):
+@router.get("/patient/{patient_id}", dependencies=[Depends(patient_etag("cancer"))])
+async def get_patient_cancer_entries(patient_id: int, service: services.AsyncCancerProgressService = Depends(get_cancer_service)):
     """Get all cancer entries for a patient"""
     try:
-        entries = db.query(CancerEntry).filter(
-            CancerEntry.patient_id == patient_id
-        ).all()
+        entries = await service.get_patient_entries(patient_id)
         
         return {
             "entries": [
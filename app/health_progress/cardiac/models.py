@@ -1,11 +1,15 @@
-from sqlalchemy import Column, Integer, String, DateTime, JSON, Date
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Date, Index
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
+from app.health_progress.pagination import keyset_indexes
 
 Base = declarative_base()
 
 class CardiacSurgeryEntry(Base):
     __tablename__ = "cardiac_surgery_entries"
+    __table_args__ = keyset_indexes("cardiac_surgery_entries", "created_at") + (
+        Index("ix_cardiac_surgery_entries_patient_day", "patient_id", "submission_date"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     patient_id = Column(Integer)
@@ -1,19 +1,25 @@
 # app/health_progress/cardiac/routers.py
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
+from app.health_progress.pagination import PageParams, page_params
+from app.health_progress.versions.conditional import entries_etag, patient_etag
 from . import services, schemas
 
 # ✅ Define router FIRST
 router = APIRouter(prefix="/cardiac", tags=["Cardiac Progress"])
 
-def get_cardiac_service(db: Session = Depends(get_db)):
-    return services.CardiacProgressService(db)
+def get_cardiac_service(db: AsyncSession = Depends(get_async_db)):
+    return services.AsyncCardiacProgressService(db)
+
+# Columns the listings render; the rest of the row is not loaded
+LIST_COLUMNS = ["id", "patient_id", "patient_name", "submission_date",
+                "common_data", "condition_data", "created_at"]
 
 @router.post("/entries", response_model=schemas.CardiacEntryResponse)
 async def create_cardiac_entry(
     entry_data: schemas.CardiacEntryCreate,
-    cardiac_service: services.CardiacProgressService = Depends(get_cardiac_service)
+    cardiac_service: services.AsyncCardiacProgressService = Depends(get_cardiac_service)
 ):
     """
     Create a new cardiac surgery progress entry
@@ -66,7 +72,7 @@ async def create_cardiac_entry(
             }
         }
         
-        db_entry = cardiac_service.create_entry(db_data)
+        db_entry = await cardiac_service.create_entry(db_data)
         
         return schemas.CardiacEntryResponse(
             id=db_entry.id,
@@ -82,15 +88,16 @@ async def create_cardiac_entry(
         print("❌ CARDIAC POST Error details:", str(e))
         raise HTTPException(status_code=500, detail=f"Failed to create cardiac progress entry: {str(e)}")
 
-@router.get("/entries")
+@router.get("/entries", dependencies=[Depends(entries_etag("cardiac"))])
 async def get_all_cardiac_entries(
-    cardiac_service: services.CardiacProgressService = Depends(get_cardiac_service)
+    page: PageParams = Depends(page_params),
+    cardiac_service: services.AsyncCardiacProgressService = Depends(get_cardiac_service)
 ):
     """
     Get ALL cardiac surgery entries
     """
     try:
-        entries = cardiac_service.get_all_entries()
+        entries, next_cursor = await cardiac_service.get_all_entries(page, columns=LIST_COLUMNS)
         
         formatted_entries = []
         for entry in entries:
@@ -108,38 +115,39 @@ async def get_all_cardiac_entries(
         return {
             "entries": formatted_entries,
             "total": len(entries),
+            "next_cursor": next_cursor,
             "surgery_type": "cardiac"
         }
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving cardiac entries: {str(e)}")
 
-@router.get("/entries/{patient_id}/{date}")
+@router.get("/entries/{patient_id}/{date}", dependencies=[Depends(patient_etag("cardiac"))])
 async def check_cardiac_entry(
     patient_id: int,
     date: str,
-    cardiac_service: services.CardiacProgressService = Depends(get_cardiac_service)
+    cardiac_service: services.AsyncCardiacProgressService = Depends(get_cardiac_service)
 ):
     """
     Check if cardiac entry exists for specific patient and date
     """
     try:
-        exists = cardiac_service.check_existing_entry(patient_id, date)
+        exists = await cardiac_service.check_existing_entry(patient_id, date)
         return {"exists": exists, "patient_id": patient_id, "date": date}
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error checking cardiac entry: {str(e)}")
 
-@router.get("/entries/patient/{patient_id}")
+@router.get("/entries/patient/{patient_id}", dependencies=[Depends(patient_etag("cardiac"))])
 async def get_patient_cardiac_entries(
     patient_id: int,
-    cardiac_service: services.CardiacProgressService = Depends(get_cardiac_service)
+    cardiac_service: services.AsyncCardiacProgressService = Depends(get_cardiac_service)
 ):
     """
     Get all cardiac entries for a specific patient
     """
     try:
-        entries = cardiac_service.get_patient_entries(patient_id)
+        entries = await cardiac_service.get_patient_entries(patient_id, columns=LIST_COLUMNS)
         
         formatted_entries = []
         for entry in entries:
@@ -1,24 +1,30 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
+from app.health_progress.pagination import PageParams, page_params
+from app.health_progress.versions.conditional import entries_etag
 from . import services, schemas  # ✅ Import schemas
 
 router = APIRouter(prefix="/cesarean", tags=["Cesarean Progress"])
 
-def get_cesarean_service(db: Session = Depends(get_db)):
-    return services.CesareanProgressService(db)
+def get_cesarean_service(db: AsyncSession = Depends(get_async_db)):
+    return services.AsyncCesareanProgressService(db)
+
+# Columns the listings render; the rest of the row is not loaded
+LIST_COLUMNS = ["id", "patient_id", "patient_name", "submission_date",
+                "common_data", "condition_data", "created_at"]
 
 @router.post("/entries", response_model=schemas.CesareanEntryResponse)
 async def create_cesarean_entry(
     entry_data: schemas.CesareanEntryCreate,  # ✅ Use schema instead of dict
-    cesarean_service: services.CesareanProgressService = Depends(get_cesarean_service)
+    cesarean_service: services.AsyncCesareanProgressService = Depends(get_cesarean_service)
 ):
     """
     Create a new cesarean section progress entry
     """
     try:
         print("📥 Received POST data:", entry_data.dict())
-        db_entry = cesarean_service.create_entry(entry_data.dict())
+        db_entry = await cesarean_service.create_entry(entry_data.dict())
         
         # ✅ Return using schema
         return schemas.CesareanEntryResponse(
@@ -35,15 +41,16 @@ async def create_cesarean_entry(
         print("❌ POST Error details:", str(e))
         raise HTTPException(status_code=500, detail=f"Failed to create cesarean progress entry: {str(e)}")
 
-@router.get("/entries")
+@router.get("/entries", dependencies=[Depends(entries_etag("cesarean"))])
 async def get_all_cesarean_entries(
-    cesarean_service: services.CesareanProgressService = Depends(get_cesarean_service)
+    page: PageParams = Depends(page_params),
+    cesarean_service: services.AsyncCesareanProgressService = Depends(get_cesarean_service)
 ):
     """
     Get ALL cesarean section entries
     """
     try:
-        entries = cesarean_service.get_all_entries()
+        entries, next_cursor = await cesarean_service.get_all_entries(page, columns=LIST_COLUMNS)
         
         formatted_entries = []
         for entry in entries:
@@ -61,6 +68,7 @@ async def get_all_cesarean_entries(
         return {
             "entries": formatted_entries,
             "total": len(entries),
+            "next_cursor": next_cursor,
             "surgery_type": "cesarean"
         }
         
@@ -1,44 +1,27 @@
 # app/health_progress/diabetes/routers.py
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.database import get_db
-from app.health_progress.diabetes.models import DiabetesEntry
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
+from app.health_progress.pagination import PageParams, page_params
+from app.health_progress.diabetes.services import AsyncDiabetesProgressService
+from app.cache.services import cached_route
+from app.health_progress.versions.conditional import entries_etag, patient_etag
 
 # Create clean router
 router = APIRouter()
 
 # Simple dependency
-def get_db_session(db: Session = Depends(get_db)):
-    return db
+def get_diabetes_service(db: AsyncSession = Depends(get_async_db)):
+    return AsyncDiabetesProgressService(db)
 
 # POST /api/health-progress/diabetes/entries
 @router.post("/entries")
-async def create_diabetes_entry(data: dict, db: Session = Depends(get_db_session)):
+async def create_diabetes_entry(data: dict, service: AsyncDiabetesProgressService = Depends(get_diabetes_service)):
     """Create a new diabetes entry"""
     try:
         print("📥 Creating diabetes entry:", data)
         
-        # Create entry with flat data structure from frontend
-        db_entry = DiabetesEntry(
-            patient_id=data.get('patient_id'),
-            patient_name=data.get('patient_name'),
-            submission_date=data.get('submission_date'),
-            blood_glucose=data.get('blood_glucose'),
-            blood_pressure_systolic=data.get('blood_pressure_systolic'),
-            blood_pressure_diastolic=data.get('blood_pressure_diastolic'),
-            energy_level=data.get('energy_level'),
-            sleep_hours=data.get('sleep_hours'),
-            sleep_quality=data.get('sleep_quality'),
-            medications=data.get('medications'),
-            symptoms=data.get('symptoms'),
-            notes=data.get('notes'),
-            status=data.get('status'),
-            condition_type=data.get('condition_type')
-        )
-        
-        db.add(db_entry)
-        db.commit()
-        db.refresh(db_entry)
+        db_entry = await service.create_entry(data)
         
         return {
             "message": "Diabetes entry created successfully",
@@ -47,15 +30,18 @@ async def create_diabetes_entry(data: dict, db: Session = Depends(get_db_session
         }
         
     except Exception as e:
-        db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to create entry: {str(e)}")
 
 # GET /api/health-progress/diabetes/entries
-@router.get("/entries")
-async def get_all_diabetes_entries(db: Session = Depends(get_db_session)):
+@router.get("/entries", dependencies=[Depends(entries_etag("diabetes"))])
+@cached_route("diabetes.entries", tags=["diabetes_entries"])
+async def get_all_diabetes_entries(
+    page: PageParams = Depends(page_params),
+    service: AsyncDiabetesProgressService = Depends(get_diabetes_service)
+):
     """Get all diabetes entries"""
     try:
-        entries = db.query(DiabetesEntry).all()
+        entries, next_cursor = await service.get_all_entries(page)
         
         return {
             "entries": [
@@ -79,21 +65,19 @@ async def get_all_diabetes_entries(db: Session = Depends(get_db_session)):
                 }
                 for entry in entries
             ],
-            "total": len(entries)
+            "total": len(entries),
+            "next_cursor": next_cursor
         }
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get entries: {str(e)}")
 
 # GET /api/health-progress/diabetes/entries/{patient_id}/{date}
-@router.get("/entries/{patient_id}/{date}")
-async def get_diabetes_entry(patient_id: int, date: str, db: Session = Depends(get_db_session)):
+@router.get("/entries/{patient_id}/{date}", dependencies=[Depends(patient_etag("diabetes"))])
+async def get_diabetes_entry(patient_id: int, date: str, service: AsyncDiabetesProgressService = Depends(get_diabetes_service)):
     """Get specific diabetes entry for patient and date"""
     try:
-        entry = db.query(DiabetesEntry).filter(
-            DiabetesEntry.patient_id == patient_id,
-            DiabetesEntry.submission_date == date
-        ).first()
+        entry = await service.get_entry(patient_id, date)
         
         if not entry:
             return {
@@ -129,14 +113,11 @@ async def get_diabetes_entry(patient_id: int, date: str, db: Session = Depends(g
         raise HTTPException(status_code=500, detail=f"Failed to get entry: {str(e)}")
 
 # GET /api/health-progress/diabetes/check/{patient_id}/{date}
-@router.get("/check/{patient_id}/{date}")
-async def check_diabetes_entry(patient_id: int, date: str, db: Session = Depends(get_db_session)):
+@router.get("/check/{patient_id}/{date}", dependencies=[Depends(patient_etag("diabetes"))])
+async def check_diabetes_entry(patient_id: int, date: str, service: AsyncDiabetesProgressService = Depends(get_diabetes_service)):
     """Check if diabetes entry exists"""
     try:
-        exists = db.query(DiabetesEntry).filter(
-            DiabetesEntry.patient_id == patient_id,
-            DiabetesEntry.submission_date == date
-        ).first() is not None
+        exists = await service.get_entry(patient_id, date) is not None
         
         return {"exists": exists, "patient_id": patient_id, "date": date}
         
@@ -144,13 +125,11 @@ async def check_diabetes_entry(patient_id: int, date: str, db: Session = Depends
         raise HTTPException(status_code=500, detail=f"Failed to check entry: {str(e)}")
 
 # GET /api/health-progress/diabetes/patient/{patient_id}
-@router.get("/patient/{patient_id}")
-async def get_patient_diabetes_entries(patient_id: int, db: Session = Depends(get_db_session)):
+@router.get("/patient/{patient_id}", dependencies=[Depends(patient_etag("diabetes"))])
+async def get_patient_diabetes_entries(patient_id: int, service: AsyncDiabetesProgressService = Depends(get_diabetes_service)):
     """Get all diabetes entries for a patient"""
     try:
-        entries = db.query(DiabetesEntry).filter(
-            DiabetesEntry.patient_id == patient_id
-        ).all()
+        entries = await service.get_patient_entries(patient_id)
         
         return {
             "entries": [
@@ -0,0 +1,174 @@
+# app/health_progress/events/broker.py
+"""
+Pub/sub for tracker events.
+
+InProcessBroker fans events out to the subscribers of one server process.
+With several workers set EVENT_BROKER_URL to a Redis-compatible server
+(Redis, Valkey, KeyDB, ...): RedisStreamBroker appends every event to a
+capped stream that all workers read, so a dashboard sees writes handled by
+any worker.
+
+Both brokers give each event an id and keep a short history, so an SSE
+client that reconnects with Last-Event-ID gets what it missed. When the
+history no longer reaches back that far (or a subscriber falls too far
+behind) the subscriber gets a single `reset` event and reloads.
+"""
+import asyncio
+import itertools
+import json
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Dict, Optional
+
+from app.config import EVENT_BROKER_URL, EVENT_HISTORY_SIZE
+
+logger = logging.getLogger(__name__)
+
+RESET = {"type": "reset"}
+
+
+class InProcessBroker:
+    """Events published by any thread of this process reach its async subscribers"""
+
+    def __init__(self, history: int = EVENT_HISTORY_SIZE, queue_size: int = 1000):
+        self.queue_size = queue_size
+        # Ids are "<epoch>-<n>": ids from before a restart are recognized as stale
+        self._epoch = format(int(time.time()), "x")
+        self._history = deque(maxlen=history)  # (n, event)
+        self._sequence = itertools.count(1)
+        self._subscribers = set()
+        self._lock = threading.Lock()
+
+    def publish(self, event: Dict[str, Any]):
+        with self._lock:
+            number = next(self._sequence)
+            event = {**event, "id": f"{self._epoch}-{number}"}
+            self._history.append((number, event))
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            try:
+                # Publishers run in request threads; queues belong to the event loop
+                loop.call_soon_threadsafe(self._offer, queue, event)
+            except RuntimeError:
+                pass  # loop already closed, the subscriber is going away
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, event):
+        if queue.full():
+            # Too slow to keep up: drop the backlog and tell the client to reload
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(RESET)
+            return
+        queue.put_nowait(event)
+
+    def _missed(self, last_event_id: Optional[str]):
+        if not last_event_id:
+            return []
+        epoch, _, number = last_event_id.partition("-")
+        if epoch != self._epoch or not number.isdigit():
+            return [RESET]
+        last = int(number)
+        if self._history and self._history[0][0] > last + 1:
+            return [RESET]
+        return [event for n, event in self._history if n > last]
+
+    async def subscribe(self, last_event_id: Optional[str] = None,
+                        heartbeat: float = 15.0) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """Events after `last_event_id`, then live ones; None after `heartbeat` seconds of silence"""
+        subscriber = (asyncio.get_running_loop(), asyncio.Queue(self.queue_size))
+        with self._lock:
+            self._subscribers.add(subscriber)
+            missed = self._missed(last_event_id)
+        try:
+            for event in missed:
+                yield event
+            queue = subscriber[1]
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), heartbeat)
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            with self._lock:
+                self._subscribers.discard(subscriber)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    async def close(self):
+        pass
+
+
+class RedisStreamBroker:
+    """Shared broker for multi-worker deployments (needs the `redis` package)"""
+
+    def __init__(self, url: str, stream: str = "tracker-events", history: int = EVENT_HISTORY_SIZE):
+        import redis
+        import redis.asyncio
+
+        self.stream = stream
+        self.history = history
+        self._client = redis.Redis.from_url(url)  # publishers are sync request threads
+        self._async_client = redis.asyncio.Redis.from_url(url)
+
+    def publish(self, event: Dict[str, Any]):
+        try:
+            self._client.xadd(self.stream, {"data": json.dumps(event, default=str)},
+                              maxlen=self.history, approximate=True)
+        except Exception as e:
+            # Live updates are best effort; the write itself already committed
+            logger.error(f"❌ EVENTS: Publish to {self.stream} failed: {e}")
+
+    async def subscribe(self, last_event_id: Optional[str] = None,
+                        heartbeat: float = 15.0) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        position = last_event_id or "$"
+        if last_event_id:
+            oldest = await self._async_client.xrange(self.stream, count=1)
+            if oldest and _stream_id(oldest[0][0]) > _stream_id(last_event_id):
+                yield RESET
+        while True:
+            response = await self._async_client.xread({self.stream: position}, block=int(heartbeat * 1000), count=100)
+            if not response:
+                yield None
+                continue
+            for event_id, fields in response[0][1]:
+                position = event_id
+                event = json.loads(fields[b"data"])
+                event["id"] = event_id.decode() if isinstance(event_id, bytes) else event_id
+                yield event
+
+    async def close(self):
+        await self._async_client.aclose()
+        self._client.close()
+
+
+def _stream_id(value) -> tuple:
+    if isinstance(value, bytes):
+        value = value.decode()
+    try:
+        millis, _, sequence = value.partition("-")
+        return int(millis), int(sequence or 0)
+    except ValueError:
+        return 0, 0
+
+
+_broker = None
+
+
+def get_broker():
+    """Process-wide broker chosen by EVENT_BROKER_URL"""
+    global _broker
+    if _broker is None:
+        _broker = RedisStreamBroker(EVENT_BROKER_URL) if EVENT_BROKER_URL else InProcessBroker()
+    return _broker
+
+
+async def close_broker():
+    global _broker
+    if _broker is not None:
+        await _broker.close()
+        _broker = None
@@ -0,0 +1,65 @@
+# app/health_progress/events/routers.py
+import json
+from contextlib import aclosing
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Header, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.authentication.dependencies import require_staff
+from app.database import get_db
+from app.models import User
+from .broker import get_broker
+
+router = APIRouter()
+
+# Comment lines keep proxies from closing an idle stream
+HEARTBEAT_SECONDS = 15.0
+
+
+def format_event(event) -> str:
+    lines = []
+    if event.get("id"):
+        lines.append(f"id: {event['id']}")
+    lines.append(f"event: {event['type']}")
+    lines.append(f"data: {json.dumps(event, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+# GET /api/health-progress/events
+@router.get("")
+async def stream_tracker_events(
+    request: Request,
+    condition: Optional[List[str]] = Query(None, description="Condition type(s) to include, e.g. kidney"),
+    last_event_id: Optional[str] = Header(None, description="Sent by the client when it reconnects"),
+    current_user: User = Depends(require_staff),
+    db: Session = Depends(get_db),
+):
+    """
+    Server-sent events for every committed tracker write: `created`, `updated`,
+    `saved` (daily upsert) and `deleted`, plus `reset` when the client missed
+    more than the server kept and should reload.
+    """
+    conditions = set(condition or [])
+    # The session only served the auth lookup: hand its connection back to the
+    # pool now rather than holding it for as long as the stream stays open
+    db.close()
+
+    async def events():
+        # Tell EventSource to retry after 3 s if the connection drops
+        yield "retry: 3000\n\n"
+        async with aclosing(get_broker().subscribe(last_event_id, heartbeat=HEARTBEAT_SECONDS)) as subscription:
+            async for event in subscription:
+                if await request.is_disconnected():
+                    break
+                if event is None:
+                    yield ": keep-alive\n\n"
+                elif event["type"] == "reset" or not conditions or event.get("condition_type") in conditions:
+                    yield format_event(event)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,104 @@
+# app/health_progress/events/services.py
+"""
+Tracker write events for live dashboards.
+
+Session hooks collect the tracker rows each flush inserted, updated or
+deleted and publish one compact event per row once the transaction commits
+(nothing is published for rolled-back work). The hooks are on the Session
+class, so sync sessions, async sessions and every service style are
+covered. Core statements that bypass the ORM call `note_write` instead
+(through app.health_progress.hooks).
+
+Events carry keys, not rows:
+
+    {"type": "created", "condition_type": "kidney", "entry_id": 42,
+     "patient_id": "7", "patient_name": "...", "urgency": "high",
+     "submission_date": "2025-05-01", "id": "..."}
+
+and the dashboard fetches the full entry from the feed when it needs it.
+"""
+import logging
+from datetime import date
+from typing import Any, Dict, Mapping
+
+from sqlalchemy import event, inspect as sa_inspect
+from sqlalchemy.orm import Session
+
+from app.health_progress.events.broker import get_broker
+from app.health_progress.registry import TRACKERS_BY_MODEL, TrackerSpec
+from app.health_progress.triage.services import triage_urgency
+
+logger = logging.getLogger(__name__)
+
+PENDING_KEY = "tracker_events"
+
+
+def tracker_event(kind: str, spec: TrackerSpec, entry_id: int, data: Mapping[str, Any]) -> Dict[str, Any]:
+    submission_date = data.get("submission_date")
+    if isinstance(submission_date, date):
+        submission_date = submission_date.isoformat()
+    return {
+        "type": kind,
+        "condition_type": spec.condition_type,
+        "entry_id": entry_id,
+        "patient_id": str(data["patient_id"]) if data.get("patient_id") is not None else None,
+        "patient_name": data.get("patient_name"),
+        "urgency": triage_urgency(spec, data) if kind != "deleted" else None,
+        "submission_date": submission_date,
+    }
+
+
+def note_write(db: Session, model, entry, kind: str = "saved"):
+    """Queue an event for a row written with a Core statement; published on commit"""
+    spec = TRACKERS_BY_MODEL.get(model)
+    if spec is None or not hooks_installed():
+        return
+    data = {attr.key: getattr(entry, attr.key) for attr in sa_inspect(model).column_attrs}
+    db.info.setdefault(PENDING_KEY, []).append(tracker_event(kind, spec, entry.id, data))
+
+
+def _after_flush(session, flush_context):
+    pending = session.info.setdefault(PENDING_KEY, [])
+    for kind, objects in (("created", session.new), ("updated", session.dirty), ("deleted", session.deleted)):
+        for obj in objects:
+            spec = TRACKERS_BY_MODEL.get(type(obj))
+            if spec is None or (kind == "updated" and not session.is_modified(obj)):
+                continue
+            # Only what is already loaded: no SQL from inside a flush
+            pending.append(tracker_event(kind, spec, obj.id, sa_inspect(obj).dict))
+
+
+def _after_commit(session):
+    pending = session.info.pop(PENDING_KEY, None)
+    if not pending:
+        return
+    broker = get_broker()
+    for item in pending:
+        try:
+            broker.publish(item)
+        except Exception as e:
+            logger.error(f"❌ EVENTS: Could not publish {item['type']} {item['condition_type']} event: {e}")
+
+
+def _after_rollback(session):
+    session.info.pop(PENDING_KEY, None)
+
+
+_HOOKS = (("after_flush", _after_flush), ("after_commit", _after_commit), ("after_rollback", _after_rollback))
+
+
+def install_event_hooks():
+    """Publish tracker writes of every session from now on (idempotent)"""
+    for name, hook in _HOOKS:
+        if not event.contains(Session, name, hook):
+            event.listen(Session, name, hook)
+
+
+def remove_event_hooks():
+    for name, hook in _HOOKS:
+        if event.contains(Session, name, hook):
+            event.remove(Session, name, hook)
+
+
+def hooks_installed() -> bool:
+    return event.contains(Session, "after_commit", _after_commit)
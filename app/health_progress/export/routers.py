@@ -0,0 +1,49 @@
+# app/health_progress/export/routers.py
+from datetime import date, datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.authentication.dependencies import require_staff
+from app.database import get_db
+from app.models import User
+from .services import FORMATS, ExportError, ExportService
+
+router = APIRouter()
+
+def get_export_service(db: Session = Depends(get_db)):
+    return ExportService(db)
+
+# GET /api/health-progress/export
+@router.get("")
+def export_tracker_entries(
+    format: str = Query("ndjson", description="ndjson, csv or parquet"),
+    condition: Optional[List[str]] = Query(None, description="Condition type(s) to include (default: every tracker)"),
+    from_date: Optional[date] = Query(None, description="First submission date (YYYY-MM-DD)"),
+    to_date: Optional[date] = Query(None, description="Last submission date (YYYY-MM-DD)"),
+    patient_id: Optional[str] = Query(None),
+    current_user: User = Depends(require_staff),
+    export_service: ExportService = Depends(get_export_service)
+):
+    """
+    Download tracker entries as a file, streamed while it is read from the
+    database, e.g. ?format=csv&condition=kidney&from_date=2025-01-01.
+    JSON columns are flattened into `common_data.<field>` style columns.
+    Staff only (admin or doctor): the file holds every patient's entries.
+    """
+    try:
+        chunks = export_service.export(
+            format, conditions=condition, from_date=from_date, to_date=to_date, patient_id=patient_id
+        )
+    except ExportError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    media_type, extension = FORMATS[format]
+    filename = f"tracker-export-{datetime.utcnow():%Y%m%d-%H%M%S}.{extension}"
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,270 @@
+# app/health_progress/export/services.py
+"""
+Streaming extracts of tracker data for research and audits.
+
+Rows are read with server-side cursors (`yield_per`) and written out chunk by
+chunk, so memory stays flat however large the export is. JSON columns
+(common_data, condition_data, medications, ...) are flattened into dotted
+columns, e.g. `common_data.temperature`; lists stay JSON text.
+
+    NDJSON   one object per line, only the keys each row has
+    CSV      one header for every selected tracker; found with a first pass
+             that reads only the JSON columns
+    Parquet  same columns, one row group per chunk (needs `pyarrow`)
+"""
+import csv
+import io
+import json
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from sqlalchemy import JSON, Boolean, Date, DateTime, Float, Integer, Numeric, select
+from sqlalchemy.orm import Session
+
+from app.config import EXPORT_CHUNK_SIZE
+from app.health_progress.registry import TRACKERS, TrackerSpec
+
+logger = logging.getLogger(__name__)
+
+FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+# Bytes buffered before a chunk is handed to the response
+FLUSH_BYTES = 64 * 1024
+
+
+class ExportError(ValueError):
+    """Request that cannot be exported (unknown condition, bad date, missing pyarrow)"""
+
+
+def flatten(prefix: str, value: Any, out: Dict[str, Any]):
+    """Nested dicts become dotted keys; lists are kept as JSON text"""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            flatten(f"{prefix}.{key}", item, out)
+    elif isinstance(value, list):
+        out[prefix] = json.dumps(value, default=str)
+    else:
+        out[prefix] = value
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ExportError("Parquet export needs the pyarrow package")
+
+
+class ExportService:
+    def __init__(self, db: Session, chunk_size: int = EXPORT_CHUNK_SIZE):
+        self.db = db
+        self.chunk_size = chunk_size
+
+    # ------------------------------------------------------------ selection
+
+    @staticmethod
+    def trackers(conditions: Optional[Sequence[str]] = None) -> List[TrackerSpec]:
+        if not conditions:
+            return list(TRACKERS)
+        known = {spec.condition_type for spec in TRACKERS}
+        unknown = [c for c in conditions if c not in known]
+        if unknown:
+            raise ExportError(f"Unknown condition(s): {', '.join(unknown)}")
+        return [spec for spec in TRACKERS if spec.condition_type in conditions]
+
+    @staticmethod
+    def _filters(spec: TrackerSpec, from_date: Optional[date], to_date: Optional[date],
+                 patient_id: Optional[str]) -> Optional[list]:
+        """WHERE clauses for one tracker; None when nothing in it can match"""
+        model = spec.model
+        is_date = isinstance(model.submission_date.type, Date)
+        filters = []
+        if from_date:
+            filters.append(model.submission_date >= (from_date if is_date else from_date.isoformat()))
+        if to_date:
+            filters.append(model.submission_date <= (to_date if is_date else to_date.isoformat()))
+        if patient_id:
+            if isinstance(model.patient_id.type, Integer):
+                if not patient_id.isdigit():
+                    return None
+                filters.append(model.patient_id == int(patient_id))
+            else:
+                filters.append(model.patient_id == patient_id)
+        return filters
+
+    def _stream(self, columns, filters, order_by):
+        """Rows of a Core select fetched `chunk_size` at a time from a server-side cursor"""
+        query = select(*columns).where(*filters).order_by(order_by)
+        return self.db.execute(query, execution_options={"yield_per": self.chunk_size})
+
+    # ------------------------------------------------------------ rows
+
+    def rows(self, specs: Sequence[TrackerSpec], from_date: Optional[date] = None,
+             to_date: Optional[date] = None, patient_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Flattened rows of every selected tracker, tracker by tracker, in id order"""
+        for spec in specs:
+            filters = self._filters(spec, from_date, to_date, patient_id)
+            if filters is None:
+                continue
+            table = spec.model.__table__
+            json_columns = {c.name for c in table.columns if isinstance(c.type, JSON)}
+            for row in self._stream(table.columns, filters, spec.model.id):
+                out = {"condition_type": spec.condition_type}
+                for name, value in row._mapping.items():
+                    if name in json_columns:
+                        flatten(name, value, out)
+                    else:
+                        out[name] = value
+                yield out
+
+    def columns(self, specs: Sequence[TrackerSpec], from_date: Optional[date] = None,
+                to_date: Optional[date] = None, patient_id: Optional[str] = None) -> List[str]:
+        """
+        Every column the rows will have, in a stable order. Plain columns come
+        from the tables; flattened JSON keys from a pass over the JSON columns
+        of the matching rows (memory grows with distinct keys, not rows).
+        """
+        names: Dict[str, None] = {"condition_type": None}
+        for spec in specs:
+            filters = self._filters(spec, from_date, to_date, patient_id)
+            if filters is None:
+                continue
+            table = spec.model.__table__
+            json_columns = [c for c in table.columns if isinstance(c.type, JSON)]
+            for column in table.columns:
+                if column not in json_columns:
+                    names.setdefault(column.name)
+            if not json_columns:
+                continue
+            for row in self._stream(json_columns, filters, spec.model.id):
+                flat: Dict[str, Any] = {}
+                for column, value in zip(json_columns, row):
+                    flatten(column.name, value, flat)
+                for key in flat:
+                    names.setdefault(key)
+        return list(names)
+
+    @staticmethod
+    def column_types(specs: Sequence[TrackerSpec], columns: Iterable[str]) -> Dict[str, Optional[type]]:
+        """SQL type class per plain column; None (text) for JSON keys and columns whose type differs by tracker"""
+        kinds = (Boolean, Integer, Float, Numeric, DateTime, Date)
+        types: Dict[str, Optional[type]] = {}
+        mixed = set()
+        for spec in specs:
+            for column in spec.model.__table__.columns:
+                kind = next((k for k in kinds if isinstance(column.type, k)), None)
+                if types.setdefault(column.name, kind) is not kind:
+                    mixed.add(column.name)
+        return {name: None if name in mixed else types.get(name) for name in columns}
+
+    # ------------------------------------------------------------ formats
+
+    def ndjson(self, specs, **filters) -> Iterator[bytes]:
+        buffer = []
+        size = 0
+        for row in self.rows(specs, **filters):
+            line = json.dumps(row, default=_plain) + "\n"
+            buffer.append(line)
+            size += len(line)
+            if size >= FLUSH_BYTES:
+                yield "".join(buffer).encode()
+                buffer, size = [], 0
+        if buffer:
+            yield "".join(buffer).encode()
+
+    def csv(self, specs, **filters) -> Iterator[bytes]:
+        columns = self.columns(specs, **filters)
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        for row in self.rows(specs, **filters):
+            # Keys that appeared after the column pass (concurrent writes) are left out
+            writer.writerow({key: _plain(value) for key, value in row.items()})
+            if buffer.tell() >= FLUSH_BYTES:
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+
+    def parquet(self, specs, **filters) -> Iterator[bytes]:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        columns = self.columns(specs, **filters)
+        arrow_types = {
+            Boolean: pa.bool_(), Integer: pa.int64(), Float: pa.float64(), Numeric: pa.float64(),
+            DateTime: pa.timestamp("us"), Date: pa.date32(),
+        }
+        kinds = self.column_types(specs, columns)
+        schema = pa.schema([(name, arrow_types.get(kinds[name], pa.string())) for name in columns])
+        text_columns = [name for name in columns if kinds[name] is None]
+
+        sink = _ChunkSink()
+        writer = pq.ParquetWriter(sink, schema)
+        try:
+            batch: List[Dict[str, Any]] = []
+            for row in self.rows(specs, **filters):
+                for name in text_columns:
+                    value = row.get(name)
+                    if value is not None and not isinstance(value, str):
+                        row[name] = str(_plain(value))
+                batch.append(row)
+                if len(batch) >= self.chunk_size:
+                    writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                    batch = []
+                    yield sink.drain()
+            if batch:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+        finally:
+            writer.close()
+        yield sink.drain()
+
+    def export(self, fmt: str, conditions: Optional[Sequence[str]] = None, **filters) -> Iterator[bytes]:
+        """Chunks of the export in `fmt` (ndjson, csv or parquet)"""
+        if fmt not in FORMATS:
+            raise ExportError(f"Unknown format {fmt!r}; use one of {', '.join(FORMATS)}")
+        if fmt == "parquet":
+            require_pyarrow()
+        specs = self.trackers(conditions)
+        logger.info(f"📤 EXPORT: {fmt} of {', '.join(s.condition_type for s in specs)}")
+        return getattr(self, fmt)(specs, **filters)
+
+
+class _ChunkSink:
+    """Write-only file object for ParquetWriter; bytes written so far are taken with `drain`"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
@@ -0,0 +1,53 @@
+# app/health_progress/feed/routers.py
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from app.authentication.dependencies import require_staff
+from app.database import get_db
+from app.models import User
+from .services import HealthFeedService
+
+router = APIRouter()
+
+def get_feed_service(db: Session = Depends(get_db)):
+    return HealthFeedService(db)
+
+# GET /api/health-progress/feed
+@router.get("")
+def get_health_feed(
+    condition: Optional[List[str]] = Query(None, description="Condition type(s) to include, e.g. diabetes"),
+    date: Optional[str] = Query(None, description="Submission date (YYYY-MM-DD)"),
+    urgency: Optional[str] = Query(None, description="low, medium or high"),
+    patient_id: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=200),
+    after: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    current_user: User = Depends(require_staff),
+    feed_service: HealthFeedService = Depends(get_feed_service)
+):
+    """
+    One newest-first page of entries across every tracker, for the staff dashboard.
+    Conditions without a tracker table (e.g. lifelong) simply contribute no rows.
+    """
+    return feed_service.get_feed(
+        conditions=condition,
+        submission_date=date,
+        urgency=urgency,
+        patient_id=patient_id,
+        limit=limit,
+        after=after
+    )
+
+# GET /api/health-progress/feed/{condition_type}/{entry_id}
+@router.get("/{condition_type}/{entry_id}")
+def get_feed_entry(
+    condition_type: str,
+    entry_id: int,
+    current_user: User = Depends(require_staff),
+    feed_service: HealthFeedService = Depends(get_feed_service)
+):
+    """A single entry shaped like the feed's, for dashboards applying live events"""
+    entry = feed_service.get_entry(condition_type, entry_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Entry not found")
+    return entry
@@ -0,0 +1,163 @@
+# app/health_progress/feed/services.py
+from sqlalchemy import Date, Integer, String, case, literal, null, select, union_all
+from sqlalchemy.orm import Session
+from datetime import datetime
+from collections import namedtuple
+from typing import Any, Dict, List, Optional
+import logging
+
+from app.health_progress.pagination import decode_cursor, dialect_of, encode_cursor, seek_after_merged, sort_key
+from app.health_progress.registry import (
+    TRACKERS, TRACKERS_BY_CONDITION, URGENCY_FROM_STATUS, TrackerSpec, entry_to_dict
+)
+
+logger = logging.getLogger(__name__)
+
+FeedKey = namedtuple("FeedKey", "condition_type entry_id")
+
+
+class HealthFeedService:
+    """
+    Merged, newest-first feed over every tracker table.
+
+    Each tracker contributes one branch of a UNION ALL. Filters and the cursor
+    are pushed into every branch and each branch is capped at `limit + 1` rows,
+    so the database never materializes more than (trackers x page size) keys.
+    Full rows are then loaded only for the page that is returned.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.dialect = dialect_of(db)
+
+    def get_feed(
+        self,
+        conditions: Optional[List[str]] = None,
+        submission_date: Optional[str] = None,
+        urgency: Optional[str] = None,
+        patient_id: Optional[str] = None,
+        limit: int = 50,
+        after: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        specs = [s for s in TRACKERS if not conditions or s.condition_type in conditions]
+        cursor = decode_cursor(after, self.dialect) if after else None
+
+        branches = []
+        for spec in specs:
+            branch = self._branch(spec, submission_date, urgency, patient_id, limit, cursor)
+            if branch is not None:
+                branches.append(branch)
+
+        if not branches:
+            return self._page([], None)
+
+        feed = union_all(*branches).subquery("feed")
+        keys = self.db.execute(
+            select(feed.c.condition_type, feed.c.entry_id, feed.c.sort_ts)
+            .order_by(
+                feed.c.sort_ts.desc().nulls_last(),
+                feed.c.condition_type.desc(),
+                feed.c.entry_id.desc(),
+            )
+            .limit(limit + 1)
+        ).all()
+
+        next_cursor = None
+        if len(keys) > limit:
+            keys = keys[:limit]
+            last = keys[-1]
+            next_cursor = encode_cursor([last.sort_ts, last.condition_type, last.entry_id])
+
+        return self._page(self._load_entries(keys), next_cursor)
+
+    def get_entry(self, condition_type: str, entry_id: int) -> Optional[Dict[str, Any]]:
+        """One entry in feed shape (e.g. after a live `created` event), or None"""
+        if condition_type not in TRACKERS_BY_CONDITION:
+            return None
+        key = FeedKey(condition_type, entry_id)
+        entries = self._load_entries([key])
+        return entries[0] if entries else None
+
+    def _branch(self, spec: TrackerSpec, submission_date, urgency, patient_id, limit, cursor):
+        model = spec.model
+        ts = sort_key(spec.timestamp_column, self.dialect)
+        urgency_expr = self._urgency_expression(spec)
+
+        filters = []
+        if submission_date:
+            if isinstance(model.submission_date.type, Date):
+                try:
+                    filters.append(model.submission_date == datetime.strptime(submission_date, "%Y-%m-%d").date())
+                except ValueError:
+                    return None
+            else:
+                filters.append(model.submission_date == submission_date)
+        if urgency:
+            if urgency_expr is None:
+                return None
+            filters.append(urgency_expr == urgency)
+        if patient_id:
+            if isinstance(model.patient_id.type, Integer):
+                if not patient_id.isdigit():
+                    return None
+                filters.append(model.patient_id == int(patient_id))
+            else:
+                filters.append(model.patient_id == patient_id)
+        if cursor:
+            filters.append(seek_after_merged(spec.condition_type, ts, model.id, cursor))
+
+        inner = (
+            select(
+                literal(spec.condition_type, String).label("condition_type"),
+                model.id.label("entry_id"),
+                ts.label("sort_ts"),
+            )
+            .where(*filters)
+            .order_by(ts.desc().nulls_last(), model.id.desc())
+            .limit(limit + 1)
+            .subquery()
+        )
+        return select(inner.c.condition_type, inner.c.entry_id, inner.c.sort_ts)
+
+    @staticmethod
+    def _urgency_expression(spec: TrackerSpec):
+        if spec.urgency_field:
+            return getattr(spec.model, spec.urgency_field)
+        if spec.status_field:
+            status = getattr(spec.model, spec.status_field)
+            return case(
+                *[(status == value, level) for value, level in URGENCY_FROM_STATUS.items()],
+                else_=null(),
+            )
+        return None
+
+    def _load_entries(self, keys) -> List[Dict[str, Any]]:
+        """Fetch full rows for one page, one IN query per condition on the page"""
+        ids_by_condition: Dict[str, List[int]] = {}
+        for key in keys:
+            ids_by_condition.setdefault(key.condition_type, []).append(key.entry_id)
+
+        loaded = {}
+        for condition_type, ids in ids_by_condition.items():
+            spec = TRACKERS_BY_CONDITION[condition_type]
+            for entry in self.db.query(spec.model).filter(spec.model.id.in_(ids)).all():
+                data = entry_to_dict(entry)
+                timestamp = getattr(entry, spec.timestamp_field)
+                data.update({
+                    "condition_type": condition_type,
+                    "urgency": spec.urgency_of(entry),
+                    "timestamp": timestamp.isoformat() if timestamp else None,
+                })
+                loaded[(condition_type, entry.id)] = data
+
+        # Keep feed order; rows deleted between the two queries are skipped
+        return [loaded[k] for k in ((key.condition_type, key.entry_id) for key in keys) if k in loaded]
+
+    @staticmethod
+    def _page(entries, next_cursor) -> Dict[str, Any]:
+        return {
+            "entries": entries,
+            "count": len(entries),
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None,
+        }
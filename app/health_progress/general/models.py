@@ -1,11 +1,15 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
+from app.health_progress.pagination import keyset_indexes
 
 Base = declarative_base()
 
 class GeneralHealthEntry(Base):  # ✅ Changed from GeneralEntry to GeneralHealthEntry
     __tablename__ = "general_entries"
+    __table_args__ = keyset_indexes("general_entries", "submitted_at") + (
+        Index("ix_general_entries_patient_day", "patient_id", "submission_date"),
+    )
     
     # Basic info
     id = Column(Integer, primary_key=True, index=True)
@@ -1,21 +1,19 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.database import get_db
-from .models import GeneralHealthEntry
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
+from app.health_progress.pagination import PageParams, page_params
+from app.health_progress.versions.conditional import entries_etag, patient_etag
 from . import services, schemas
 
 router = APIRouter()
 
-def get_db_session(db: Session = Depends(get_db)):
-    return db
-
-def get_general_service(db: Session = Depends(get_db)):
-    return services.GeneralProgressService(db)
+def get_general_service(db: AsyncSession = Depends(get_async_db)):
+    return services.AsyncGeneralProgressService(db)
 
 @router.post("/entries", response_model=schemas.GeneralEntryResponse)
 async def create_general_entry(
     data: dict,
-    service: services.GeneralProgressService = Depends(get_general_service)
+    service: services.AsyncGeneralProgressService = Depends(get_general_service)
 ):
     """Create a new general health entry with flattened structure"""
     try:
@@ -23,7 +21,7 @@ async def create_general_entry(
         print("🔍 RECEIVED RAW DATA:", data)
         
         # ✅ Use service to handle the data mapping and creation
-        db_entry = service.create_entry(data)
+        db_entry = await service.create_entry(data)
         
         # ✅ Return the response with proper FLATTENED structure
         return schemas.GeneralEntryResponse(
@@ -49,11 +47,14 @@ async def create_general_entry(
         print(f"❌ GENERAL ROUTER: Error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to create entry: {str(e)}")
 
-@router.get("/entries")
-async def get_all_general_entries(db: Session = Depends(get_db_session)):
+@router.get("/entries", dependencies=[Depends(entries_etag("general_health"))])
+async def get_all_general_entries(
+    page: PageParams = Depends(page_params),
+    service: services.AsyncGeneralProgressService = Depends(get_general_service)
+):
     """Get all general health entries"""
     try:
-        entries = db.query(GeneralHealthEntry).all()
+        entries, next_cursor = await service.get_all_entries(page)
         
         return {
             "entries": [
@@ -77,20 +78,18 @@ async def get_all_general_entries(db: Session = Depends(get_db_session)):
                 }
                 for entry in entries
             ],
-            "total": len(entries)
+            "total": len(entries),
+            "next_cursor": next_cursor
         }
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get entries: {str(e)}")
 
-@router.get("/entries/{patient_id}/{date}")
-async def get_general_entry(patient_id: int, date: str, db: Session = Depends(get_db_session)):
+@router.get("/entries/{patient_id}/{date}", dependencies=[Depends(patient_etag("general_health"))])
+async def get_general_entry(patient_id: int, date: str, service: services.AsyncGeneralProgressService = Depends(get_general_service)):
     """Get specific general health entry for patient and date"""
     try:
-        entry = db.query(GeneralHealthEntry).filter(
-            GeneralHealthEntry.patient_id == patient_id,
-            GeneralHealthEntry.submission_date == date
-        ).first()
+        entry = await service.get_entry(patient_id, date)
         
         if not entry:
             return {
@@ -125,27 +124,22 @@ async def get_general_entry(patient_id: int, date: str, db: Session = Depends(ge
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get entry: {str(e)}")
 
-@router.get("/check/{patient_id}/{date}")
-async def check_general_entry(patient_id: int, date: str, db: Session = Depends(get_db_session)):
+@router.get("/check/{patient_id}/{date}", dependencies=[Depends(patient_etag("general_health"))])
+async def check_general_entry(patient_id: int, date: str, service: services.AsyncGeneralProgressService = Depends(get_general_service)):
     """Check if general health entry exists"""
     try:
-        exists = db.query(GeneralHealthEntry).filter(
-            GeneralHealthEntry.patient_id == patient_id,
-            GeneralHealthEntry.submission_date == date
-        ).first() is not None
+        exists = await service.get_entry(patient_id, date) is not None
         
         return {"exists": exists, "patient_id": patient_id, "date": date}
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to check entry: {str(e)}")
 
-@router.get("/patient/{patient_id}")
-async def get_patient_general_entries(patient_id: int, db: Session = Depends(get_db_session)):
+@router.get("/patient/{patient_id}", dependencies=[Depends(patient_etag("general_health"))])
+async def get_patient_general_entries(patient_id: int, service: services.AsyncGeneralProgressService = Depends(get_general_service)):
     """Get all general health entries for a patient"""
     try:
-        entries = db.query(GeneralHealthEntry).filter(
-            GeneralHealthEntry.patient_id == patient_id
-        ).all()
+        entries = await service.get_patient_entries(patient_id)
         
         return {
             "entries": [
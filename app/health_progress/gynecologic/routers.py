@@ -1,19 +1,25 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
+from app.health_progress.pagination import PageParams, page_params
+from app.health_progress.versions.conditional import entries_etag, patient_etag
 from . import services, schemas
 
 # ✅ DEFINE ROUTER FIRST - THIS MUST COME BEFORE ANY @router DECORATORS
 router = APIRouter(prefix="/gynecologic", tags=["Gynecologic Progress"])
 
-def get_gynecologic_service(db: Session = Depends(get_db)):
-    return services.GynecologicProgressService(db)
+def get_gynecologic_service(db: AsyncSession = Depends(get_async_db)):
+    return services.AsyncGynecologicProgressService(db)
+
+# Columns the listings render; the rest of the row is not loaded
+LIST_COLUMNS = ["id", "patient_id", "patient_name", "surgery_type", "submission_date",
+                "common_data", "condition_data", "created_at"]
 
 # ✅ NOW USE THE ROUTER DECORATOR (AFTER router IS DEFINED)
 @router.post("/entries", response_model=schemas.GynecologicEntryResponse)
 async def create_gynecologic_entry(
     entry_data: schemas.GynecologicEntryCreate,
-    gynecologic_service: services.GynecologicProgressService = Depends(get_gynecologic_service)
+    gynecologic_service: services.AsyncGynecologicProgressService = Depends(get_gynecologic_service)
 ):
     try:
         print("📥 Received POST data:", entry_data.dict())
@@ -73,7 +79,7 @@ async def create_gynecologic_entry(
             }
         }
         
-        db_entry = gynecologic_service.create_entry(service_data)
+        db_entry = await gynecologic_service.create_entry(service_data)
         
         # Transform database response to match response schema (camelCase)
         return schemas.GynecologicEntryResponse(
@@ -134,12 +140,13 @@ async def create_gynecologic_entry(
         print("❌ POST Error details:", str(e))
         raise HTTPException(status_code=500, detail=f"Failed to create gynecologic progress entry: {str(e)}")
 
-@router.get("/entries")
+@router.get("/entries", dependencies=[Depends(entries_etag("gynecologic"))])
 async def get_all_gynecologic_entries(
-    gynecologic_service: services.GynecologicProgressService = Depends(get_gynecologic_service)
+    page: PageParams = Depends(page_params),
+    gynecologic_service: services.AsyncGynecologicProgressService = Depends(get_gynecologic_service)
 ):
     try:
-        entries = gynecologic_service.get_all_entries()
+        entries, next_cursor = await gynecologic_service.get_all_entries(page, columns=LIST_COLUMNS)
         
         formatted_entries = []
         for entry in entries:
@@ -158,20 +165,21 @@ async def get_all_gynecologic_entries(
         return {
             "entries": formatted_entries,
             "total": len(entries),
+            "next_cursor": next_cursor,
             "surgery_type": "gynecologic"
         }
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving gynecologic entries: {str(e)}")
 
-@router.get("/entries/{patient_id}/{date}")
+@router.get("/entries/{patient_id}/{date}", dependencies=[Depends(patient_etag("gynecologic"))])
 async def check_gynecologic_entry(
     patient_id: int, 
     date: str,
-    gynecologic_service: services.GynecologicProgressService = Depends(get_gynecologic_service)
+    gynecologic_service: services.AsyncGynecologicProgressService = Depends(get_gynecologic_service)
 ):
     try:
-        exists = gynecologic_service.check_existing_entry(patient_id, date)
+        exists = await gynecologic_service.check_existing_entry(patient_id, date)
         return {"exists": exists}
         
     except Exception as e:
@@ -1,46 +1,23 @@
 # app/health_progress/heart/routers.py
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.database import get_db
-from app.health_progress.heart.models import HeartEntry
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
+from app.health_progress.pagination import PageParams, page_params
+from app.health_progress.heart.services import AsyncHeartProgressService
+from app.cache.services import cached_route
+from app.health_progress.versions.conditional import entries_etag, patient_etag
 
 router = APIRouter()
 
-def get_db_session(db: Session = Depends(get_db)):
-    return db
+def get_heart_service(db: AsyncSession = Depends(get_async_db)) -> AsyncHeartProgressService:
+    return AsyncHeartProgressService(db)
 
 # POST /api/health-progress/heart/entries
 @router.post("/entries")
-async def create_heart_entry(data: dict, db: Session = Depends(get_db_session)):
+async def create_heart_entry(data: dict, service: AsyncHeartProgressService = Depends(get_heart_service)):
     """Create a new heart disease entry"""
     try:
-        print("📥 Creating heart entry:", data)
-        
-        # Create entry with flat data structure
-        db_entry = HeartEntry(
-            patient_id=data.get('patient_id'),
-            patient_name=data.get('patient_name'),
-            submission_date=data.get('submission_date'),
-            blood_pressure_systolic=data.get('blood_pressure_systolic'),
-            blood_pressure_diastolic=data.get('blood_pressure_diastolic'),
-            energy_level=data.get('energy_level'),
-            sleep_hours=data.get('sleep_hours'),
-            sleep_quality=data.get('sleep_quality'),
-            medications=data.get('medications'),
-            symptoms=data.get('symptoms'),
-            notes=data.get('notes'),
-            status=data.get('status'),
-            chest_pain_level=data.get('chest_pain_level'),
-            pain_location=data.get('pain_location'),
-            weight=data.get('weight'),
-            swelling_level=data.get('swelling_level'),
-            breathing_difficulty=data.get('breathing_difficulty'),
-            condition_type=data.get('condition_type')
-        )
-        
-        db.add(db_entry)
-        db.commit()
-        db.refresh(db_entry)
+        db_entry = await service.create_entry(data)
         
         return {
             "message": "Heart disease entry created successfully",
@@ -49,15 +26,18 @@ async def create_heart_entry(data: dict, db: Session = Depends(get_db_session)):
         }
         
     except Exception as e:
-        db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to create entry: {str(e)}")
 
 # GET /api/health-progress/heart/entries
-@router.get("/entries")
-async def get_all_heart_entries(db: Session = Depends(get_db_session)):
+@router.get("/entries", dependencies=[Depends(entries_etag("heart"))])
+@cached_route("heart.entries", tags=["heart_entries"])
+async def get_all_heart_entries(
+    page: PageParams = Depends(page_params),
+    service: AsyncHeartProgressService = Depends(get_heart_service)
+):
     """Get all heart disease entries"""
     try:
-        entries = db.query(HeartEntry).all()
+        entries, next_cursor = await service.get_all_entries(page)
         
         return {
             "entries": [
@@ -85,21 +65,19 @@ async def get_all_heart_entries(db: Session = Depends(get_db_session)):
                 }
                 for entry in entries
             ],
-            "total": len(entries)
+            "total": len(entries),
+            "next_cursor": next_cursor
         }
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get entries: {str(e)}")
 
 # GET /api/health-progress/heart/entries/{patient_id}/{date}
-@router.get("/entries/{patient_id}/{date}")
-async def get_heart_entry(patient_id: int, date: str, db: Session = Depends(get_db_session)):
+@router.get("/entries/{patient_id}/{date}", dependencies=[Depends(patient_etag("heart"))])
+async def get_heart_entry(patient_id: int, date: str, service: AsyncHeartProgressService = Depends(get_heart_service)):
     """Get specific heart disease entry for patient and date"""
     try:
-        entry = db.query(HeartEntry).filter(
-            HeartEntry.patient_id == patient_id,
-            HeartEntry.submission_date == date
-        ).first()
+        entry = await service.get_entry(patient_id, date)
         
         if not entry:
             return {
@@ -139,14 +117,11 @@ async def get_heart_entry(patient_id: int, date: str, db: Session = Depends(get_
         raise HTTPException(status_code=500, detail=f"Failed to get entry: {str(e)}")
 
 # GET /api/health-progress/heart/check/{patient_id}/{date}
-@router.get("/check/{patient_id}/{date}")
-async def check_heart_entry(patient_id: int, date: str, db: Session = Depends(get_db_session)):
+@router.get("/check/{patient_id}/{date}", dependencies=[Depends(patient_etag("heart"))])
+async def check_heart_entry(patient_id: int, date: str, service: AsyncHeartProgressService = Depends(get_heart_service)):
     """Check if heart disease entry exists"""
     try:
-        exists = db.query(HeartEntry).filter(
-            HeartEntry.patient_id == patient_id,
-            HeartEntry.submission_date == date
-        ).first() is not None
+        exists = await service.get_entry(patient_id, date) is not None
         
         return {"exists": exists, "patient_id": patient_id, "date": date}
         
@@ -154,13 +129,11 @@ async def check_heart_entry(patient_id: int, date: str, db: Session = Depends(ge
         raise HTTPException(status_code=500, detail=f"Failed to check entry: {str(e)}")
 
 # GET /api/health-progress/heart/patient/{patient_id}
-@router.get("/patient/{patient_id}")
-async def get_patient_heart_entries(patient_id: int, db: Session = Depends(get_db_session)):
+@router.get("/patient/{patient_id}", dependencies=[Depends(patient_etag("heart"))])
+async def get_patient_heart_entries(patient_id: int, service: AsyncHeartProgressService = Depends(get_heart_service)):
     """Get all heart disease entries for a patient"""
     try:
-        entries = db.query(HeartEntry).filter(
-            HeartEntry.patient_id == patient_id
-        ).all()
+        entries = await service.get_patient_entries(patient_id)
         
         return {
             "entries": [
@@ -0,0 +1,74 @@
+# app/health_progress/hooks.py
+"""
+Everything that follows a tracker write, in one switch.
+
+ORM writes are picked up by the installed hooks; statements that bypass the
+ORM call `core_write` / `bulk_insert_write` / `bulk_urgency_write` themselves:
+
+- triage queue row (app.health_progress.triage)
+- version counters for conditional GETs (app.health_progress.versions)
+- vital_observations rows for trend charts (app.health_progress.vitals)
+- live dashboard event after commit (app.health_progress.events)
+- response cache invalidation after commit (app.cache, installed app-wide)
+
+The server installs the hooks at startup; scripts that write tracker rows
+call `install_write_hooks()` first.
+"""
+from typing import Any, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.cache.services import note_table_write
+from app.health_progress.events.services import install_event_hooks, note_write, remove_event_hooks
+from app.health_progress.registry import get_tracker
+from app.health_progress.triage.services import (
+    install_triage_hooks, record_entries, record_entry, remove_triage_hooks, set_urgency
+)
+from app.health_progress.versions.services import (
+    bump_condition, bump_entries, bump_entry, install_version_hooks, remove_version_hooks
+)
+from app.health_progress.vitals.services import (
+    install_vital_hooks, record_vitals, record_vitals_bulk, remove_vital_hooks
+)
+
+
+def install_write_hooks():
+    install_triage_hooks()
+    install_version_hooks()
+    install_vital_hooks()
+    install_event_hooks()
+
+
+def remove_write_hooks():
+    remove_event_hooks()
+    remove_vital_hooks()
+    remove_version_hooks()
+    remove_triage_hooks()
+
+
+def core_write(db: Session, model, entry):
+    """A row saved with a Core INSERT/UPDATE (no mapper or flush events fire); call before commit"""
+    record_entry(db, model, entry)
+    bump_entry(db, model, entry)
+    record_vitals(db, model, entry)
+    note_write(db, model, entry)
+    note_table_write(db, model.__tablename__)
+
+
+def bulk_insert_write(db: Session, model, entries: Sequence[Any]):
+    """New rows of one table saved with a single (executemany) INSERT; call before commit"""
+    if not entries:
+        return
+    record_entries(db, model, entries)
+    bump_entries(db, model, entries)
+    record_vitals_bulk(db, model, entries)
+    for entry in entries:
+        note_write(db, model, entry, kind="created")
+    note_table_write(db, model.__tablename__)
+
+
+def bulk_urgency_write(db: Session, condition_type: str, levels: Sequence[Tuple[int, str]]):
+    """Bulk UPDATE of urgency_status by primary key; call before commit"""
+    set_urgency(db, condition_type, levels)
+    bump_condition(db, condition_type)
+    note_table_write(db, get_tracker(condition_type).table_name)
@@ -1,12 +1,16 @@
 # app/health_progress/hypertension/models.py
-from sqlalchemy import Column, Integer, String, DateTime, JSON
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Index
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
+from app.health_progress.pagination import keyset_indexes
 
 Base = declarative_base()
 
 class HypertensionEntry(Base):
     __tablename__ = "hypertension_entries"
+    __table_args__ = keyset_indexes("hypertension_entries", "created_at") + (
+        Index("ix_hypertension_entries_patient_day", "patient_id", "submission_date"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     patient_id = Column(Integer, nullable=False)
@@ -1,41 +1,22 @@
 # app/health_progress/hypertension/routers.py
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.database import get_db
-from app.health_progress.hypertension.models import HypertensionEntry
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
+from app.health_progress.pagination import PageParams, page_params
+from app.health_progress.hypertension.services import AsyncHypertensionProgressService
+from app.health_progress.versions.conditional import entries_etag, patient_etag
 
 router = APIRouter()
 
-def get_db_session(db: Session = Depends(get_db)):
-    return db
+def get_hypertension_service(db: AsyncSession = Depends(get_async_db)) -> AsyncHypertensionProgressService:
+    return AsyncHypertensionProgressService(db)
 
 # POST /api/health-progress/hypertension/entries
 @router.post("/entries")
-async def create_hypertension_entry(data: dict, db: Session = Depends(get_db_session)):
+async def create_hypertension_entry(data: dict, service: AsyncHypertensionProgressService = Depends(get_hypertension_service)):
     """Create a new hypertension entry"""
     try:
-        print("📥 Creating hypertension entry:", data)
-        
-        # Create entry with flat data structure from frontend
-        db_entry = HypertensionEntry(
-            patient_id=data.get('patient_id'),
-            patient_name=data.get('patient_name'),
-            submission_date=data.get('submission_date'),
-            blood_pressure_systolic=data.get('blood_pressure_systolic'),
-            blood_pressure_diastolic=data.get('blood_pressure_diastolic'),
-            energy_level=data.get('energy_level'),
-            sleep_hours=data.get('sleep_hours'),
-            sleep_quality=data.get('sleep_quality'),
-            medications=data.get('medications'),
-            symptoms=data.get('symptoms'),
-            notes=data.get('notes'),
-            status=data.get('status'),
-            condition_type=data.get('condition_type')
-        )
-        
-        db.add(db_entry)
-        db.commit()
-        db.refresh(db_entry)
+        db_entry = await service.create_entry(data)
         
         return {
             "message": "Hypertension entry created successfully",
@@ -44,15 +25,17 @@ async def create_hypertension_entry(data: dict, db: Session = Depends(get_db_ses
         }
         
     except Exception as e:
-        db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to create entry: {str(e)}")
 
 # GET /api/health-progress/hypertension/entries
-@router.get("/entries")
-async def get_all_hypertension_entries(db: Session = Depends(get_db_session)):
+@router.get("/entries", dependencies=[Depends(entries_etag("hypertension"))])
+async def get_all_hypertension_entries(
+    page: PageParams = Depends(page_params),
+    service: AsyncHypertensionProgressService = Depends(get_hypertension_service)
+):
     """Get all hypertension entries"""
     try:
-        entries = db.query(HypertensionEntry).all()
+        entries, next_cursor = await service.get_all_entries(page)
         
         return {
             "entries": [
@@ -75,21 +58,19 @@ async def get_all_hypertension_entries(db: Session = Depends(get_db_session)):
                 }
                 for entry in entries
             ],
-            "total": len(entries)
+            "total": len(entries),
+            "next_cursor": next_cursor
         }
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get entries: {str(e)}")
 
 # GET /api/health-progress/hypertension/entries/{patient_id}/{date}
-@router.get("/entries/{patient_id}/{date}")
-async def get_hypertension_entry(patient_id: int, date: str, db: Session = Depends(get_db_session)):
+@router.get("/entries/{patient_id}/{date}", dependencies=[Depends(patient_etag("hypertension"))])
+async def get_hypertension_entry(patient_id: int, date: str, service: AsyncHypertensionProgressService = Depends(get_hypertension_service)):
     """Get specific hypertension entry for patient and date"""
     try:
-        entry = db.query(HypertensionEntry).filter(
-            HypertensionEntry.patient_id == patient_id,
-            HypertensionEntry.submission_date == date
-        ).first()
+        entry = await service.get_entry(patient_id, date)
         
         if not entry:
             return {
@@ -124,14 +105,11 @@ async def get_hypertension_entry(patient_id: int, date: str, db: Session = Depen
         raise HTTPException(status_code=500, detail=f"Failed to get entry: {str(e)}")
 
 # GET /api/health-progress/hypertension/check/{patient_id}/{date}
-@router.get("/check/{patient_id}/{date}")
-async def check_hypertension_entry(patient_id: int, date: str, db: Session = Depends(get_db_session)):
+@router.get("/check/{patient_id}/{date}", dependencies=[Depends(patient_etag("hypertension"))])
+async def check_hypertension_entry(patient_id: int, date: str, service: AsyncHypertensionProgressService = Depends(get_hypertension_service)):
     """Check if hypertension entry exists"""
     try:
-        exists = db.query(HypertensionEntry).filter(
-            HypertensionEntry.patient_id == patient_id,
-            HypertensionEntry.submission_date == date
-        ).first() is not None
+        exists = await service.get_entry(patient_id, date) is not None
         
         return {"exists": exists, "patient_id": patient_id, "date": date}
         
@@ -139,13 +117,11 @@ async def check_hypertension_entry(patient_id: int, date: str, db: Session = Dep
         raise HTTPException(status_code=500, detail=f"Failed to check entry: {str(e)}")
 
 # GET /api/health-progress/hypertension/patient/{patient_id}
-@router.get("/patient/{patient_id}")
-async def get_patient_hypertension_entries(patient_id: int, db: Session = Depends(get_db_session)):
+@router.get("/patient/{patient_id}", dependencies=[Depends(patient_etag("hypertension"))])
+async def get_patient_hypertension_entries(patient_id: int, service: AsyncHypertensionProgressService = Depends(get_hypertension_service)):
     """Get all hypertension entries for a patient"""
     try:
-        entries = db.query(HypertensionEntry).filter(
-            HypertensionEntry.patient_id == patient_id
-        ).all()
+        entries = await service.get_patient_entries(patient_id)
         
         return {
             "entries": [
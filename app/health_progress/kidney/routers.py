@@ -1,22 +1,20 @@
 # app/health_progress/kidney/routers.py
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.database import get_db
-from .models import KidneyEntry
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
+from app.health_progress.pagination import PageParams, page_params
+from app.health_progress.versions.conditional import entries_etag, patient_etag
 from . import services, schemas
 
 router = APIRouter()
 
-def get_db_session(db: Session = Depends(get_db)):
-    return db
-
-def get_kidney_service(db: Session = Depends(get_db)):
-    return services.KidneyProgressService(db)
+def get_kidney_service(db: AsyncSession = Depends(get_async_db)):
+    return services.AsyncKidneyProgressService(db)
 
 @router.post("/entries", response_model=schemas.KidneyEntryResponse)
 async def create_kidney_entry(
     data: dict,  # ✅ Change from schemas.KidneyEntryCreate to dict
-    service: services.KidneyProgressService = Depends(get_kidney_service)
+    service: services.AsyncKidneyProgressService = Depends(get_kidney_service)
 ):
     """Create a new kidney disease entry with flattened structure"""
     try:
@@ -24,7 +22,7 @@ async def create_kidney_entry(
         print("🔍 RECEIVED RAW DATA:", data)
         
         # ✅ Use service to handle the data mapping and creation
-        db_entry = service.create_entry(data)
+        db_entry = await service.create_entry(data)
         
         # ✅ Return the response with proper FLATTENED structure
         return schemas.KidneyEntryResponse(
@@ -64,11 +62,14 @@ async def create_kidney_entry(
         raise HTTPException(status_code=500, detail=f"Failed to create entry: {str(e)}")
 
 
-@router.get("/entries")
-async def get_all_kidney_entries(db: Session = Depends(get_db_session)):
+@router.get("/entries", dependencies=[Depends(entries_etag("kidney"))])
+async def get_all_kidney_entries(
+    page: PageParams = Depends(page_params),
+    service: services.AsyncKidneyProgressService = Depends(get_kidney_service)
+):
     """Get all kidney disease entries"""
     try:
-        entries = db.query(KidneyEntry).all()
+        entries, next_cursor = await service.get_all_entries(page)
         
         return {
             "entries": [
@@ -105,20 +106,18 @@ async def get_all_kidney_entries(db: Session = Depends(get_db_session)):
                 }
                 for entry in entries
             ],
-            "total": len(entries)
+            "total": len(entries),
+            "next_cursor": next_cursor
         }
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get entries: {str(e)}")
 
-@router.get("/entries/{patient_id}/{date}")
-async def get_kidney_entry(patient_id: int, date: str, db: Session = Depends(get_db_session)):
+@router.get("/entries/{patient_id}/{date}", dependencies=[Depends(patient_etag("kidney"))])
+async def get_kidney_entry(patient_id: int, date: str, service: services.AsyncKidneyProgressService = Depends(get_kidney_service)):
     """Get specific kidney disease entry for patient and date"""
     try:
-        entry = db.query(KidneyEntry).filter(
-            KidneyEntry.patient_id == patient_id,
-            KidneyEntry.submission_date == date
-        ).first()
+        entry = await service.get_entry(patient_id, date)
         
         if not entry:
             return {
@@ -166,27 +165,22 @@ async def get_kidney_entry(patient_id: int, date: str, db: Session = Depends(get
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get entry: {str(e)}")
 
-@router.get("/check/{patient_id}/{date}")
-async def check_kidney_entry(patient_id: int, date: str, db: Session = Depends(get_db_session)):
+@router.get("/check/{patient_id}/{date}", dependencies=[Depends(patient_etag("kidney"))])
+async def check_kidney_entry(patient_id: int, date: str, service: services.AsyncKidneyProgressService = Depends(get_kidney_service)):
     """Check if kidney disease entry exists"""
     try:
-        exists = db.query(KidneyEntry).filter(
-            KidneyEntry.patient_id == patient_id,
-            KidneyEntry.submission_date == date
-        ).first() is not None
+        exists = await service.get_entry(patient_id, date) is not None
         
         return {"exists": exists, "patient_id": patient_id, "date": date}
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to check entry: {str(e)}")
 
-@router.get("/patient/{patient_id}")
-async def get_patient_kidney_entries(patient_id: int, db: Session = Depends(get_db_session)):
+@router.get("/patient/{patient_id}", dependencies=[Depends(patient_etag("kidney"))])
+async def get_patient_kidney_entries(patient_id: int, service: services.AsyncKidneyProgressService = Depends(get_kidney_service)):
     """Get all kidney disease entries for a patient"""
     try:
-        entries = db.query(KidneyEntry).filter(
-            KidneyEntry.patient_id == patient_id
-        ).all()
+        entries = await service.get_patient_entries(patient_id)
         
         return {
             "entries": [
@@ -65,7 +65,7 @@ class AuthInitializeResponse(BaseModel):
 # ✅ AUTHENTICATION ENDPOINTS
 
 @router.get("/lifelong/entries/{patient_id}", response_model=AuthCheckResponse)
-async def check_authentication_via_lifelong_no_date(patient_id: int, db: Session = Depends(get_db)):
+def check_authentication_via_lifelong_no_date(patient_id: int, db: Session = Depends(get_db)):
     """
     Check authentication via lifelong endpoint WITHOUT date parameter
     """
@@ -89,7 +89,7 @@ async def check_authentication_via_lifelong_no_date(patient_id: int, db: Session
         raise HTTPException(status_code=500, detail=f"Authentication check failed: {str(e)}")
 
 @router.get("/lifelong/entries/{patient_id}/{date}", response_model=AuthCheckResponse)
-async def check_authentication_via_lifelong_with_date(patient_id: int, date: str, db: Session = Depends(get_db)):
+def check_authentication_via_lifelong_with_date(patient_id: int, date: str, db: Session = Depends(get_db)):
     """
     Check authentication via lifelong endpoint WITH date parameter
     """
@@ -113,7 +113,7 @@ async def check_authentication_via_lifelong_with_date(patient_id: int, date: str
         raise HTTPException(status_code=500, detail=f"Authentication check failed: {str(e)}")
 
 @router.post("/lifelong/auth/initialize", response_model=AuthInitializeResponse)
-async def initialize_lifelong_auth(auth_data: AuthInitializeRequest, db: Session = Depends(get_db)):
+def initialize_lifelong_auth(auth_data: AuthInitializeRequest, db: Session = Depends(get_db)):
     """
     Initialize lifelong authentication session
     This endpoint is called by the React Native component to initialize auth session
@@ -138,7 +138,7 @@ async def initialize_lifelong_auth(auth_data: AuthInitializeRequest, db: Session
 # ✅ LIFELONG AGGREGATE ENDPOINTS
 
 @router.get("/lifelong/entries")
-async def get_lifelong_entries(db: Session = Depends(get_db)):
+def get_lifelong_entries(db: Session = Depends(get_db)):
     """Get all lifelong health entries across all chronic conditions"""
     try:
         all_entries = []
@@ -155,7 +155,7 @@ async def get_lifelong_entries(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Failed to retrieve lifelong entries: {str(e)}")
 
 @router.get("/lifelong/entries/{patient_id}/{date}")
-async def get_patient_lifelong_entries_by_date(patient_id: int, date: str, db: Session = Depends(get_db)):
+def get_patient_lifelong_entries_by_date(patient_id: int, date: str, db: Session = Depends(get_db)):
     """
     Get all lifelong entries for a specific patient on a specific date across all conditions
     """
@@ -176,7 +176,7 @@ async def get_patient_lifelong_entries_by_date(patient_id: int, date: str, db: S
         raise HTTPException(status_code=500, detail=f"Failed to retrieve patient entries: {str(e)}")
 
 @router.post("/lifelong/entries")
-async def create_lifelong_entries(entry: LifelongEntryCreate, db: Session = Depends(get_db)):
+def create_lifelong_entries(entry: LifelongEntryCreate, db: Session = Depends(get_db)):
     """
     Create lifelong entries for multiple conditions in a single request
     This endpoint handles submissions from the Lifelong component that tracks multiple conditions
@@ -217,7 +217,7 @@ async def create_lifelong_entries(entry: LifelongEntryCreate, db: Session = Depe
 
 # Health check endpoint
 @router.get("/lifelong-health/status")
-async def lifelong_health_status(db: Session = Depends(get_db)):
+def lifelong_health_status(db: Session = Depends(get_db)):
     """
     Health check for lifelong health endpoints
     """
@@ -1,25 +1,31 @@
 # app/health_progress/orthopedic/routers.py
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
+from app.health_progress.pagination import PageParams, page_params
+from app.health_progress.versions.conditional import entries_etag, patient_etag
 from . import services, schemas  # ✅ Import schemas
 
 router = APIRouter(prefix="/orthopedic", tags=["Orthopedic Progress"])
 
-def get_orthopedic_service(db: Session = Depends(get_db)):
-    return services.OrthopedicProgressService(db)
+def get_orthopedic_service(db: AsyncSession = Depends(get_async_db)):
+    return services.AsyncOrthopedicProgressService(db)
+
+# Columns the listings render; the rest of the row is not loaded
+LIST_COLUMNS = ["id", "patient_id", "patient_name", "submission_date",
+                "common_data", "condition_data", "created_at"]
 
 @router.post("/entries", response_model=schemas.OrthopedicEntryResponse)
 async def create_orthopedic_entry(
     entry_data: schemas.OrthopedicEntryCreate,  # ✅ Use schema instead of dict
-    orthopedic_service: services.OrthopedicProgressService = Depends(get_orthopedic_service)
+    orthopedic_service: services.AsyncOrthopedicProgressService = Depends(get_orthopedic_service)
 ):
     """
     Create a new orthopedic surgery progress entry
     """
     try:
         print("📥 ORTHOPEDIC Received POST data:", entry_data.dict())
-        db_entry = orthopedic_service.create_entry(entry_data.dict())
+        db_entry = await orthopedic_service.create_entry(entry_data.dict())
         
         # ✅ Return using schema
         return schemas.OrthopedicEntryResponse(
@@ -36,15 +42,16 @@ async def create_orthopedic_entry(
         print("❌ ORTHOPEDIC POST Error details:", str(e))
         raise HTTPException(status_code=500, detail=f"Failed to create orthopedic progress entry: {str(e)}")
 
-@router.get("/entries")
+@router.get("/entries", dependencies=[Depends(entries_etag("orthopedic"))])
 async def get_all_orthopedic_entries(
-    orthopedic_service: services.OrthopedicProgressService = Depends(get_orthopedic_service)
+    page: PageParams = Depends(page_params),
+    orthopedic_service: services.AsyncOrthopedicProgressService = Depends(get_orthopedic_service)
 ):
     """
     Get ALL orthopedic surgery entries
     """
     try:
-        entries = orthopedic_service.get_all_entries()
+        entries, next_cursor = await orthopedic_service.get_all_entries(page, columns=LIST_COLUMNS)
         
         formatted_entries = []
         for entry in entries:
@@ -62,38 +69,39 @@ async def get_all_orthopedic_entries(
         return {
             "entries": formatted_entries,
             "total": len(entries),
+            "next_cursor": next_cursor,
             "surgery_type": "orthopedic"
         }
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving orthopedic entries: {str(e)}")
 
-@router.get("/entries/{patient_id}/{date}")
+@router.get("/entries/{patient_id}/{date}", dependencies=[Depends(patient_etag("orthopedic"))])
 async def check_orthopedic_entry(
     patient_id: int,
     date: str,
-    orthopedic_service: services.OrthopedicProgressService = Depends(get_orthopedic_service)
+    orthopedic_service: services.AsyncOrthopedicProgressService = Depends(get_orthopedic_service)
 ):
     """
     Check if an orthopedic entry exists for a patient on a specific date
     """
     try:
-        exists = orthopedic_service.check_existing_entry(patient_id, date)
+        exists = await orthopedic_service.check_existing_entry(patient_id, date)
         return {"exists": exists}
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error checking orthopedic entry: {str(e)}")
 
-@router.get("/entries/patient/{patient_id}")
+@router.get("/entries/patient/{patient_id}", dependencies=[Depends(patient_etag("orthopedic"))])
 async def get_patient_orthopedic_entries(
     patient_id: int,
-    orthopedic_service: services.OrthopedicProgressService = Depends(get_orthopedic_service)
+    orthopedic_service: services.AsyncOrthopedicProgressService = Depends(get_orthopedic_service)
 ):
     """
     Get all orthopedic entries for a specific patient
     """
     try:
-        entries = orthopedic_service.get_patient_entries(patient_id)
+        entries = await orthopedic_service.get_patient_entries(patient_id, columns=LIST_COLUMNS)
         
         formatted_entries = []
         for entry in entries:
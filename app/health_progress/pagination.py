@@ -0,0 +1,178 @@
+# app/health_progress/pagination.py
+"""
+Opaque keyset cursors for newest-first listings.
+
+A cursor remembers the sort timestamp and id of the last row of a page, so the
+next page is a range seek instead of an OFFSET scan.
+"""
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from fastapi import HTTPException, Query
+from sqlalchemy import DateTime, Index, String, and_, literal, or_, text, type_coerce
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+@dataclass
+class PageParams:
+    limit: int = DEFAULT_PAGE_SIZE
+    after: Optional[str] = None
+
+
+def page_params(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    after: Optional[str] = Query(None, description="next_cursor of the previous page"),
+) -> PageParams:
+    """FastAPI dependency shared by every paginated listing"""
+    if after:
+        # Reject malformed cursors here with a 400, before any service runs
+        if len(decode_cursor(after, dialect_name="", timestamp=False)) != 2:
+            raise HTTPException(status_code=400, detail="Invalid cursor: wrong number of values")
+    return PageParams(limit=limit, after=after)
+
+
+def keyset_indexes(table_name: str, timestamp_field: str):
+    """
+    `__table_args__` indexes that serve the (timestamp DESC NULLS LAST, id DESC)
+    ordering of `paginate`, over the whole table and within one patient.
+
+    SQLite sorts NULLs first, so a plain (timestamp, id) index read backwards
+    already matches. PostgreSQL needs the direction and NULL placement spelled
+    out to avoid a sort.
+    """
+    return _newest_first(f"ix_{table_name}_{timestamp_field}_id", timestamp_field) + \
+        patient_keyset_indexes(table_name, timestamp_field)
+
+
+def patient_keyset_indexes(table_name: str, timestamp_field: str):
+    """(patient_id, timestamp DESC NULLS LAST, id DESC): patient listings and the patient timeline"""
+    return _newest_first(f"ix_{table_name}_patient_{timestamp_field}_id", timestamp_field, "patient_id")
+
+
+def _newest_first(name: str, timestamp_field: str, *leading: str):
+    return (
+        Index(name, *leading, timestamp_field, "id").ddl_if(callable_=_not_postgresql),
+        Index(
+            name, *leading, text(f"{timestamp_field} DESC NULLS LAST"), text("id DESC")
+        ).ddl_if(dialect="postgresql"),
+    )
+
+
+def _not_postgresql(ddl, target, bind, dialect=None, **kw):
+    return dialect.name != "postgresql"
+
+
+def sort_key(column, dialect_name: str):
+    """
+    Column expression used for ordering and cursor comparisons.
+
+    SQLite keeps DateTime values as text, and rows written by
+    `server_default=func.now()` use a different text format than rows written
+    by `datetime.utcnow`. Comparing the raw stored text keeps the cursor exact
+    for both formats (and still uses the index).
+    """
+    if dialect_name == "sqlite":
+        return type_coerce(column, String)
+    return column
+
+
+def encode_cursor(values: List[Any]) -> str:
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, dialect_name: str, timestamp: bool = True) -> List[Any]:
+    """
+    Inverse of encode_cursor; the first value is the sort key.
+
+    With `timestamp` the sort key is parsed back into a datetime (except on
+    SQLite, see sort_key).
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or not values:
+            raise ValueError("cursor payload must be a non-empty list")
+        if timestamp and values[0] is not None and dialect_name != "sqlite":
+            values[0] = datetime.fromisoformat(values[0])
+        return values
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {str(e)}")
+
+
+def dialect_of(db) -> str:
+    return db.get_bind().dialect.name
+
+
+def seek_after(ts, cursor_ts, same_ts):
+    """
+    Rows after the cursor in (ts DESC NULLS LAST, ...) order.
+
+    `same_ts` decides the rows that share the cursor timestamp (the tie-breaker
+    on the remaining sort columns).
+    """
+    if cursor_ts is None:
+        return and_(ts.is_(None), same_ts)
+    return or_(ts < cursor_ts, and_(ts == cursor_ts, same_ts), ts.is_(None))
+
+
+def seek_after_merged(source: str, ts, id_column, cursor):
+    """
+    Rows of one branch of a merged listing ordered by (ts DESC NULLS LAST,
+    source DESC, id DESC) that come after `cursor` = (ts, source, id).
+    """
+    cursor_ts, cursor_source, cursor_id = cursor
+    if source < cursor_source:
+        same_ts = literal(True)
+    elif source == cursor_source:
+        same_ts = id_column < cursor_id
+    else:
+        same_ts = literal(False)
+    return seek_after(ts, cursor_ts, same_ts)
+
+
+def _keyset_page(query, dialect_name: str, timestamp_column, id_column, page: PageParams):
+    """Seek filter, order and limit for a page of `query`"""
+    ts = sort_key(timestamp_column, dialect_name)
+
+    if page.after:
+        is_timestamp = isinstance(timestamp_column.type, DateTime)
+        cursor_ts, cursor_id = decode_cursor(page.after, dialect_name, timestamp=is_timestamp)
+        query = query.filter(seek_after(ts, cursor_ts, id_column < cursor_id))
+
+    # Select the sort key alongside each row so the cursor holds the exact
+    # value the database compares against
+    return (
+        query.add_columns(ts.label("sort_ts"))
+        .order_by(ts.desc().nulls_last(), id_column.desc())
+        .limit(page.limit + 1)
+    )
+
+
+def _split_page(rows, id_column, page: PageParams) -> Tuple[List[Any], Optional[str]]:
+    next_cursor = None
+    if len(rows) > page.limit:
+        rows = rows[:page.limit]
+        entry, sort_ts = rows[-1]
+        next_cursor = encode_cursor([sort_ts, getattr(entry, id_column.key)])
+    return [entry for entry, _ in rows], next_cursor
+
+
+def paginate(query, timestamp_column, id_column, page: PageParams) -> Tuple[List[Any], Optional[str]]:
+    """
+    Newest-first keyset page of `query`, ordered by (timestamp DESC, id DESC).
+    The sort column may also be a sortable string such as an ISO date.
+
+    Returns the rows of the page and the cursor of the next page (None on the
+    last page). Only `limit + 1` rows are ever read.
+    """
+    dialect_name = query.session.get_bind().dialect.name
+    rows = _keyset_page(query, dialect_name, timestamp_column, id_column, page).all()
+    return _split_page(rows, id_column, page)
+
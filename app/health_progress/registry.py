@@ -0,0 +1,99 @@
+# app/health_progress/registry.py
+"""
+Single list of every per-condition tracker table.
+
+Endpoints that work across conditions (dashboard feed, patient timeline, ...)
+iterate TRACKERS instead of importing the tracker models one by one.
+"""
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import inspect as sa_inspect
+
+from app.health_progress.abdominal.models import AbdominalEntry
+from app.health_progress.bariatric.models import BariatricEntry
+from app.health_progress.burn_care.models import BurnCareEntry
+from app.health_progress.cancer.models import CancerEntry
+from app.health_progress.cardiac.models import CardiacSurgeryEntry
+from app.health_progress.cesarean.models import CesareanSectionEntry
+from app.health_progress.diabetes.models import DiabetesEntry
+from app.health_progress.general.models import GeneralHealthEntry
+from app.health_progress.gynecologic.models import GynecologicSurgeryEntry
+from app.health_progress.heart.models import HeartEntry
+from app.health_progress.hypertension.models import HypertensionEntry
+from app.health_progress.kidney.models import KidneyEntry
+from app.health_progress.orthopedic.models import OrthopedicSurgeryEntry
+from app.health_progress.urological.models import UrologicalSurgeryEntry
+from app.prenatal.models import PrenatalEntry
+from app.postnatal.models import PostnatalEntry
+
+# Trackers that only store a traffic-light status map it onto urgency levels
+URGENCY_FROM_STATUS = {
+    "urgent": "high",
+    "monitor": "medium",
+    "good": "low",
+}
+
+
+@dataclass(frozen=True)
+class TrackerSpec:
+    condition_type: str        # value the dashboard uses in `condition_type`
+    model: Any                 # SQLAlchemy model class
+    timestamp_field: str = "created_at"
+    urgency_field: Optional[str] = None  # column holding low/medium/high
+    status_field: Optional[str] = None   # column holding urgent/monitor/good
+
+    @property
+    def table_name(self) -> str:
+        return self.model.__tablename__
+
+    @property
+    def timestamp_column(self):
+        return getattr(self.model, self.timestamp_field)
+
+    def urgency_of(self, entry) -> Optional[str]:
+        """Normalized urgency (low/medium/high) of a loaded entry, if known"""
+        if self.urgency_field:
+            return getattr(entry, self.urgency_field)
+        if self.status_field:
+            return URGENCY_FROM_STATUS.get(getattr(entry, self.status_field))
+        return None
+
+
+TRACKERS = [
+    TrackerSpec("abdominal", AbdominalEntry),
+    TrackerSpec("cesarean", CesareanSectionEntry),
+    TrackerSpec("diabetes", DiabetesEntry, status_field="status"),
+    TrackerSpec("hypertension", HypertensionEntry, status_field="status"),
+    TrackerSpec("orthopedic", OrthopedicSurgeryEntry),
+    TrackerSpec("cardiac", CardiacSurgeryEntry),
+    TrackerSpec("urological", UrologicalSurgeryEntry),
+    TrackerSpec("heart", HeartEntry, status_field="status"),
+    TrackerSpec("general_health", GeneralHealthEntry, timestamp_field="submitted_at", urgency_field="urgency_status"),
+    TrackerSpec("burn_care", BurnCareEntry),
+    TrackerSpec("gynecologic", GynecologicSurgeryEntry),
+    TrackerSpec("bariatric", BariatricEntry, timestamp_field="submitted_at", urgency_field="urgency_status"),
+    TrackerSpec("kidney", KidneyEntry, timestamp_field="submitted_at", urgency_field="urgency_status"),
+    TrackerSpec("cancer", CancerEntry, timestamp_field="submitted_at", urgency_field="urgency_status"),
+    TrackerSpec("prenatal", PrenatalEntry, timestamp_field="submitted_at", status_field="status"),
+    TrackerSpec("postnatal", PostnatalEntry, timestamp_field="submitted_at", status_field="status"),
+]
+
+TRACKERS_BY_CONDITION: Dict[str, TrackerSpec] = {spec.condition_type: spec for spec in TRACKERS}
+TRACKERS_BY_MODEL: Dict[Any, TrackerSpec] = {spec.model: spec for spec in TRACKERS}
+
+
+def get_tracker(condition_type: str) -> Optional[TrackerSpec]:
+    return TRACKERS_BY_CONDITION.get(condition_type)
+
+
+def entry_to_dict(entry) -> Dict[str, Any]:
+    """Every mapped column of a tracker row, with dates as ISO strings"""
+    data = {}
+    for attr in sa_inspect(entry).mapper.column_attrs:
+        value = getattr(entry, attr.key)
+        if isinstance(value, (datetime, date)):
+            value = value.isoformat()
+        data[attr.key] = value
+    return data
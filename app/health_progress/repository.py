@@ -0,0 +1,196 @@
+# app/health_progress/repository.py
+"""
+Shared data access for the per-condition tracker tables.
+
+Every `*ProgressService` subclasses TrackerRepository and only declares its
+model, sort column and how a submission becomes a row (`build_entry`).
+Listing, lookups, batched writes, column projection and timing live here
+once for all trackers. Write hooks are the mapper/session events in
+app/health_progress/hooks.py.
+"""
+import functools
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session, load_only
+
+from app.health_progress.pagination import PageParams, paginate
+
+logger = logging.getLogger(__name__)
+
+# Repository calls slower than this are logged as warnings
+SLOW_CALL_MS = 200
+
+def timed(method):
+    """Log how long a repository call took; warn above SLOW_CALL_MS"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            level = logging.WARNING if elapsed_ms > SLOW_CALL_MS else logging.DEBUG
+            logger.log(level, f"⏱️ {self.label} {method.__name__} took {elapsed_ms:.1f} ms")
+    return wrapper
+
+
+class TrackerRepository:
+    model = None
+    timestamp_field = "created_at"
+    label = "TRACKER"  # log prefix, e.g. "CARDIAC"
+    # submission_date is stored as a Date: parse "YYYY-MM-DD" strings before use
+    parse_submission_date = False
+    # Columns update_entry may change
+    updatable_fields: Sequence[str] = ()
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @property
+    def timestamp_column(self):
+        return getattr(self.model, self.timestamp_field)
+
+    @property
+    def name(self) -> str:
+        return self.label.lower()
+
+    def submission_date_value(self, value):
+        if self.parse_submission_date and isinstance(value, str):
+            return datetime.strptime(value, "%Y-%m-%d").date()
+        return value
+
+    def build_entry(self, entry_data: Dict[str, Any]):
+        """Unsaved model instance for a submission; trackers with their own field mapping override this"""
+        columns = self.model.__table__.columns
+        return self.model(**{k: v for k, v in entry_data.items() if k in columns and k != "id"})
+
+    def _query(self, columns: Optional[Iterable[str]] = None):
+        query = self.db.query(self.model)
+        if columns:
+            # Projection: load only what the caller renders (JSON columns are the bulk of a row)
+            query = query.options(load_only(*[getattr(self.model, name) for name in columns]))
+        return query
+
+    @timed
+    def create_entry(self, entry_data: Dict[str, Any]):
+        try:
+            db_entry = self.build_entry(entry_data)
+            self.db.add(db_entry)
+            self.db.commit()
+            self.db.refresh(db_entry)
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"❌ {self.label} SERVICES: Error: {str(e)}")
+            raise Exception(f"Error creating {self.name} entry: {str(e)}")
+
+        logger.info(f"✅ {self.label} SERVICES: Entry created with ID: {db_entry.id}")
+        return db_entry
+
+    @timed
+    def create_entries(self, entries_data: Iterable[Dict[str, Any]]) -> List[Any]:
+        """Insert many submissions in one transaction (one multi-row INSERT per table)"""
+        try:
+            db_entries = [self.build_entry(entry_data) for entry_data in entries_data]
+            self.db.add_all(db_entries)
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"❌ {self.label} SERVICES: Batch insert failed: {str(e)}")
+            raise Exception(f"Error creating {self.name} entries: {str(e)}")
+
+        logger.info(f"✅ {self.label} SERVICES: Created {len(db_entries)} entries")
+        return db_entries
+
+    @timed
+    def get_all_entries(self, page: PageParams, columns: Optional[Iterable[str]] = None) -> Tuple[List[Any], Optional[str]]:
+        """One newest-first page of entries plus the next-page cursor"""
+        try:
+            return paginate(self._query(columns), self.timestamp_column, self.model.id, page)
+        except Exception as e:
+            logger.error(f"❌ {self.label} SERVICES: Error fetching all entries: {str(e)}")
+            raise Exception(f"Error fetching {self.name} entries: {str(e)}")
+
+    @timed
+    def get_entry(self, patient_id: Any, date_str: Any):
+        """Entry of a patient for a submission date, or None"""
+        return self.db.query(self.model).filter(
+            self.model.patient_id == patient_id,
+            self.model.submission_date == self.submission_date_value(date_str),
+        ).first()
+
+    def get_entry_by_id(self, entry_id: int):
+        return self.db.get(self.model, entry_id)
+
+    def check_existing_entry(self, patient_id: Any, date_str: Any) -> bool:
+        try:
+            return self.get_entry(patient_id, date_str) is not None
+        except Exception as e:
+            logger.error(f"❌ {self.label} SERVICES: Error checking entry: {e}")
+            return False
+
+    @timed
+    def get_patient_entries(self, patient_id: Any, limit: Optional[int] = None, columns: Optional[Iterable[str]] = None) -> List[Any]:
+        """A patient's entries, newest first (all of them unless `limit` is given)"""
+        try:
+            query = self._query(columns).filter(self.model.patient_id == patient_id) \
+                .order_by(self.timestamp_column.desc(), self.model.id.desc())
+            if limit is not None:
+                query = query.limit(limit)
+            return query.all()
+        except Exception as e:
+            raise Exception(f"Error fetching patient entries: {str(e)}")
+
+    @timed
+    def get_patient_page(self, patient_id: Any, page: PageParams, columns: Optional[Iterable[str]] = None) -> Tuple[List[Any], Optional[str]]:
+        """get_all_entries restricted to one patient"""
+        query = self._query(columns).filter(self.model.patient_id == patient_id)
+        return paginate(query, self.timestamp_column, self.model.id, page)
+
+    @timed
+    def get_recent_entries(self, limit: int = 50, columns: Optional[Iterable[str]] = None) -> List[Any]:
+        try:
+            return self._query(columns).order_by(self.timestamp_column.desc()).limit(limit).all()
+        except Exception as e:
+            raise Exception(f"Error fetching recent entries: {str(e)}")
+
+    @timed
+    def update_entry(self, entry_id: int, update_data: Dict[str, Any]):
+        """Apply the `updatable_fields` present in `update_data`; None if the entry does not exist"""
+        try:
+            entry = self.get_entry_by_id(entry_id)
+            if entry is None:
+                logger.warning(f"⚠️ {self.label} SERVICES: Entry {entry_id} not found for update")
+                return None
+
+            for field in self.updatable_fields:
+                if field in update_data:
+                    value = update_data[field]
+                    if field == "submission_date":
+                        value = self.submission_date_value(value)
+                    setattr(entry, field, value)
+
+            self.db.commit()
+            self.db.refresh(entry)
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"❌ {self.label} SERVICES: Error updating entry: {str(e)}")
+            raise Exception(f"Error updating {self.name} entry: {str(e)}")
+
+        return entry
+
+    @timed
+    def delete_entry(self, entry_id: int) -> bool:
+        try:
+            entry = self.get_entry_by_id(entry_id)
+            if entry is None:
+                return False
+            self.db.delete(entry)
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            raise Exception(f"Error deleting {self.name} entry: {str(e)}")
+
+        return True
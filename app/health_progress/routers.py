@@ -20,7 +20,7 @@ from app.health_progress.schemas import (
 router = APIRouter(prefix="/api/progress", tags=["progress"])
 
 @router.post("/entries", response_model=ProgressEntryResponse)
-async def create_progress_entry(
+def create_progress_entry(
     entry_data: ProgressEntryCreate,
     db: Session = Depends(get_db)
 ):
@@ -74,7 +74,7 @@ async def create_progress_entry(
 
 # NEW endpoint for general health tracker
 @router.post("/daily-entries", response_model=DailyHealthEntryResponse)
-async def create_daily_health_entry(
+def create_daily_health_entry(
     entry_data: DailyHealthEntryCreate,
     db: Session = Depends(get_db)
 ):
@@ -135,7 +135,7 @@ async def create_daily_health_entry(
 
 # Update the existing entries endpoint to handle both types
 @router.get("/entries", response_model=List[ProgressEntryResponse])
-async def get_progress_entries(
+def get_progress_entries(
     patient_id: Optional[int] = Query(None, description="Filter by patient ID"),
     surgery_type: Optional[SurgeryType] = Query(None, description="Filter by surgery type"),
     db: Session = Depends(get_db)
@@ -168,7 +168,7 @@ async def get_progress_entries(
 
 # Add endpoint to check existing entries (used by your frontend)
 @router.get("/entries/{patient_id}/{date}")
-async def check_existing_entry(
+def check_existing_entry(
     patient_id: str,
     date: str,
     db: Session = Depends(get_db)
@@ -191,7 +191,7 @@ async def check_existing_entry(
     return {"exists": False}
 
 @router.get("/dashboard-stats", response_model=DashboardStats)
-async def get_dashboard_stats(db: Session = Depends(get_db)):
+def get_dashboard_stats(db: Session = Depends(get_db)):
     """Get dashboard statistics for healthcare providers"""
     total_entries = db.query(ProgressEntry).count()
     
@@ -233,7 +233,7 @@ async def get_dashboard_stats(db: Session = Depends(get_db)):
     )
 
 @router.get("/recent-entries", response_model=List[ProgressEntryResponse])
-async def get_recent_entries(
+def get_recent_entries(
     limit: int = Query(10, description="Number of recent entries to return"),
     db: Session = Depends(get_db)
 ):
@@ -253,7 +253,7 @@ async def get_recent_entries(
     return response_entries
 
 @router.get("/patients/me/conditions", response_model=PatientConditionsResponse)
-async def get_patient_conditions(
+def get_patient_conditions(
     patient_id: int = Query(..., description="Patient ID"),
     db: Session = Depends(get_db)
 ):
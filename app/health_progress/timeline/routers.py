@@ -0,0 +1,30 @@
+# app/health_progress/timeline/routers.py
+from fastapi import APIRouter, Depends, Query
+from typing import List, Optional
+
+from app.authentication.dependencies import require_staff_or_self
+from app.health_progress.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.models import User
+from .services import PatientTimelineService
+
+router = APIRouter()
+
+def get_timeline_service():
+    return PatientTimelineService()
+
+# GET /api/patients/{patient_id}/timeline
+@router.get("/{patient_id}/timeline")
+async def get_patient_timeline(
+    patient_id: str,
+    condition: Optional[List[str]] = Query(None, description="Only these sources, e.g. kidney or medical_record"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    current_user: User = Depends(require_staff_or_self),
+    timeline_service: PatientTimelineService = Depends(get_timeline_service)
+):
+    """
+    A patient's chart in one call: entries of every tracker (prenatal and
+    postnatal included) and medical records, newest first. Staff see any
+    patient's; a patient only their own.
+    """
+    return await timeline_service.get_timeline(patient_id, conditions=condition, limit=limit, after=after)
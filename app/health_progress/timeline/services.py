@@ -0,0 +1,141 @@
+# app/health_progress/timeline/services.py
+"""
+One patient's history across every tracker and the medical record.
+
+Each source table contributes an indexed seek on (patient_id, timestamp, id)
+capped at `limit + 1` rows; the seeks run concurrently on the async engine
+(at most TIMELINE_CONCURRENCY at a time) and are merged newest first in
+(timestamp, source, id) order, the same order and cursor as the staff feed.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import Integer, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import TIMELINE_CONCURRENCY
+from app.database import AsyncSessionLocal, get_async_engine
+from app.health_progress.pagination import decode_cursor, encode_cursor, seek_after_merged, sort_key
+from app.health_progress.registry import TRACKERS, TrackerSpec, entry_to_dict
+from app.medical_record.models import MedicalRecord
+
+logger = logging.getLogger(__name__)
+
+MEDICAL_RECORD = "medical_record"
+
+
+@dataclass(frozen=True)
+class TimelineSource:
+    name: str                         # `condition_type` of its items
+    model: Any
+    timestamp_field: str
+    tracker: Optional[TrackerSpec] = None
+
+    @property
+    def timestamp_column(self):
+        return getattr(self.model, self.timestamp_field)
+
+    def patient_value(self, patient_id: str):
+        """patient_id as the column stores it; None if no row can match"""
+        if isinstance(self.model.patient_id.type, Integer):
+            return int(patient_id) if patient_id.isdigit() else None
+        return patient_id
+
+
+SOURCES = [TimelineSource(spec.condition_type, spec.model, spec.timestamp_field, spec) for spec in TRACKERS] + [
+    TimelineSource(MEDICAL_RECORD, MedicalRecord, "created_at"),
+]
+
+
+def _merge_key(sort_ts: Any) -> Any:
+    """Comparable sort value: aware timestamps (timestamptz columns) as naive UTC"""
+    if isinstance(sort_ts, datetime) and sort_ts.tzinfo is not None:
+        return sort_ts.astimezone(timezone.utc).replace(tzinfo=None)
+    return sort_ts
+
+
+def default_session_factory() -> AsyncSession:
+    return AsyncSessionLocal(bind=get_async_engine())
+
+
+class PatientTimelineService:
+    def __init__(self, session_factory: Callable[[], AsyncSession] = default_session_factory,
+                 concurrency: int = TIMELINE_CONCURRENCY):
+        self.session_factory = session_factory
+        self.concurrency = concurrency
+
+    async def get_timeline(
+        self,
+        patient_id: str,
+        conditions: Optional[Sequence[str]] = None,
+        limit: int = 100,
+        after: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """One newest-first page of everything recorded for a patient"""
+        patient_id = patient_id.strip()
+        sources = [s for s in SOURCES if not conditions or s.name in conditions]
+
+        async with self.session_factory() as probe:
+            dialect_name = probe.get_bind().dialect.name
+        cursor = decode_cursor(after, dialect_name) if after else None
+        if cursor is not None and len(cursor) != 3:
+            raise HTTPException(status_code=400, detail="Invalid cursor: wrong number of values")
+
+        limiter = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(source: TimelineSource):
+            async with limiter:
+                return await self._fetch(source, patient_id, dialect_name, limit, cursor)
+
+        branches = await asyncio.gather(*[fetch(source) for source in sources])
+        candidates = [item for branch in branches for item in branch]
+
+        # (ts DESC NULLS LAST, source DESC, id DESC): sort ascending on the inverse
+        candidates.sort(key=lambda item: (item[0] is not None, _merge_key(item[0]), item[1], item[2]), reverse=True)
+        page = candidates[:limit]
+        next_cursor = None
+        if len(candidates) > limit:
+            sort_ts, name, entry_id, _ = page[-1]
+            next_cursor = encode_cursor([_merge_key(sort_ts), name, entry_id])
+
+        entries = [data for _, _, _, data in page]
+        return {
+            "patient_id": patient_id,
+            "entries": entries,
+            "count": len(entries),
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None,
+        }
+
+    async def _fetch(self, source: TimelineSource, patient_id: str, dialect_name: str,
+                     limit: int, cursor: Optional[List[Any]]) -> List[tuple]:
+        """(sort_ts, source, id, item) of the newest `limit + 1` rows of one table"""
+        value = source.patient_value(patient_id)
+        if value is None:
+            return []
+        model = source.model
+        ts = sort_key(source.timestamp_column, dialect_name)
+        query = select(model, ts.label("sort_ts")).where(model.patient_id == value)
+        if cursor is not None:
+            query = query.where(seek_after_merged(source.name, ts, model.id, cursor))
+        query = query.order_by(ts.desc().nulls_last(), model.id.desc()).limit(limit + 1)
+
+        async with self.session_factory() as db:
+            rows = (await db.execute(query)).all()
+        return [(sort_ts, source.name, entry.id, self._item(source, entry)) for entry, sort_ts in rows]
+
+    @staticmethod
+    def _item(source: TimelineSource, entry) -> Dict[str, Any]:
+        """Feed-shaped entry: its columns plus condition_type, urgency and timestamp"""
+        data = entry_to_dict(entry)
+        timestamp = getattr(entry, source.timestamp_field)
+        data.update({
+            "condition_type": source.name,
+            "urgency": source.tracker.urgency_of(entry) if source.tracker else None,
+            "timestamp": timestamp.isoformat() if timestamp else None,
+        })
+        return data
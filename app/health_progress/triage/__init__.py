@@ -0,0 +1,2 @@
+# app/health_progress/feed/__init__.py
+# This file makes the directory a Python package
@@ -0,0 +1,39 @@
+# app/health_progress/triage/models.py
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, Integer, SmallInteger, String, UniqueConstraint, text
+
+from app.health_progress.models import Base
+
+OPEN_ITEMS = text("resolved_at IS NULL")
+
+
+class TriageItem(Base):
+    """
+    One row per tracker entry: who, which condition, how urgent, when.
+
+    Kept in sync with the tracker tables on every write, so the clinician
+    queue is one index range scan instead of a query over every tracker.
+    """
+    __tablename__ = "triage_items"
+    __table_args__ = (
+        UniqueConstraint("condition_type", "entry_id", name="uq_triage_items_entry"),
+        # Open items only, read backwards: most urgent first, newest first within a level
+        Index(
+            "ix_triage_items_open_queue", "urgency_rank", "submitted_at", "id",
+            postgresql_where=OPEN_ITEMS, sqlite_where=OPEN_ITEMS,
+        ),
+    )
+
+    id = Column(Integer, primary_key=True)
+    condition_type = Column(String(32), nullable=False)
+    entry_id = Column(Integer, nullable=False)
+    # Tracker tables use both integer and string patient ids
+    patient_id = Column(String(64), nullable=False, index=True)
+    patient_name = Column(String(255))
+    urgency = Column(String(10), nullable=False)       # low / medium / high
+    urgency_rank = Column(SmallInteger, nullable=False)  # 0 / 1 / 2, the sort key
+    submitted_at = Column(DateTime, nullable=False)
+    resolved_at = Column(DateTime)
+    resolved_by = Column(String(255))
+    created_at = Column(DateTime, default=datetime.utcnow)
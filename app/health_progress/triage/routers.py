@@ -0,0 +1,43 @@
+# app/health_progress/triage/routers.py
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from app.authentication.dependencies import require_staff
+from app.database import get_db
+from app.models import User
+from .services import TriageService
+
+router = APIRouter()
+
+def get_triage_service(db: Session = Depends(get_db)):
+    return TriageService(db)
+
+# GET /api/health-progress/triage
+@router.get("")
+def get_triage_queue(
+    urgency: Optional[List[str]] = Query(None, description="Level(s) to include: low, medium, high"),
+    condition: Optional[List[str]] = Query(None, description="Condition type(s) to include, e.g. kidney"),
+    hours: Optional[int] = Query(None, ge=1, le=24 * 90, description="Only entries submitted in the last N hours"),
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(require_staff),
+    triage_service: TriageService = Depends(get_triage_service)
+):
+    """
+    Open items across every tracker, most urgent first and newest first within
+    a level, e.g. ?urgency=high&hours=24 for today's high-urgency submissions.
+    """
+    return triage_service.get_queue(urgency=urgency, conditions=condition, hours=hours, limit=limit)
+
+# POST /api/health-progress/triage/{item_id}/resolve
+@router.post("/{item_id}/resolve")
+def resolve_triage_item(
+    item_id: int,
+    current_user: User = Depends(require_staff),
+    triage_service: TriageService = Depends(get_triage_service)
+):
+    """Take an item off the queue, recording the signed-in staff member as its resolver"""
+    item = triage_service.resolve(item_id, current_user.username)
+    if item is None:
+        raise HTTPException(status_code=404, detail="Triage item not found")
+    return item
@@ -0,0 +1,288 @@
+# app/health_progress/triage/services.py
+"""
+Materialized urgency queue over every tracker table.
+
+Each tracker write also writes its `triage_items` row, in the same
+transaction. ORM writes (repositories, async services) are caught by mapper
+events; the Core paths (daily upserts, urgency re-scoring) call
+`record_entry` / `set_urgency` (through app.health_progress.hooks). The
+hooks are installed once at startup.
+
+Entries written before the table existed are loaded with `backfill`:
+
+    python -m app.health_progress.triage.services --days 30
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import bindparam, delete, event, insert, inspect as sa_inspect, select, update
+from sqlalchemy.orm import Session
+
+from app.health_progress.registry import TRACKERS, TRACKERS_BY_MODEL, URGENCY_FROM_STATUS, TrackerSpec
+from app.health_progress.triage.models import TriageItem
+
+logger = logging.getLogger(__name__)
+
+URGENCY_RANK = {"low": 0, "medium": 1, "high": 2}
+
+_table = TriageItem.__table__
+
+
+def normalize_urgency(value: Any) -> Optional[str]:
+    """low/medium/high from an urgency level or a traffic-light status"""
+    if not isinstance(value, str):
+        return None
+    value = value.strip().lower()
+    if value in URGENCY_RANK:
+        return value
+    return URGENCY_FROM_STATUS.get(value)
+
+
+def triage_urgency(spec: TrackerSpec, data: Mapping[str, Any]) -> str:
+    """
+    Urgency of an entry from its column values. JSON-payload trackers carry
+    the patient-facing status in common_data; entries without any signal
+    are queued as low.
+    """
+    if spec.urgency_field:
+        level = normalize_urgency(data.get(spec.urgency_field))
+    elif spec.status_field:
+        level = normalize_urgency(data.get(spec.status_field))
+    else:
+        common = data.get("common_data")
+        level = normalize_urgency(common.get("status")) if isinstance(common, dict) else None
+    return level or "low"
+
+
+def _item_values(spec: TrackerSpec, data: Mapping[str, Any], partial: bool = False) -> Dict[str, Any]:
+    """
+    triage_items columns for an entry. With `partial`, only columns whose
+    source values are present in `data` (an update may load only what changed).
+    """
+    values: Dict[str, Any] = {}
+    if not partial or "patient_id" in data:
+        values["patient_id"] = str(data.get("patient_id"))
+    if not partial or "patient_name" in data:
+        values["patient_name"] = data.get("patient_name")
+
+    source = spec.urgency_field or spec.status_field or "common_data"
+    if not partial or source in data:
+        level = triage_urgency(spec, data)
+        values.update(urgency=level, urgency_rank=URGENCY_RANK[level])
+
+    timestamp = data.get(spec.timestamp_field)
+    if isinstance(timestamp, datetime):
+        values["submitted_at"] = timestamp
+    elif not partial:
+        # Server-side defaults (and entries saved without a timestamp) are not known yet
+        values["submitted_at"] = datetime.utcnow()
+    return values
+
+
+def _write(connection, spec: TrackerSpec, entry_id: int, data: Mapping[str, Any], is_new: bool):
+    key = (_table.c.condition_type == spec.condition_type) & (_table.c.entry_id == entry_id)
+    if not is_new:
+        values = _item_values(spec, data, partial=True)
+        if values and connection.execute(update(_table).where(key).values(**values)).rowcount:
+            return
+        if len(values) < len(_item_values(spec, data)):
+            # No triage row yet (entry predates the table) and not enough loaded to create one
+            return
+    connection.execute(insert(_table).values(
+        condition_type=spec.condition_type, entry_id=entry_id, **_item_values(spec, data)
+    ))
+
+
+# ---------------------------------------------------------------- write hooks
+
+def _after_insert(mapper, connection, target):
+    spec = TRACKERS_BY_MODEL[mapper.class_]
+    _write(connection, spec, target.id, sa_inspect(target).dict, is_new=True)
+
+
+def _after_update(mapper, connection, target):
+    spec = TRACKERS_BY_MODEL[mapper.class_]
+    _write(connection, spec, target.id, sa_inspect(target).dict, is_new=False)
+
+
+def _after_delete(mapper, connection, target):
+    spec = TRACKERS_BY_MODEL[mapper.class_]
+    connection.execute(delete(_table).where(
+        _table.c.condition_type == spec.condition_type, _table.c.entry_id == target.id
+    ))
+
+
+_HOOKS = (("after_insert", _after_insert), ("after_update", _after_update), ("after_delete", _after_delete))
+
+
+def install_triage_hooks():
+    """Keep triage_items in step with every ORM write to a tracker table (idempotent)"""
+    for spec in TRACKERS:
+        for name, hook in _HOOKS:
+            if not event.contains(spec.model, name, hook):
+                event.listen(spec.model, name, hook)
+
+
+def remove_triage_hooks():
+    for spec in TRACKERS:
+        for name, hook in _HOOKS:
+            if event.contains(spec.model, name, hook):
+                event.remove(spec.model, name, hook)
+
+
+def hooks_installed() -> bool:
+    return event.contains(TRACKERS[0].model, "after_insert", _after_insert)
+
+
+def record_entry(db: Session, model, entry):
+    """Triage row for an entry saved with a Core statement (no mapper events fire)"""
+    if not hooks_installed():
+        return
+    spec = TRACKERS_BY_MODEL[model]
+    data = {attr.key: getattr(entry, attr.key) for attr in sa_inspect(model).column_attrs}
+    _write(db.connection(), spec, entry.id, data, is_new=False)
+
+
+def record_entries(db: Session, model, entries: Sequence[Any]):
+    """Triage rows for new entries inserted in bulk, in one executemany"""
+    if not hooks_installed() or not entries:
+        return
+    spec = TRACKERS_BY_MODEL[model]
+    attrs = [attr.key for attr in sa_inspect(model).column_attrs]
+    db.connection().execute(insert(_table), [
+        {
+            "condition_type": spec.condition_type,
+            "entry_id": entry.id,
+            **_item_values(spec, {key: getattr(entry, key) for key in attrs}),
+        }
+        for entry in entries
+    ])
+
+
+def set_urgency(db: Session, condition_type: str, levels: Sequence[Tuple[int, str]]):
+    """Bulk urgency change of (entry_id, level) pairs, e.g. after a re-score"""
+    if not hooks_installed() or not levels:
+        return
+    stmt = (
+        update(_table)
+        .where(_table.c.condition_type == condition_type, _table.c.entry_id == bindparam("b_entry_id"))
+        .values(urgency=bindparam("b_urgency"), urgency_rank=bindparam("b_rank"))
+    )
+    db.connection().execute(stmt, [
+        {"b_entry_id": entry_id, "b_urgency": level, "b_rank": URGENCY_RANK[level]}
+        for entry_id, level in levels
+    ])
+
+
+def backfill(db: Session, days: Optional[int] = 30, conditions: Optional[Iterable[str]] = None,
+             chunk_size: int = 5000) -> int:
+    """
+    Queue entries that have no triage row yet (submitted in the last `days`,
+    or all of them when `days` is None). Returns the number of rows added.
+    """
+    since = datetime.utcnow() - timedelta(days=days) if days else None
+    added = 0
+    for spec in TRACKERS:
+        if conditions and spec.condition_type not in conditions:
+            continue
+        model = spec.model
+        queued = select(_table.c.entry_id).where(_table.c.condition_type == spec.condition_type)
+        query = select(*model.__table__.columns).where(model.id.not_in(queued))
+        if since is not None:
+            query = query.where(spec.timestamp_column >= since)
+
+        last_id = 0
+        while True:
+            rows = db.execute(query.where(model.id > last_id).order_by(model.id).limit(chunk_size)).mappings().all()
+            if not rows:
+                break
+            db.execute(insert(_table), [
+                {"condition_type": spec.condition_type, "entry_id": row["id"], **_item_values(spec, row)}
+                for row in rows
+            ])
+            db.commit()
+            added += len(rows)
+            last_id = rows[-1]["id"]
+
+    logger.info(f"🚑 TRIAGE: Backfilled {added} entries")
+    return added
+
+
+# ---------------------------------------------------------------- queue
+
+class TriageService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_queue(
+        self,
+        urgency: Optional[Iterable[str]] = None,
+        conditions: Optional[Iterable[str]] = None,
+        hours: Optional[int] = None,
+        limit: int = 50,
+    ) -> Dict[str, Any]:
+        """
+        Open items, most urgent first and newest first within a level. Served
+        from the partial (urgency_rank, submitted_at) index: the cost depends
+        on `limit`, not on how many entries exist.
+        """
+        query = select(TriageItem).where(TriageItem.resolved_at.is_(None))
+        if urgency:
+            ranks = [URGENCY_RANK[level] for level in urgency if level in URGENCY_RANK]
+            query = query.where(TriageItem.urgency_rank.in_(ranks))
+        if conditions:
+            query = query.where(TriageItem.condition_type.in_(list(conditions)))
+        if hours:
+            query = query.where(TriageItem.submitted_at >= datetime.utcnow() - timedelta(hours=hours))
+
+        items = self.db.scalars(
+            query.order_by(
+                TriageItem.urgency_rank.desc(), TriageItem.submitted_at.desc(), TriageItem.id.desc()
+            ).limit(limit)
+        ).all()
+        data = [item_to_dict(item) for item in items]
+        return {"items": data, "count": len(data)}
+
+    def resolve(self, item_id: int, resolved_by: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Take an item off the queue; None if it does not exist"""
+        item = self.db.get(TriageItem, item_id)
+        if item is None:
+            return None
+        if item.resolved_at is None:
+            item.resolved_at = datetime.utcnow()
+            item.resolved_by = resolved_by
+            self.db.commit()
+            logger.info(f"✅ TRIAGE: Item {item_id} resolved")
+        return item_to_dict(item)
+
+
+def item_to_dict(item: TriageItem) -> Dict[str, Any]:
+    return {
+        "id": item.id,
+        "condition_type": item.condition_type,
+        "entry_id": item.entry_id,
+        "patient_id": item.patient_id,
+        "patient_name": item.patient_name,
+        "urgency": item.urgency,
+        "submitted_at": item.submitted_at.isoformat() if item.submitted_at else None,
+        "resolved_at": item.resolved_at.isoformat() if item.resolved_at else None,
+        "resolved_by": item.resolved_by,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from app.database import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Queue tracker entries that have no triage row yet")
+    parser.add_argument("conditions", nargs="*", help="condition types (default: every tracker)")
+    parser.add_argument("--days", type=int, default=30, help="only entries from the last N days (0: all)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        print(f"{backfill(db, days=args.days or None, conditions=args.conditions)} entries queued")
+    finally:
+        db.close()
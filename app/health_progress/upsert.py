@@ -0,0 +1,101 @@
+# app/health_progress/upsert.py
+"""
+One-statement save for trackers that keep a single entry per patient per day.
+
+ON CONFLICT needs the unique (patient_id, submission_date) index of the
+table; where a database does not have it yet (migration not applied) the
+save falls back to a select-then-write.
+"""
+import logging
+import weakref
+from datetime import date
+from typing import Any, Dict, Iterable, Set
+
+from pydantic import BaseModel
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import Session
+
+from app.health_progress.hooks import core_write
+
+logger = logging.getLogger(__name__)
+
+DAILY_KEY = ("patient_id", "submission_date")
+
+# engine -> {table name: has a unique DAILY_KEY index}, looked up once per table
+_daily_key_unique: "weakref.WeakKeyDictionary[Any, Dict[str, bool]]" = weakref.WeakKeyDictionary()
+
+
+def schema_values(entry: BaseModel, model, **overrides) -> Dict[str, Any]:
+    """Column values of `model` taken from a Pydantic payload (unknown fields are dropped)"""
+    columns = model.__table__.columns
+    values = {k: v for k, v in entry.model_dump().items() if k in columns}
+    values.update(overrides)
+    if isinstance(values.get("submission_date"), date):
+        # submission_date columns are strings; keep one canonical format for the unique key
+        values["submission_date"] = values["submission_date"].isoformat()
+    return values
+
+
+def upsert_daily_entry(db: Session, model, values: Dict[str, Any], insert_only: Iterable[str] = ()):
+    """
+    INSERT ... ON CONFLICT (patient_id, submission_date) DO UPDATE ... RETURNING.
+
+    Columns in `insert_only` keep the value of the first submission of the day.
+    Returns the saved row. Dialects without ON CONFLICT, and tables without
+    the unique index, fall back to a select-then-write.
+    """
+    bind = db.get_bind()
+    dialect_name = bind.dialect.name
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return _select_then_write(db, model, values, insert_only)
+    if not has_daily_unique_index(bind, model.__tablename__):
+        return _select_then_write(db, model, values, insert_only)
+
+    stmt = insert(model).values(**values)
+    keep = set(DAILY_KEY) | set(insert_only)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(DAILY_KEY),
+        set_={name: stmt.excluded[name] for name in values if name not in keep},
+    ).returning(model)
+
+    saved = db.scalars(stmt, execution_options={"populate_existing": True}).one()
+    # Detach first so the row RETURNING loaded is not expired (and re-selected) by commit
+    db.expunge(saved)
+    # Core statement: mapper and flush events do not fire
+    core_write(db, model, saved)
+    db.commit()
+    return saved
+
+
+def has_daily_unique_index(bind, table: str) -> bool:
+    """Whether `table` has a unique index or constraint on exactly DAILY_KEY (cached per engine)"""
+    engine = getattr(bind, "engine", bind)
+    tables = _daily_key_unique.setdefault(engine, {})
+    if table not in tables:
+        inspector = sa_inspect(engine)
+        unique_keys = [i["column_names"] for i in inspector.get_indexes(table) if i.get("unique")]
+        unique_keys += [c["column_names"] for c in inspector.get_unique_constraints(table)]
+        tables[table] = any(set(columns) == set(DAILY_KEY) for columns in unique_keys)
+        if not tables[table]:
+            logger.warning(f"⚠️ {table} has no unique (patient_id, submission_date) index; "
+                           f"daily saves use select-then-write until the migration is applied")
+    return tables[table]
+
+
+def _select_then_write(db: Session, model, values: Dict[str, Any], insert_only: Iterable[str]):
+    existing = db.query(model).filter(*[getattr(model, k) == values[k] for k in DAILY_KEY]).first()
+    if existing:
+        for name, value in values.items():
+            if name not in insert_only:
+                setattr(existing, name, value)
+        saved = existing
+    else:
+        saved = model(**values)
+        db.add(saved)
+    db.commit()
+    db.refresh(saved)
+    return saved
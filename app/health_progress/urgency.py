@@ -0,0 +1,269 @@
+# app/health_progress/urgency.py
+"""
+Table-driven urgency scoring for tracker entries.
+
+Each condition is a list of rules; every rule turns one field into points and
+the total maps onto low/medium/high. Rules work on whole columns (NumPy
+arrays), so scoring one submission and re-scoring a year of rows go through
+the same code:
+
+    urgency_level("kidney", entry_data)              # one dict -> "medium"
+    urgency_levels("kidney", {"swelling_level": [...], ...})   # arrays
+    rescore(db, "kidney")                            # backfill stored urgency_status
+
+Missing, empty or unparseable values score no points. Blood pressures are
+stored as strings; each distinct string is parsed once per batch.
+"""
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+LEVELS = np.array(["low", "medium", "high"])
+
+
+def _as_array(values: Sequence[Any]) -> np.ndarray:
+    arr = np.asarray(values)
+    if arr.ndim != 1:
+        # np.asarray turns a list of lists/dicts into something else; keep one object per row
+        arr = np.empty(len(values), dtype=object)
+        arr[:] = list(values)
+    return arr
+
+
+def _parse_number(text: str) -> float:
+    try:
+        return float(text)
+    except ValueError:
+        return np.nan
+
+
+def numeric(values: Sequence[Any]) -> np.ndarray:
+    """Float column; None, '' and non-numbers become NaN"""
+    arr = _as_array(values)
+    if arr.dtype.kind in "iufb":
+        return arr.astype(float)
+    uniques, inverse = np.unique(_strings(arr), return_inverse=True)
+    parsed = np.array([_parse_number(u) for u in uniques], dtype=float)
+    return parsed[inverse.reshape(-1)]
+
+
+def _strings(arr: np.ndarray) -> np.ndarray:
+    if arr.dtype == object:
+        arr = np.where(np.equal(arr, None), "", arr)
+    return arr.astype(str)
+
+
+def text(values: Sequence[Any]) -> np.ndarray:
+    """Lower-cased string column; None becomes ''"""
+    return np.char.lower(_strings(_as_array(values)))
+
+
+@dataclass(frozen=True)
+class AtLeast:
+    """Points for the first threshold the value reaches (thresholds high to low)"""
+    field: str
+    steps: Tuple[Tuple[float, int], ...]
+
+    def points(self, column: Sequence[Any]) -> np.ndarray:
+        values = numeric(column)
+        return np.select([values >= bound for bound, _ in self.steps], [p for _, p in self.steps], 0)
+
+
+@dataclass(frozen=True)
+class AtMost:
+    """Points for the first threshold the value is at or below (thresholds low to high)"""
+    field: str
+    steps: Tuple[Tuple[float, int], ...]
+
+    def points(self, column: Sequence[Any]) -> np.ndarray:
+        values = numeric(column)
+        return np.select([values <= bound for bound, _ in self.steps], [p for _, p in self.steps], 0)
+
+
+@dataclass(frozen=True)
+class Equals:
+    """Points for exact (case-insensitive) values"""
+    field: str
+    values: Tuple[Tuple[str, int], ...]
+
+    def points(self, column: Sequence[Any]) -> np.ndarray:
+        values = text(column)
+        return np.select([values == v for v, _ in self.values], [p for _, p in self.values], 0)
+
+
+@dataclass(frozen=True)
+class Contains:
+    """Points for the first group of substrings found in the (case-insensitive) value"""
+    field: str
+    groups: Tuple[Tuple[Tuple[str, ...], int], ...]
+
+    def points(self, column: Sequence[Any]) -> np.ndarray:
+        values = text(column)
+        conditions = [
+            np.logical_or.reduce([np.char.find(values, needle) >= 0 for needle in needles])
+            for needles, _ in self.groups
+        ]
+        return np.select(conditions, [p for _, p in self.groups], 0)
+
+
+@dataclass(frozen=True)
+class UrgencyRules:
+    rules: Tuple[Any, ...]
+    medium_at: int
+    high_at: int
+
+    @property
+    def fields(self) -> List[str]:
+        return list(dict.fromkeys(rule.field for rule in self.rules))
+
+    def scores(self, columns: Mapping[str, Sequence[Any]], size: int) -> np.ndarray:
+        total = np.zeros(size, dtype=int)
+        for rule in self.rules:
+            column = columns.get(rule.field)
+            if column is not None:
+                total += rule.points(column)
+        return total
+
+    def levels(self, scores: np.ndarray) -> np.ndarray:
+        return LEVELS[(scores >= self.medium_at).astype(int) + (scores >= self.high_at).astype(int)]
+
+
+# Building blocks shared across conditions
+SEVERITY_0_10 = ((8, 3), (6, 2), (4, 1))
+
+RULES: Dict[str, UrgencyRules] = {
+    "kidney": UrgencyRules(
+        rules=(
+            # Hypertensive crisis / stage 2 / stage 1
+            AtLeast("blood_pressure_systolic", ((180, 3), (160, 2), (140, 1))),
+            AtLeast("blood_pressure_diastolic", ((120, 3), (100, 2), (90, 1))),
+            # Fluid overload
+            AtLeast("breathing_difficulty", SEVERITY_0_10),
+            AtLeast("swelling_level", ((8, 2), (6, 1))),
+            # Kidney function
+            Contains("urine_output", ((("less", "decreased"), 2), (("very low", "none"), 3))),
+            AtLeast("fatigue_level", ((8, 1),)),
+            AtLeast("nausea_level", ((8, 2),)),  # can indicate uremia
+            AtLeast("itching_level", ((8, 1),)),
+        ),
+        medium_at=3,
+        high_at=6,
+    ),
+    "cancer": UrgencyRules(
+        rules=(
+            AtLeast("pain_level", SEVERITY_0_10),
+            AtLeast("side_effects", SEVERITY_0_10),
+            AtLeast("blood_pressure_systolic", ((180, 2), (160, 1))),
+            AtLeast("blood_pressure_diastolic", ((120, 2), (100, 1))),
+            AtMost("energy_level", ((3, 1),)),  # treatment fatigue
+        ),
+        medium_at=3,
+        high_at=6,
+    ),
+    "general_health": UrgencyRules(
+        rules=(
+            Equals("health_trend", (("significantly_worse", 3), ("slightly_worse", 1))),
+            AtMost("overall_wellbeing", ((2, 3), (4, 1))),
+            AtLeast("primary_symptom_severity", ((9, 3), (7, 2), (5, 1))),
+        ),
+        medium_at=3,
+        high_at=5,
+    ),
+}
+
+
+def get_rules(condition_type: str) -> UrgencyRules:
+    try:
+        return RULES[condition_type]
+    except KeyError:
+        raise ValueError(f"No urgency rules for condition {condition_type!r}")
+
+
+def urgency_levels(condition_type: str, columns: Mapping[str, Sequence[Any]]) -> np.ndarray:
+    """low/medium/high for every row of `columns` (field name -> values, equal lengths)"""
+    rules = get_rules(condition_type)
+    size = len(next(iter(columns.values()))) if columns else 0
+    return rules.levels(rules.scores(columns, size))
+
+
+def urgency_level(condition_type: str, entry_data: Mapping[str, Any]) -> str:
+    """Urgency of one submission"""
+    rules = get_rules(condition_type)
+    columns = {name: [entry_data.get(name)] for name in rules.fields}
+    return str(rules.levels(rules.scores(columns, 1))[0])
+
+
+def entry_columns(condition_type: str, entries: Iterable[Any]) -> Dict[str, List[Any]]:
+    """Rule input columns of loaded ORM entries"""
+    entries = list(entries)
+    return {name: [getattr(entry, name) for entry in entries] for name in get_rules(condition_type).fields}
+
+
+def rescore(db, condition_type: str, chunk_size: int = 10000) -> int:
+    """
+    Recompute urgency_status of every stored entry of a condition, e.g. after a
+    rule change. Reads id-ordered chunks of only the rule columns and writes
+    back only rows whose level changed. Returns the number of rows updated.
+    """
+    from sqlalchemy import select, update
+
+    from app.health_progress.registry import get_tracker
+    from app.health_progress.hooks import bulk_urgency_write
+
+    spec = get_tracker(condition_type)
+    rules = get_rules(condition_type)
+    model = spec.model
+    field_columns = [getattr(model, name) for name in rules.fields]
+
+    last_id, changed = 0, 0
+    while True:
+        rows = db.execute(
+            select(model.id, model.urgency_status, *field_columns)
+            .where(model.id > last_id)
+            .order_by(model.id)
+            .limit(chunk_size)
+        ).all()
+        if not rows:
+            break
+
+        ids, current, *values = zip(*rows)
+        levels = rules.levels(rules.scores(dict(zip(rules.fields, values)), len(rows)))
+        updates = [
+            {"id": entry_id, "urgency_status": str(level)}
+            for entry_id, old, level in zip(ids, current, levels)
+            if old != level
+        ]
+        if updates:
+            # ORM bulk UPDATE by primary key: one executemany per chunk
+            db.execute(update(model), updates)
+            # Bulk UPDATE skips mapper events; update triage and versions explicitly
+            bulk_urgency_write(db, condition_type, [(u["id"], u["urgency_status"]) for u in updates])
+        db.commit()
+        changed += len(updates)
+        last_id = ids[-1]
+
+    logger.info(f"🔁 URGENCY: Re-scored {condition_type}, {changed} entries changed")
+    return changed
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from app.database import SessionLocal
+    from app.health_progress.hooks import install_write_hooks
+
+    parser = argparse.ArgumentParser(description="Re-score stored urgency_status after a rule change")
+    parser.add_argument("conditions", nargs="*", default=list(RULES), help=f"default: {' '.join(RULES)}")
+    args = parser.parse_args()
+
+    install_write_hooks()
+    db = SessionLocal()
+    try:
+        for condition in args.conditions:
+            print(f"{condition}: {rescore(db, condition)} entries changed")
+    finally:
+        db.close()
@@ -1,9 +1,13 @@
 from app.database import Base
-from sqlalchemy import Column, Integer, String, JSON, DateTime
+from sqlalchemy import Column, Integer, String, JSON, DateTime, Index
 from datetime import datetime
+from app.health_progress.pagination import keyset_indexes
 
 class UrologicalSurgeryEntry(Base):
     __tablename__ = "urological_surgery_entries"
+    __table_args__ = keyset_indexes("urological_surgery_entries", "created_at") + (
+        Index("ix_urological_surgery_entries_patient_day", "patient_id", "submission_date"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     patient_id = Column(Integer)
@@ -1,17 +1,19 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
+from app.health_progress.pagination import PageParams, page_params
+from app.health_progress.versions.conditional import entries_etag, patient_etag
 from . import services, schemas
 
 router = APIRouter(prefix="/urological", tags=["Urological Progress"])
 
-def get_urological_service(db: Session = Depends(get_db)):
-    return services.UrologicalProgressService(db)
+def get_urological_service(db: AsyncSession = Depends(get_async_db)):
+    return services.AsyncUrologicalProgressService(db)
 
 @router.post("/entries", response_model=schemas.UrologicalEntryResponse)
 async def create_urological_entry(
     entry_data: schemas.UrologicalEntryCreate,
-    urological_service: services.UrologicalProgressService = Depends(get_urological_service)
+    urological_service: services.AsyncUrologicalProgressService = Depends(get_urological_service)
 ):
     """
     Create a new urological surgery progress entry
@@ -28,7 +30,7 @@ async def create_urological_entry(
             'condition_data': entry_data.condition_data.dict()
         }
         
-        db_entry = urological_service.create_entry(service_data)
+        db_entry = await urological_service.create_entry(service_data)
         
         return schemas.UrologicalEntryResponse(
             id=db_entry.id,
@@ -45,16 +47,17 @@ async def create_urological_entry(
         print("❌ UROLOGICAL POST Error:", str(e))
         raise HTTPException(status_code=500, detail=f"Failed to create urological progress entry: {str(e)}")
 
-@router.get("/entries")
+@router.get("/entries", dependencies=[Depends(entries_etag("urological"))])
 async def get_all_urological_entries(
-    urological_service: services.UrologicalProgressService = Depends(get_urological_service)
+    page: PageParams = Depends(page_params),
+    urological_service: services.AsyncUrologicalProgressService = Depends(get_urological_service)
 ):
     """
     Get ALL urological surgery entries
     """
     try:
         print("🔍 UROLOGICAL: Fetching all entries")
-        entries = urological_service.get_all_entries()
+        entries, next_cursor = await urological_service.get_all_entries(page)
         
         formatted_entries = []
         for entry in entries:
@@ -74,6 +77,7 @@ async def get_all_urological_entries(
         return {
             "entries": formatted_entries,
             "total": len(entries),
+            "next_cursor": next_cursor,
             "surgery_type": "urological"
         }
         
@@ -81,18 +85,18 @@ async def get_all_urological_entries(
         print(f"❌ UROLOGICAL: Error retrieving all entries: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error retrieving urological entries: {str(e)}")
 
-@router.get("/entries/{patient_id}/{date}")
+@router.get("/entries/{patient_id}/{date}", dependencies=[Depends(patient_etag("urological"))])
 async def check_urological_entry(
     patient_id: int, 
     date: str,
-    urological_service: services.UrologicalProgressService = Depends(get_urological_service)
+    urological_service: services.AsyncUrologicalProgressService = Depends(get_urological_service)
 ):
     """
     Check if urological entry exists for patient on specific date
     """
     try:
         print(f"🔍 UROLOGICAL: Checking entry for patient {patient_id} on {date}")
-        exists = urological_service.check_existing_entry(patient_id, date)
+        exists = await urological_service.check_existing_entry(patient_id, date)
         return {"exists": exists}
         
     except Exception as e:
@@ -0,0 +1,110 @@
+# app/health_progress/versions/conditional.py
+"""
+Conditional GET for tracker reads.
+
+    @router.get("/entries", dependencies=[Depends(entries_etag("kidney"))])
+    @router.get("/patient/{patient_id}", dependencies=[Depends(patient_etag("kidney"))])
+
+The dependency looks up the version counters the response depends on. When
+the client's If-None-Match (or If-Modified-Since) still matches it answers
+304 before the endpoint runs; otherwise it sets ETag / Last-Modified on the
+endpoint's response. The ETag also covers the URL, so each page, filter and
+patient gets its own.
+"""
+import hashlib
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+
+# Clients may keep the body but must revalidate before every use
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(request: Request, versions: Dict[str, Tuple[int, Optional[datetime]]]) -> str:
+    key = "|".join([request.url.path, str(sorted(request.query_params.multi_items()))] +
+                   [f"{scope}={version}" for scope, (version, _) in sorted(versions.items())])
+    return '"' + hashlib.sha1(key.encode()).hexdigest()[:24] + '"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison, as If-None-Match requires"""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return etag in [tag[2:] if tag.startswith("W/") else tag for tag in candidates]
+
+
+def last_modified(versions: Dict[str, Tuple[int, Optional[datetime]]], now: datetime) -> Optional[datetime]:
+    """
+    Newest write, to the second. Withheld while that second is still running:
+    a second write within it would otherwise share the timestamp and be
+    answered with 304.
+    """
+    stamps = [updated_at for _, updated_at in versions.values() if updated_at]
+    if not stamps:
+        return None
+    newest = max(stamps).replace(microsecond=0)
+    return newest if now - newest >= timedelta(seconds=1) else None
+
+
+def not_modified_since(header: str, modified: Optional[datetime]) -> bool:
+    if modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is not None:
+        since = since.astimezone(timezone.utc).replace(tzinfo=None)
+    return modified <= since
+
+
+def conditional_get(request: Request, response: Response, db: Session, scopes: List[str]):
+    from app.health_progress.versions.services import current_versions
+
+    versions = current_versions(db, scopes)
+    etag = make_etag(request, versions)
+    modified = last_modified(versions, datetime.utcnow())
+
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if modified is not None:
+        headers["Last-Modified"] = format_datetime(modified.replace(tzinfo=timezone.utc), usegmt=True)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        unchanged = etag_matches(if_none_match, etag)
+    else:
+        unchanged = not_modified_since(request.headers.get("if-modified-since", ""), modified)
+    if unchanged:
+        # Starlette sends 304s without a body
+        raise HTTPException(status_code=304, headers=headers)
+    response.headers.update(headers)
+
+
+# Tracker routers import this module while the registry (which imports the
+# tracker packages) may still be loading: registry lookups wait for a request
+
+def entries_etag(condition_type: str):
+    """Dependency for listings of a whole tracker table"""
+    def dependency(request: Request, response: Response, db: Session = Depends(get_db)):
+        from app.health_progress.versions.services import table_scope
+
+        conditional_get(request, response, db, [table_scope(condition_type)])
+    return dependency
+
+
+def patient_etag(condition_type: str):
+    """Dependency for endpoints that read one patient's entries (needs a `patient_id` path parameter)"""
+    def dependency(patient_id: str, request: Request, response: Response, db: Session = Depends(get_db)):
+        from app.health_progress.registry import get_tracker
+        from app.health_progress.versions.services import patient_scope, patients_scope
+
+        conditional_get(request, response, db, [
+            patient_scope(get_tracker(condition_type), patient_id), patients_scope(condition_type),
+        ])
+    return dependency
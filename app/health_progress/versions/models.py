@@ -0,0 +1,18 @@
+# app/health_progress/versions/models.py
+from sqlalchemy import BigInteger, Column, DateTime, String
+
+from app.health_progress.models import Base
+
+
+class TrackerVersion(Base):
+    """
+    Write counter of one slice of tracker data, bumped in the transaction of
+    every write to it. Scopes: "<condition>" (the whole table),
+    "<condition>:patient:<id>" (one patient) and "<condition>:patients"
+    (every patient at once, for bulk writes).
+    """
+    __tablename__ = "tracker_versions"
+
+    scope = Column(String(160), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime)
@@ -0,0 +1,154 @@
+# app/health_progress/versions/services.py
+"""
+Version counters for tracker data, the basis of conditional GETs.
+
+A flush hook bumps the table scope and the patient scope of every tracker row
+a transaction inserts, updates or deletes. Readers fetch the counters of the
+scopes a response depends on (a primary-key lookup) and derive its ETag from
+them: unchanged counters mean an unchanged response.
+
+Writes that bypass the ORM bump explicitly (`bump_entry`, `bump_condition`).
+Programs other than the server that change tracker rows must install the
+write hooks first (see app.health_progress.hooks), or clients keep getting
+304s for data that changed.
+"""
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import Integer, event, inspect as sa_inspect, select, update
+from sqlalchemy.orm import Session
+
+from app.health_progress.registry import TRACKERS_BY_MODEL, TrackerSpec
+from app.health_progress.versions.models import TrackerVersion
+
+logger = logging.getLogger(__name__)
+
+_table = TrackerVersion.__table__
+
+
+def table_scope(condition_type: str) -> str:
+    return condition_type
+
+
+def patients_scope(condition_type: str) -> str:
+    return f"{condition_type}:patients"
+
+
+def patient_scope(spec: TrackerSpec, patient_id: Any) -> str:
+    """Scope of one patient; ids are normalized the way the column stores them ("007" -> "7")"""
+    value = str(patient_id).strip()
+    if isinstance(spec.model.patient_id.type, Integer) and value.isdigit():
+        value = str(int(value))
+    return f"{spec.condition_type}:patient:{value}"
+
+
+def bump(connection, scopes: Iterable[str]):
+    """+1 on every scope, creating missing ones; scopes are locked in sorted order"""
+    scopes = sorted(set(scopes))
+    if not scopes:
+        return
+    now = datetime.utcnow()
+    dialect_name = connection.dialect.name
+    if dialect_name in ("postgresql", "sqlite"):
+        if dialect_name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        stmt = insert(_table).values([{"scope": s, "version": 1, "updated_at": now} for s in scopes])
+        connection.execute(stmt.on_conflict_do_update(
+            index_elements=["scope"],
+            set_={"version": _table.c.version + 1, "updated_at": stmt.excluded.updated_at},
+        ))
+        return
+
+    existing = set(connection.execute(select(_table.c.scope).where(_table.c.scope.in_(scopes))).scalars())
+    if existing:
+        connection.execute(
+            update(_table).where(_table.c.scope.in_(existing)).values(version=_table.c.version + 1, updated_at=now)
+        )
+    missing = [s for s in scopes if s not in existing]
+    if missing:
+        connection.execute(_table.insert(), [{"scope": s, "version": 1, "updated_at": now} for s in missing])
+
+
+def current_versions(db: Session, scopes: Iterable[str]) -> Dict[str, Tuple[int, Optional[datetime]]]:
+    """scope -> (version, last write time); never-written scopes are (0, None)"""
+    scopes = list(scopes)
+    rows = db.execute(
+        select(_table.c.scope, _table.c.version, _table.c.updated_at).where(_table.c.scope.in_(scopes))
+    ).all()
+    found = {row.scope: (row.version, row.updated_at) for row in rows}
+    return {scope: found.get(scope, (0, None)) for scope in scopes}
+
+
+# ---------------------------------------------------------------- write hooks
+
+def _entry_scopes(connection, spec: TrackerSpec, obj, deleted: bool) -> List[str]:
+    scopes = [table_scope(spec.condition_type)]
+    history = sa_inspect(obj).attrs.patient_id.history
+    patient_ids = [p for p in (*history.added, *history.unchanged, *history.deleted) if p is not None]
+    if not patient_ids and not deleted:
+        # Not loaded (e.g. an update of an expired row): ask the database, never lazy-load mid-flush
+        patient_ids = [connection.execute(
+            select(spec.model.patient_id).where(spec.model.id == obj.id)
+        ).scalar()]
+    if patient_ids:
+        scopes += [patient_scope(spec, p) for p in patient_ids]
+    else:
+        scopes.append(patients_scope(spec.condition_type))
+    return scopes
+
+
+def _after_flush(session, flush_context):
+    scopes = []
+    connection = None
+    for objects, deleted in ((session.new, False), (session.dirty, False), (session.deleted, True)):
+        for obj in objects:
+            spec = TRACKERS_BY_MODEL.get(type(obj))
+            if spec is None or (obj in session.dirty and not session.is_modified(obj)):
+                continue
+            connection = connection or session.connection()
+            scopes += _entry_scopes(connection, spec, obj, deleted)
+    if scopes:
+        bump(connection, scopes)
+
+
+def install_version_hooks():
+    """Bump version counters for every tracker write of every session (idempotent)"""
+    if not event.contains(Session, "after_flush", _after_flush):
+        event.listen(Session, "after_flush", _after_flush)
+
+
+def remove_version_hooks():
+    if event.contains(Session, "after_flush", _after_flush):
+        event.remove(Session, "after_flush", _after_flush)
+
+
+def hooks_installed() -> bool:
+    return event.contains(Session, "after_flush", _after_flush)
+
+
+def bump_entry(db: Session, model, entry):
+    """Counters for a row written with a Core statement"""
+    spec = TRACKERS_BY_MODEL.get(model)
+    if spec is None or not hooks_installed():
+        return
+    bump(db.connection(), [table_scope(spec.condition_type), patient_scope(spec, entry.patient_id)])
+
+
+def bump_entries(db: Session, model, entries: Iterable[Any]):
+    """Counters for many rows inserted with one Core statement"""
+    spec = TRACKERS_BY_MODEL.get(model)
+    if spec is None or not hooks_installed():
+        return
+    scopes = [table_scope(spec.condition_type)]
+    scopes += [patient_scope(spec, entry.patient_id) for entry in entries]
+    bump(db.connection(), scopes)
+
+
+def bump_condition(db: Session, condition_type: str):
+    """Invalidate every cached view of a condition (bulk updates, manual fixes)"""
+    if not hooks_installed():
+        return
+    bump(db.connection(), [table_scope(condition_type), patients_scope(condition_type)])
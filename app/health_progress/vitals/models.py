@@ -0,0 +1,32 @@
+# app/health_progress/vitals/models.py
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String, UniqueConstraint
+
+from app.health_progress.models import Base
+
+
+class VitalObservation(Base):
+    """
+    One numeric vital sign taken from a tracker entry.
+
+    Trackers keep vitals as strings and inside JSON blobs under several
+    spellings; this table holds them parsed, in one unit per vital, so a trend
+    is an index range aggregation instead of a parse of every entry.
+    """
+    __tablename__ = "vital_observations"
+    __table_args__ = (
+        UniqueConstraint("condition_type", "entry_id", "vital", name="uq_vital_observations_entry_vital"),
+        # Trend queries: one patient, one vital, a time range (value for index-only scans)
+        Index(
+            "ix_vital_observations_patient_vital_time", "patient_id", "vital", "observed_at",
+            postgresql_include=["value"],
+        ),
+    )
+
+    id = Column(Integer, primary_key=True)
+    condition_type = Column(String(32), nullable=False)
+    entry_id = Column(Integer, nullable=False)
+    # Tracker tables use both integer and string patient ids
+    patient_id = Column(String(64), nullable=False)
+    vital = Column(String(32), nullable=False)   # see app.health_progress.vitals.services.VITALS
+    value = Column(Float, nullable=False)
+    observed_at = Column(DateTime, nullable=False)
@@ -0,0 +1,42 @@
+# app/health_progress/vitals/routers.py
+from datetime import date
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app.authentication.dependencies import require_staff_or_self
+from app.database import get_db
+from app.models import User
+from .services import VITALS, VitalsService
+
+router = APIRouter()
+
+def get_vitals_service(db: Session = Depends(get_db)):
+    return VitalsService(db)
+
+# GET /api/health-progress/vitals/{patient_id}/trend
+@router.get("/{patient_id}/trend")
+def get_vital_trend(
+    patient_id: str,
+    vital: Optional[List[str]] = Query(None, description=f"Vital(s) to chart (default: all): {', '.join(VITALS)}"),
+    bucket: str = Query("day", description="day, week or month"),
+    from_date: Optional[date] = Query(None, description="First day (default: 90 days / 1 year / 3 years back)"),
+    to_date: Optional[date] = Query(None, description="Last day (default: today)"),
+    condition: Optional[List[str]] = Query(None, description="Only readings from these trackers"),
+    current_user: User = Depends(require_staff_or_self),
+    vitals_service: VitalsService = Depends(get_vitals_service)
+):
+    """
+    Downsampled trend of a patient's vitals: min, max, average and number of
+    readings per day, week (Monday first) or month, from every tracker, e.g.
+    ?vital=bp_systolic&vital=bp_diastolic&bucket=week. Staff see any
+    patient's; a patient only their own.
+    """
+    try:
+        return vitals_service.get_trend(
+            patient_id, vital or list(VITALS), bucket=bucket,
+            from_date=from_date, to_date=to_date, conditions=condition,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
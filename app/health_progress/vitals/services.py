@@ -0,0 +1,322 @@
+# app/health_progress/vitals/services.py
+"""
+Numeric vital signs of every tracker entry, for trend charts.
+
+Each tracker write also rewrites the entry's `vital_observations` rows, in the
+same transaction: ORM writes through mapper events, Core paths through
+`record_vitals` / `record_vitals_bulk` (app.health_progress.hooks). Values
+are found under every spelling the trackers use (flat columns, and
+common_data / condition_data keys in snake_case or camelCase), parsed from
+strings like "37.5" or "120 mmHg" and kept in one unit per vital.
+
+Entries written before the table existed are loaded with `backfill`:
+
+    python -m app.health_progress.vitals.services [conditions...]
+"""
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from sqlalchemy import delete, event, func, insert, inspect as sa_inspect, select
+from sqlalchemy.orm import Session
+
+from app.health_progress.registry import TRACKERS, TRACKERS_BY_MODEL, TrackerSpec
+from app.health_progress.vitals.models import VitalObservation
+
+logger = logging.getLogger(__name__)
+
+_table = VitalObservation.__table__
+
+_NUMBER = re.compile(r"[-+]?\d+(?:[.,]\d+)?")
+
+
+def _fahrenheit_to_celsius(value: float) -> float:
+    # Body temperatures entered in °F (86-113) are unambiguous next to °C ones
+    return round((value - 32) * 5 / 9, 1) if 86 <= value <= 113 else value
+
+
+@dataclass(frozen=True)
+class Vital:
+    unit: str
+    fields: Sequence[str]      # spellings, in order of preference
+    low: float                 # plausible range; anything else is a typo
+    high: float
+    normalize: Optional[Callable[[float], float]] = None
+
+
+VITALS: Dict[str, Vital] = {
+    "bp_systolic": Vital("mmHg", ("blood_pressure_systolic", "bloodPressureSystolic"), 40, 300),
+    "bp_diastolic": Vital("mmHg", ("blood_pressure_diastolic", "bloodPressureDiastolic"), 20, 200),
+    "heart_rate": Vital("bpm", ("heart_rate", "heartRate", "maternal_heart_rate", "maternalHeartRate", "pulse"), 20, 250),
+    "temperature": Vital("°C", ("temperature", "maternal_temperature", "maternalTemperature"), 30, 45,
+                         _fahrenheit_to_celsius),
+    "glucose": Vital("mg/dL", ("blood_glucose", "bloodGlucose"), 10, 1000),
+    "weight": Vital("kg", ("weight", "current_weight", "currentWeight"), 1, 400),
+    "spo2": Vital("%", ("oxygen_saturation", "oxygenSaturation", "spo2"), 50, 100),
+}
+
+BUCKETS = {"day": 90, "week": 365, "month": 3 * 365}  # bucket -> default window in days
+
+
+def parse_number(value: Any) -> Optional[float]:
+    """First number in a value: 120, "37.5", "120 mmHg", "37,5" -> float; anything else None"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        match = _NUMBER.search(value)
+        if match:
+            return float(match.group().replace(",", "."))
+    return None
+
+
+def extract_vitals(data: Mapping[str, Any]) -> Dict[str, float]:
+    """vital -> value of an entry's column values; flat columns win over JSON keys"""
+    sources = [data] + [data[key] for key in ("common_data", "condition_data") if isinstance(data.get(key), dict)]
+    found = {}
+    for name, vital in VITALS.items():
+        for source in sources:
+            value = next((v for v in (parse_number(source.get(f)) for f in vital.fields) if v is not None), None)
+            if value is None:
+                continue
+            if vital.normalize:
+                value = vital.normalize(value)
+            if vital.low <= value <= vital.high:
+                found[name] = value
+                break
+    return found
+
+
+def _observed_at(spec: TrackerSpec, data: Mapping[str, Any]) -> datetime:
+    timestamp = data.get(spec.timestamp_field)
+    if isinstance(timestamp, datetime):
+        return timestamp
+    submission_date = data.get("submission_date")
+    if isinstance(submission_date, date):
+        return datetime.combine(submission_date, datetime.min.time())
+    try:
+        return datetime.fromisoformat(str(submission_date))
+    except ValueError:
+        # Server-side default not known yet, and no usable submission date
+        return datetime.utcnow()
+
+
+def observations(spec: TrackerSpec, entry_id: int, data: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    """vital_observations rows of one entry"""
+    if data.get("patient_id") is None:
+        return []
+    observed_at = _observed_at(spec, data)
+    return [
+        {
+            "condition_type": spec.condition_type,
+            "entry_id": entry_id,
+            "patient_id": str(data["patient_id"]),
+            "vital": name,
+            "value": value,
+            "observed_at": observed_at,
+        }
+        for name, value in extract_vitals(data).items()
+    ]
+
+
+def _replace(connection, spec: TrackerSpec, entry_ids: Sequence[int], rows: List[Dict[str, Any]], is_new: bool = False):
+    if not is_new:
+        connection.execute(delete(_table).where(
+            _table.c.condition_type == spec.condition_type, _table.c.entry_id.in_(list(entry_ids))
+        ))
+    if rows:
+        connection.execute(insert(_table), rows)
+
+
+def _column_values(connection, spec: TrackerSpec, target) -> Dict[str, Any]:
+    """Every column of a flushed row; what the session did not load is read back"""
+    state = sa_inspect(target)
+    columns = [attr.key for attr in state.mapper.column_attrs]
+    data = {key: state.dict[key] for key in columns if key in state.dict}
+    if len(data) < len(columns):
+        row = connection.execute(
+            select(*spec.model.__table__.columns).where(spec.model.id == target.id)
+        ).mappings().first()
+        data = {**(row or {}), **data}
+    return data
+
+
+# ---------------------------------------------------------------- write hooks
+
+def _after_insert(mapper, connection, target):
+    spec = TRACKERS_BY_MODEL[mapper.class_]
+    _replace(connection, spec, [target.id], observations(spec, target.id, sa_inspect(target).dict), is_new=True)
+
+
+def _after_update(mapper, connection, target):
+    spec = TRACKERS_BY_MODEL[mapper.class_]
+    _replace(connection, spec, [target.id], observations(spec, target.id, _column_values(connection, spec, target)))
+
+
+def _after_delete(mapper, connection, target):
+    spec = TRACKERS_BY_MODEL[mapper.class_]
+    _replace(connection, spec, [target.id], [])
+
+
+_HOOKS = (("after_insert", _after_insert), ("after_update", _after_update), ("after_delete", _after_delete))
+
+
+def install_vital_hooks():
+    """Keep vital_observations in step with every ORM write to a tracker table (idempotent)"""
+    for spec in TRACKERS:
+        for name, hook in _HOOKS:
+            if not event.contains(spec.model, name, hook):
+                event.listen(spec.model, name, hook)
+
+
+def remove_vital_hooks():
+    for spec in TRACKERS:
+        for name, hook in _HOOKS:
+            if event.contains(spec.model, name, hook):
+                event.remove(spec.model, name, hook)
+
+
+def hooks_installed() -> bool:
+    return event.contains(TRACKERS[0].model, "after_insert", _after_insert)
+
+
+def _entry_values(model, entry) -> Dict[str, Any]:
+    return {attr.key: getattr(entry, attr.key) for attr in sa_inspect(model).column_attrs}
+
+
+def record_vitals(db: Session, model, entry):
+    """Observations of an entry saved with a Core statement (no mapper events fire)"""
+    if not hooks_installed():
+        return
+    spec = TRACKERS_BY_MODEL[model]
+    _replace(db.connection(), spec, [entry.id], observations(spec, entry.id, _entry_values(model, entry)))
+
+
+def record_vitals_bulk(db: Session, model, entries: Sequence[Any]):
+    """Observations of new entries inserted in bulk, in one executemany"""
+    if not hooks_installed() or not entries:
+        return
+    spec = TRACKERS_BY_MODEL[model]
+    rows = [row for entry in entries for row in observations(spec, entry.id, _entry_values(model, entry))]
+    _replace(db.connection(), spec, [entry.id for entry in entries], rows, is_new=True)
+
+
+def backfill(db: Session, conditions: Optional[Iterable[str]] = None, chunk_size: int = 5000) -> int:
+    """(Re)build the observations of every stored entry; returns the number of rows written"""
+    written = 0
+    for spec in TRACKERS:
+        if conditions and spec.condition_type not in conditions:
+            continue
+        model = spec.model
+        last_id = 0
+        while True:
+            rows = db.execute(
+                select(*model.__table__.columns).where(model.id > last_id).order_by(model.id).limit(chunk_size)
+            ).mappings().all()
+            if not rows:
+                break
+            observed = [o for row in rows for o in observations(spec, row["id"], row)]
+            _replace(db.connection(), spec, [row["id"] for row in rows], observed)
+            db.commit()
+            written += len(observed)
+            last_id = rows[-1]["id"]
+
+    logger.info(f"🩺 VITALS: Backfilled {written} observations")
+    return written
+
+
+# ---------------------------------------------------------------- trends
+
+def bucket_start(column, bucket: str, dialect_name: str):
+    """First day of the day/week (Monday)/month bucket of a timestamp"""
+    if dialect_name == "sqlite":
+        if bucket == "day":
+            return func.date(column)
+        if bucket == "week":
+            return func.date(column, "weekday 0", "-6 days")
+        return func.date(column, "start of month")
+    return func.date_trunc(bucket, column)
+
+
+class VitalsService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_trend(
+        self,
+        patient_id: str,
+        vitals: Sequence[str],
+        bucket: str = "day",
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+        conditions: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        min / max / avg / count of each vital per bucket, oldest bucket first.
+        One grouped range scan of the (patient_id, vital, observed_at) index.
+        """
+        unknown = [v for v in vitals if v not in VITALS]
+        if unknown or bucket not in BUCKETS:
+            raise ValueError(
+                f"Unknown vital(s) {', '.join(unknown)}" if unknown else f"bucket must be one of {', '.join(BUCKETS)}"
+            )
+        to_date = to_date or datetime.utcnow().date()
+        from_date = from_date or to_date - timedelta(days=BUCKETS[bucket])
+
+        patient_id = patient_id.strip()
+        patient_ids = {patient_id, str(int(patient_id))} if patient_id.isdigit() else {patient_id}
+        start = bucket_start(_table.c.observed_at, bucket, self.db.get_bind().dialect.name).label("bucket")
+
+        query = (
+            select(
+                _table.c.vital, start,
+                func.min(_table.c.value), func.max(_table.c.value), func.avg(_table.c.value), func.count(),
+            )
+            .where(
+                _table.c.patient_id.in_(patient_ids),
+                _table.c.vital.in_(list(vitals)),
+                _table.c.observed_at >= datetime.combine(from_date, datetime.min.time()),
+                _table.c.observed_at < datetime.combine(to_date + timedelta(days=1), datetime.min.time()),
+            )
+            .group_by(_table.c.vital, start)
+            .order_by(_table.c.vital, start)
+        )
+        if conditions:
+            query = query.where(_table.c.condition_type.in_(list(conditions)))
+
+        trend = {name: {"unit": VITALS[name].unit, "buckets": []} for name in vitals}
+        for vital, start_value, low, high, average, count in self.db.execute(query):
+            trend[vital]["buckets"].append({
+                "start": start_value.date().isoformat() if isinstance(start_value, datetime) else str(start_value)[:10],
+                "min": low,
+                "max": high,
+                "avg": round(average, 2),
+                "count": count,
+            })
+
+        return {
+            "patient_id": patient_id,
+            "bucket": bucket,
+            "from_date": from_date.isoformat(),
+            "to_date": to_date.isoformat(),
+            "vitals": trend,
+        }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from app.database import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Rebuild vital_observations from the tracker tables")
+    parser.add_argument("conditions", nargs="*", help="condition types (default: every tracker)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        print(f"{backfill(db, conditions=args.conditions)} observations written")
+    finally:
+        db.close()
@@ -1,15 +1,22 @@
-from sqlalchemy import Column, String, DateTime, JSON
+from sqlalchemy import Column, String, DateTime, JSON, Index
 from sqlalchemy.sql import func
 import uuid
 
 # FIX: Use the same Base as other models in your app
 from app.database_base import Base  # This matches your other models
+from app.health_progress.pagination import patient_keyset_indexes
 
 def generate_uuid():
     return str(uuid.uuid4())
 
 class MedicalRecord(Base):
     __tablename__ = "medical_record"
+    __table_args__ = (
+        # Patient record lookups seek here, newest date first; (date, id) is the keyset order
+        Index("ix_medical_record_patient_date", "patient_id", "date", "id"),
+        Index("ix_medical_record_patient_category_date", "patient_id", "category", "date"),
+        Index("ix_medical_record_category_date", "category", "date"),
+    ) + patient_keyset_indexes("medical_record", "created_at")
     
     id = Column(String, primary_key=True, default=generate_uuid)
     patient_id = Column(String, nullable=False)
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from app.database import get_db
+from app.health_progress.pagination import PageParams, page_params
 import logging
 from typing import Optional, Dict, Any
 from pydantic import BaseModel
@@ -81,25 +82,21 @@ def test_imports():
 def get_medical_records(
     db: Session = Depends(get_db),
     patient_id: Optional[str] = Query(None),
-    category: Optional[str] = Query(None)
+    category: Optional[str] = Query(None),
+    page: PageParams = Depends(page_params)
 ):
-    """Get medical records - with filtering support"""
+    """Get medical records - with filtering support, one page at a time"""
     try:
         from app.medical_record import services
-        records = services.MedicalRecordService.get_medical_records(db)
-        
-        # Apply filters if provided
-        filtered_records = records
-        if patient_id:
-            filtered_records = [r for r in filtered_records if getattr(r, 'patient_id', None) == patient_id]
-        if category:
-            filtered_records = [r for r in filtered_records if getattr(r, 'category', None) == category]
+        records, next_cursor = services.MedicalRecordService.get_medical_records(
+            db, page, patient_id=patient_id, category=category
+        )
             
         return {
             "message": "Medical records retrieved successfully",
-            "records": filtered_records,
-            "total_count": len(records),
-            "filtered_count": len(filtered_records)
+            "records": records,
+            "count": len(records),
+            "next_cursor": next_cursor
         }
     except Exception as e:
         logger.error(f"Error fetching medical records: {e}")
@@ -137,24 +134,6 @@ def health_status():
         "message": "Medical records service is running"
     }
 
-@router.get("/{record_id}")
-def get_medical_record(record_id: str, db: Session = Depends(get_db)):
-    """Get specific medical record by ID"""
-    try:
-        from app.medical_record import services
-        record = services.MedicalRecordService.get_medical_record_by_id(db, record_id)
-        if not record:
-            raise HTTPException(status_code=404, detail="Medical record not found")
-        return {
-            "message": "Record retrieved successfully",
-            "record": record
-        }
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error fetching record {record_id}: {e}")
-        raise HTTPException(status_code=500, detail="Error fetching medical record")
-
 @router.post("/")
 def create_medical_record(record_data: MedicalRecordCreateRequest, db: Session = Depends(get_db)):
     """Create new medical record"""
@@ -237,16 +216,16 @@ def create_lab_result(lab_data: LabResultRequest, db: Session = Depends(get_db))
         raise HTTPException(status_code=500, detail="Error creating lab result")
 
 @router.get("/lab-results")
-def get_lab_results(db: Session = Depends(get_db)):
-    """Get all lab results"""
+def get_lab_results(db: Session = Depends(get_db), page: PageParams = Depends(page_params)):
+    """Get lab results, one page at a time"""
     try:
         from app.medical_record import services
-        records = services.MedicalRecordService.get_medical_records(db)
-        lab_results = [r for r in records if getattr(r, 'category', None) == 'Lab Results']
+        lab_results, next_cursor = services.MedicalRecordService.get_records_by_category(db, 'Lab Results', page)
         return {
             "message": "Lab results retrieved successfully",
             "results": lab_results,
-            "count": len(lab_results)
+            "count": len(lab_results),
+            "next_cursor": next_cursor
         }
     except Exception as e:
         logger.error(f"Error fetching lab results: {e}")
@@ -302,16 +281,16 @@ def create_prescription(prescription_data: PrescriptionRequest, db: Session = De
         raise HTTPException(status_code=500, detail="Error creating prescription")
 
 @router.get("/prescriptions")
-def get_prescriptions(db: Session = Depends(get_db)):
-    """Get all prescriptions"""
+def get_prescriptions(db: Session = Depends(get_db), page: PageParams = Depends(page_params)):
+    """Get prescriptions, one page at a time"""
     try:
         from app.medical_record import services
-        records = services.MedicalRecordService.get_medical_records(db)
-        prescriptions = [r for r in records if getattr(r, 'category', None) == 'Prescriptions']
+        prescriptions, next_cursor = services.MedicalRecordService.get_records_by_category(db, 'Prescriptions', page)
         return {
             "message": "Prescriptions retrieved successfully",
             "prescriptions": prescriptions,
-            "count": len(prescriptions)
+            "count": len(prescriptions),
+            "next_cursor": next_cursor
         }
     except Exception as e:
         logger.error(f"Error fetching prescriptions: {e}")
@@ -319,17 +298,24 @@ def get_prescriptions(db: Session = Depends(get_db)):
 
 # Patient-specific records
 @router.get("/patient/{patient_id}/records")
-def get_patient_records(patient_id: str, db: Session = Depends(get_db)):
-    """Get all records for a specific patient"""
+def get_patient_records(
+    patient_id: str,
+    db: Session = Depends(get_db),
+    category: Optional[str] = Query(None),
+    page: PageParams = Depends(page_params)
+):
+    """Get records for a specific patient, optionally of one category"""
     try:
         from app.medical_record import services
-        records = services.MedicalRecordService.get_medical_records(db)
-        patient_records = [r for r in records if getattr(r, 'patient_id', None) == patient_id]
+        patient_records, next_cursor = services.MedicalRecordService.get_medical_records(
+            db, page, patient_id=patient_id, category=category
+        )
         return {
             "message": f"Records retrieved for patient {patient_id}",
             "patient_id": patient_id,
             "records": patient_records,
-            "count": len(patient_records)
+            "count": len(patient_records),
+            "next_cursor": next_cursor
         }
     except Exception as e:
         logger.error(f"Error fetching patient records: {e}")
@@ -337,18 +323,37 @@ def get_patient_records(patient_id: str, db: Session = Depends(get_db)):
 
 # Category-specific records
 @router.get("/category/{category}/records")
-def get_records_by_category(category: str, db: Session = Depends(get_db)):
-    """Get all records for a specific category"""
+def get_records_by_category(category: str, db: Session = Depends(get_db), page: PageParams = Depends(page_params)):
+    """Get records for a specific category (case-insensitive)"""
     try:
         from app.medical_record import services
-        records = services.MedicalRecordService.get_medical_records(db)
-        category_records = [r for r in records if getattr(r, 'category', '').lower() == category.lower()]
+        category_records, next_cursor = services.MedicalRecordService.get_records_by_category(db, category, page)
         return {
             "message": f"Records retrieved for category {category}",
             "category": category,
             "records": category_records,
-            "count": len(category_records)
+            "count": len(category_records),
+            "next_cursor": next_cursor
         }
     except Exception as e:
         logger.error(f"Error fetching category records: {e}")
-        raise HTTPException(status_code=500, detail="Error fetching category records")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Error fetching category records")
+
+# Keep this last: "/{record_id}" would otherwise match /lab-results, /prescriptions, ...
+@router.get("/{record_id}")
+def get_medical_record(record_id: str, db: Session = Depends(get_db)):
+    """Get specific medical record by ID"""
+    try:
+        from app.medical_record import services
+        record = services.MedicalRecordService.get_medical_record_by_id(db, record_id)
+        if not record:
+            raise HTTPException(status_code=404, detail="Medical record not found")
+        return {
+            "message": "Record retrieved successfully",
+            "record": record
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching record {record_id}: {e}")
+        raise HTTPException(status_code=500, detail="Error fetching medical record")
\ No newline at end of file
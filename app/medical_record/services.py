@@ -1,34 +1,53 @@
+from fastapi import HTTPException
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 import logging
+from app.health_progress.pagination import PageParams, paginate
 from . import models, schemas
 
 logger = logging.getLogger(__name__)
 
+# Categories written by the create_* helpers and the staff pages
+RECORD_CATEGORIES = ["Lab Results", "Prescriptions", "Medical History"]
+
 class MedicalRecordService:
     
     @staticmethod
     def get_medical_records(  # ✅ CHANGED: Renamed to plural
-        db: Session, 
-        skip: int = 0, 
-        limit: int = 100,
+        db: Session,
+        page: Optional[PageParams] = None,
         patient_id: Optional[str] = None,
         category: Optional[str] = None
-    ) -> List[models.MedicalRecord]:
-        """Get all medical records with optional filtering"""
+    ) -> Tuple[List[models.MedicalRecord], Optional[str]]:
+        """
+        Get one page of medical records (most recent date first) with optional
+        filtering, plus the next-page cursor. Filters run in SQL so they can
+        use the (patient_id, date, id) or (patient_id, category, date) index.
+        """
         try:
             query = db.query(models.MedicalRecord)
             
             if patient_id:
                 query = query.filter(models.MedicalRecord.patient_id == patient_id)
             if category:
-                query = query.filter(models.MedicalRecord.category == category)
+                query = query.filter(MedicalRecordService._category_filter(category))
                 
-            return query.offset(skip).limit(limit).all()
+            return paginate(query, models.MedicalRecord.date, models.MedicalRecord.id, page or PageParams())
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error getting medical records: {e}")
-            return []
+            return [], None
+    
+    @staticmethod
+    def _category_filter(category: str):
+        """Case-insensitive category match that stays index-friendly for the known categories"""
+        for known in RECORD_CATEGORIES:
+            if known.lower() == category.lower():
+                return models.MedicalRecord.category == known
+        return func.lower(models.MedicalRecord.category) == category.lower()
     
     @staticmethod
     def get_medical_record_by_id(db: Session, record_id: str) -> Optional[models.MedicalRecord]:  # ✅ CHANGED: Renamed to avoid conflict
@@ -162,19 +181,15 @@ class MedicalRecordService:
             raise e
     
     @staticmethod
-    def get_records_by_category(db: Session, category: str) -> List[models.MedicalRecord]:
-        """Get records by category"""
-        try:
-            return db.query(models.MedicalRecord).filter(models.MedicalRecord.category == category).all()
-        except Exception as e:
-            logger.error(f"Error getting records by category {category}: {e}")
-            return []
+    def get_records_by_category(
+        db: Session, category: str, page: Optional[PageParams] = None
+    ) -> Tuple[List[models.MedicalRecord], Optional[str]]:
+        """Get one page of records by category"""
+        return MedicalRecordService.get_medical_records(db, page, category=category)
     
     @staticmethod
-    def get_patient_records(db: Session, patient_id: str) -> List[models.MedicalRecord]:
-        """Get records by patient ID"""
-        try:
-            return db.query(models.MedicalRecord).filter(models.MedicalRecord.patient_id == patient_id).all()
-        except Exception as e:
-            logger.error(f"Error getting records for patient {patient_id}: {e}")
-            return []
\ No newline at end of file
+    def get_patient_records(
+        db: Session, patient_id: str, page: Optional[PageParams] = None
+    ) -> Tuple[List[models.MedicalRecord], Optional[str]]:
+        """Get one page of records by patient ID"""
+        return MedicalRecordService.get_medical_records(db, page, patient_id=patient_id)
@@ -1,12 +1,16 @@
 # app/postnatal/models.py
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
+from app.health_progress.pagination import keyset_indexes
 
 Base = declarative_base()
 
 class PostnatalEntry(Base):
     __tablename__ = "postnatal_entries"
+    __table_args__ = keyset_indexes("postnatal_entries", "submitted_at") + (
+        Index("uq_postnatal_entries_patient_day", "patient_id", "submission_date", unique=True),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     patient_id = Column(String, nullable=False)
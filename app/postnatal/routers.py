@@ -3,14 +3,16 @@ from sqlalchemy.orm import Session
 from datetime import date
 
 from app.database import get_db
+from app.health_progress.pagination import PageParams, page_params
 from app.postnatal.models import PostnatalEntry, PostnatalProfile
 from app.postnatal.schemas import PostnatalCreate, PostnatalResponse, PostnatalCheckResponse, PostnatalProfileCreate, PostnatalProfileResponse
 from app.postnatal.services import PostnatalService
+from app.health_progress.versions.conditional import entries_etag, patient_etag
 
 router = APIRouter()
 
 @router.post("/profile", response_model=PostnatalProfileResponse)
-async def create_postnatal_profile(
+def create_postnatal_profile(
     profile: PostnatalProfileCreate,
     db: Session = Depends(get_db)
 ):
@@ -23,7 +25,7 @@ async def create_postnatal_profile(
     return result
 
 @router.get("/profile", response_model=PostnatalProfileResponse)
-async def get_postnatal_profile(
+def get_postnatal_profile(
     patient_id: str,
     db: Session = Depends(get_db)
 ):
@@ -36,7 +38,7 @@ async def get_postnatal_profile(
     return profile
 
 @router.post("/entries", response_model=PostnatalResponse)
-async def create_postnatal_entry(
+def create_postnatal_entry(
     entry: PostnatalCreate,
     db: Session = Depends(get_db)
 ):
@@ -48,8 +50,8 @@ async def create_postnatal_entry(
     print("🚨 Entry saved with ID:", result.id)
     return result
 
-@router.get("/entries/{patient_id}/{date}", response_model=PostnatalCheckResponse)
-async def check_existing_entry(
+@router.get("/entries/{patient_id}/{date}", response_model=PostnatalCheckResponse, dependencies=[Depends(patient_etag("postnatal"))])
+def check_existing_entry(
     patient_id: str,
     date: date,
     db: Session = Depends(get_db)
@@ -63,13 +65,16 @@ async def check_existing_entry(
         entry_id=existing_entry.id if existing_entry else None
     )
 
-@router.get("/entries")
-async def get_all_postnatal_entries(db: Session = Depends(get_db)):
+@router.get("/entries", dependencies=[Depends(entries_etag("postnatal"))])
+def get_all_postnatal_entries(
+    page: PageParams = Depends(page_params),
+    db: Session = Depends(get_db)
+):
     """
     Get ALL postnatal entries for dashboard
     """
     try:
-        entries = PostnatalService.get_all_postnatal_entries(db)
+        entries, next_cursor = PostnatalService.get_all_postnatal_entries(db, page)
         
         formatted_entries = []
         for entry in entries:
@@ -130,6 +135,7 @@ async def get_all_postnatal_entries(db: Session = Depends(get_db)):
         return {
             "entries": formatted_entries,
             "total": len(entries),
+            "next_cursor": next_cursor,
             "condition_type": "postnatal"
         }
         
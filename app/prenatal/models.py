@@ -1,11 +1,15 @@
 # app/prenatal/models.py
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Index
 from sqlalchemy.ext.declarative import declarative_base
+from app.health_progress.pagination import keyset_indexes
 
 Base = declarative_base()
 
 class PrenatalEntry(Base):
     __tablename__ = "prenatal_entries"
+    __table_args__ = keyset_indexes("prenatal_entries", "submitted_at") + (
+        Index("uq_prenatal_entries_patient_day", "patient_id", "submission_date", unique=True),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     patient_id = Column(String, nullable=False)
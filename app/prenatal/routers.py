@@ -3,14 +3,16 @@ from sqlalchemy.orm import Session
 from datetime import date
 
 from app.database import get_db
+from app.health_progress.pagination import PageParams, page_params
 from app.prenatal.models import PrenatalEntry
 from app.prenatal.schemas import PrenatalCreate, PrenatalResponse, PrenatalCheckResponse
 from app.prenatal.services import PrenatalService
+from app.health_progress.versions.conditional import entries_etag, patient_etag
 
 router = APIRouter()
 
 @router.post("/entries", response_model=PrenatalResponse)
-async def create_prenatal_entry(
+def create_prenatal_entry(
     entry: PrenatalCreate,
     db: Session = Depends(get_db)
 ):
@@ -22,8 +24,8 @@ async def create_prenatal_entry(
     print("🚨 Entry saved with ID:", result.id)
     return result
 
-@router.get("/entries/{patient_id}/{date}", response_model=PrenatalCheckResponse)
-async def check_existing_entry(
+@router.get("/entries/{patient_id}/{date}", response_model=PrenatalCheckResponse, dependencies=[Depends(patient_etag("prenatal"))])
+def check_existing_entry(
     patient_id: str,
     date: date,
     db: Session = Depends(get_db)
@@ -37,13 +39,16 @@ async def check_existing_entry(
         entry_id=existing_entry.id if existing_entry else None
     )
 
-@router.get("/entries")
-async def get_all_prenatal_entries(db: Session = Depends(get_db)):
+@router.get("/entries", dependencies=[Depends(entries_etag("prenatal"))])
+def get_all_prenatal_entries(
+    page: PageParams = Depends(page_params),
+    db: Session = Depends(get_db)
+):
     """
     Get ALL prenatal entries for dashboard
     """
     try:
-        entries = PrenatalService.get_all_prenatal_entries(db)
+        entries, next_cursor = PrenatalService.get_all_prenatal_entries(db, page)
         
         formatted_entries = []
         for entry in entries:
@@ -99,14 +104,15 @@ async def get_all_prenatal_entries(db: Session = Depends(get_db)):
         return {
             "entries": formatted_entries,
             "total": len(entries),
+            "next_cursor": next_cursor,
             "condition_type": "prenatal"
         }
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving prenatal entries: {str(e)}")
 
-@router.get("/entries/patient/{patient_id}")
-async def get_patient_prenatal_entries(
+@router.get("/entries/patient/{patient_id}", dependencies=[Depends(patient_etag("prenatal"))])
+def get_patient_prenatal_entries(
     patient_id: str,
     db: Session = Depends(get_db)
 ):
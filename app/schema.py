@@ -0,0 +1,148 @@
+# app/schema.py
+"""
+Schema management: Alembic owns the database schema.
+
+Nothing creates tables at import time any more. `migrate_database()` runs
+as an explicit step, once per deploy (`python -m app.schema`), or from the
+app lifespan when RUN_MIGRATIONS_ON_STARTUP=1:
+
+- fresh database: create every table from the models, then stamp head
+  (the old revisions cannot build a database from scratch)
+- database built by the old import-time create_all (tables but no
+  alembic_version): stamp LEGACY_REVISION, then upgrade
+- otherwise: upgrade to head, unless a pending revision is in
+  DESTRUCTIVE_REVISIONS (then nothing runs and SchemaError says why)
+
+After an upgrade, tables of the models that no revision creates (the
+tracker tables, which used to appear on first startup) are created if they
+are missing, with the indexes their models declare.
+
+Alembic is imported inside the functions that use it, so importing this
+module (main.py does) does not need it when migrations run elsewhere.
+"""
+import os
+from typing import TYPE_CHECKING, List
+
+from sqlalchemy import inspect
+
+from app.config import DATABASE_URL
+
+if TYPE_CHECKING:
+    from alembic.config import Config
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "alembic.ini")
+
+# Last revision written before the tracker index migrations; databases that
+# were only ever managed by create_all match it
+LEGACY_REVISION = "623c30ce9e64"
+
+# Early autogenerated revisions that drop tables the app still uses. An
+# upgrade that would run one of them is refused: back the database up and
+# `alembic stamp` past it by hand if its tables are to be kept.
+DESTRUCTIVE_REVISIONS = {
+    "d2d4f83b623b": "drops prescriptions",
+    "623c30ce9e64": "drops users, appointments and medical_records",
+}
+
+
+class SchemaError(RuntimeError):
+    """The database cannot be migrated automatically"""
+
+
+def pending_revisions(cfg: "Config", current: str) -> List[str]:
+    """Revisions an upgrade from `current` to head would run, oldest first"""
+    from alembic.script import ScriptDirectory
+
+    script = ScriptDirectory.from_config(cfg)
+    return [rev.revision for rev in reversed(list(script.iterate_revisions("heads", current)))]
+
+
+def check_not_destructive(cfg: "Config", current: str):
+    destructive = [rev for rev in pending_revisions(cfg, current) if rev in DESTRUCTIVE_REVISIONS]
+    if destructive:
+        reasons = "; ".join(f"{rev} {DESTRUCTIVE_REVISIONS[rev]}" for rev in destructive)
+        raise SchemaError(
+            f"Database is at {current}; upgrading would run destructive revisions ({reasons}). "
+            f"Back it up, then run `alembic stamp {destructive[-1]}` to keep those tables, "
+            f"and migrate again."
+        )
+
+
+def all_metadata():
+    """MetaData of every model (the app still has one declarative Base per tracker)"""
+    from app import models  # noqa: F401  users, appointments, prescriptions on the shared Base
+    from app.database_base import Base
+    from app.health_progress.models import Base as ProgressBase
+    from app.health_progress.registry import TRACKERS
+    from app.health_progress.triage import models as triage_models  # noqa: F401  on the progress Base
+    from app.health_progress.versions import models as version_models  # noqa: F401  on the progress Base
+    from app.health_progress.vitals import models as vital_models  # noqa: F401  on the progress Base
+    from app.medical_record import models as medical_record_models  # noqa: F401
+    from app.postnatal.models import PostnatalProfile
+    from app.skin_analysis import models as skin_models  # noqa: F401  on the shared Base
+
+    metadata = [Base.metadata, ProgressBase.metadata, PostnatalProfile.metadata]
+    metadata += [spec.model.metadata for spec in TRACKERS]
+    unique = []
+    for item in metadata:
+        if not any(item is seen for seen in unique):
+            unique.append(item)
+    return unique
+
+
+def create_missing_tables(engine) -> List[str]:
+    """Create the model tables `engine` lacks (checkfirst); returns their names"""
+    existing = set(inspect(engine).get_table_names())
+    for metadata in all_metadata():
+        metadata.create_all(bind=engine, checkfirst=True)
+    return sorted(set(inspect(engine).get_table_names()) - existing)
+
+
+def alembic_config(url: str = DATABASE_URL) -> "Config":
+    from alembic.config import Config
+
+    cfg = Config(ALEMBIC_INI)
+    cfg.attributes["database_url"] = url
+    # Keep the server's logging setup when migrating from inside the app
+    cfg.attributes["configure_logger"] = False
+    return cfg
+
+
+def migrate_database(url: str = DATABASE_URL):
+    """Bring the database at `url` to the Alembic head revision"""
+    from alembic import command
+    from alembic.runtime.migration import MigrationContext
+
+    from app.database import create_db_engine
+
+    engine = create_db_engine(url)
+    cfg = alembic_config(url)
+    try:
+        with engine.connect() as connection:
+            current = MigrationContext.configure(connection).get_current_revision()
+            tables = set(inspect(connection).get_table_names()) - {"alembic_version"}
+
+        if current is None and not tables:
+            print("🆕 SCHEMA: Empty database, creating all tables")
+            create_missing_tables(engine)
+            command.stamp(cfg, "head")
+            return
+
+        if current is None:
+            print(f"🔖 SCHEMA: Unversioned database, stamping {LEGACY_REVISION}")
+            command.stamp(cfg, LEGACY_REVISION)
+        else:
+            check_not_destructive(cfg, current)
+
+        command.upgrade(cfg, "head")
+        # After the upgrade, so revisions that create a table never find it already there
+        created = create_missing_tables(engine)
+        if created:
+            print(f"🆕 SCHEMA: Created missing tables: {', '.join(created)}")
+        print("✅ SCHEMA: Database is at the latest revision")
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    migrate_database()
@@ -0,0 +1,159 @@
+# app/skin_analysis/backends.py
+"""
+Model runtimes for the skin classifier.
+
+- "keras": the fine-tuned EfficientNetV2 `.keras` file on full TensorFlow,
+  float32
+- "tflite": the same network converted once by `python -m
+  app.skin_analysis.convert` (float16 or int8) and served through the TFLite
+  interpreter. `ai-edge-litert` or `tflite-runtime` is used when installed, so
+  the serving process does not need TensorFlow at all; otherwise it falls back
+  to `tf.lite`.
+
+Both take raw RGB pixels in [0, 255], shape (N, 224, 224, 3), and return class
+probabilities, shape (N, classes). EfficientNetV2 rescales inside the network
+(`preprocess_input` is a pass-through), so no preprocessing happens here.
+"""
+import logging
+import os
+import threading
+from typing import Iterable, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("keras", "tflite")
+QUANTIZATIONS = ("float16", "dynamic", "int8")
+
+
+class KerasBackend:
+    name = "keras"
+
+    def __init__(self, model_path: str):
+        # TensorFlow is imported here, not at module import: it takes seconds
+        import tensorflow as tf
+
+        self.model = tf.keras.models.load_model(model_path)
+
+    def predict_batch(self, batch: np.ndarray) -> np.ndarray:
+        from tensorflow.keras.applications.efficientnet_v2 import preprocess_input
+
+        # predict_on_batch skips the per-call tf.data setup of model.predict
+        return np.asarray(self.model.predict_on_batch(preprocess_input(batch)))
+
+
+def _interpreter_class():
+    """Lightest available TFLite interpreter"""
+    try:
+        from ai_edge_litert.interpreter import Interpreter
+    except ImportError:
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            import tensorflow as tf
+
+            Interpreter = tf.lite.Interpreter
+    return Interpreter
+
+
+class TFLiteBackend:
+    name = "tflite"
+
+    def __init__(self, model_path: str, num_threads: Optional[int] = None, interpreter=None):
+        if interpreter is None:
+            interpreter = _interpreter_class()(model_path=model_path, num_threads=num_threads or os.cpu_count())
+        self.interpreter = interpreter
+        self.interpreter.allocate_tensors()
+        self._input = self.interpreter.get_input_details()[0]
+        self._output = self.interpreter.get_output_details()[0]
+        self._batch_size = int(self._input["shape"][0])
+        # An interpreter holds its tensors between invoke() calls
+        self._lock = threading.Lock()
+
+    def _resize(self, batch_size: int):
+        if batch_size == self._batch_size:
+            return
+        shape = list(self._input["shape"])
+        shape[0] = batch_size
+        self.interpreter.resize_tensor_input(self._input["index"], shape)
+        self.interpreter.allocate_tensors()
+        self._input = self.interpreter.get_input_details()[0]
+        self._output = self.interpreter.get_output_details()[0]
+        self._batch_size = batch_size
+
+    def _quantize_input(self, batch: np.ndarray) -> np.ndarray:
+        dtype = self._input["dtype"]
+        if np.issubdtype(dtype, np.integer):
+            scale, zero_point = self._input["quantization"]
+            info = np.iinfo(dtype)
+            batch = np.clip(np.round(batch / scale + zero_point), info.min, info.max)
+        return batch.astype(dtype)
+
+    def _dequantize_output(self, output: np.ndarray) -> np.ndarray:
+        if np.issubdtype(output.dtype, np.integer):
+            scale, zero_point = self._output["quantization"]
+            return (output.astype(np.float32) - zero_point) * scale
+        return output.astype(np.float32)
+
+    def predict_batch(self, batch: np.ndarray) -> np.ndarray:
+        with self._lock:
+            self._resize(len(batch))
+            self.interpreter.set_tensor(self._input["index"], self._quantize_input(np.asarray(batch, dtype=np.float32)))
+            self.interpreter.invoke()
+            return self._dequantize_output(self.interpreter.get_tensor(self._output["index"]).copy())
+
+
+def load_backend(name: str, keras_path: str, tflite_path: str):
+    if name == "keras":
+        return KerasBackend(keras_path)
+    if name == "tflite":
+        if not os.path.exists(tflite_path):
+            raise FileNotFoundError(
+                f"{tflite_path} not found; build it with `python -m app.skin_analysis.convert`"
+            )
+        return TFLiteBackend(tflite_path)
+    raise ValueError(f"Unknown skin model backend {name!r}; expected one of {', '.join(BACKENDS)}")
+
+
+def convert_to_tflite(
+    keras_path: str,
+    output_path: str,
+    quantization: str = "float16",
+    calibration_images: Optional[Iterable[np.ndarray]] = None,
+) -> str:
+    """
+    Convert the `.keras` model to a TFLite flatbuffer at `output_path`.
+
+    "float16" halves the weights with no measurable accuracy change,
+    "dynamic" stores int8 weights and quantizes activations on the fly, "int8"
+    quantizes activations too and needs `calibration_images` (a few hundred
+    (224, 224, 3) RGB arrays representative of real uploads). Input and
+    output stay float32 so both backends share one calling convention.
+    """
+    import tensorflow as tf
+
+    if quantization not in QUANTIZATIONS:
+        raise ValueError(f"Unknown quantization {quantization!r}; expected one of {', '.join(QUANTIZATIONS)}")
+
+    model = tf.keras.models.load_model(keras_path)
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    if quantization == "float16":
+        converter.target_spec.supported_types = [tf.float16]
+    elif quantization == "int8":
+        if calibration_images is None:
+            raise ValueError("int8 quantization needs calibration images")
+        images = list(calibration_images)
+
+        def representative_dataset():
+            for image in images:
+                yield [np.expand_dims(image, 0).astype(np.float32)]
+
+        converter.representative_dataset = representative_dataset
+
+    flatbuffer = converter.convert()
+    with open(output_path, "wb") as f:
+        f.write(flatbuffer)
+    logger.info(f"✅ Wrote {quantization} TFLite model to {output_path} ({len(flatbuffer) / 1e6:.1f} MB)")
+    return output_path
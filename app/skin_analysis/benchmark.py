@@ -0,0 +1,107 @@
+# app/skin_analysis/benchmark.py
+"""
+Compare the keras and tflite skin backends on the same images.
+
+    python -m app.skin_analysis.benchmark --images samples/ [--batch-size 8]
+
+Each backend runs in its own process so peak RSS is not shared. Reports load
+time, per-batch latency (p50/p95), peak RSS, top-1 and top-3 agreement with the
+Keras predictions and the largest probability difference. Without --images,
+random pixels are used (fine for latency and memory, meaningless for
+agreement).
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from app.skin_analysis.backends import BACKENDS, load_backend
+
+
+def top_k_agreement(reference: np.ndarray, candidate: np.ndarray, k: int) -> float:
+    """Share of images whose top-k class sets are identical"""
+    ref_top = np.sort(np.argsort(reference, axis=1)[:, -k:], axis=1)
+    cand_top = np.sort(np.argsort(candidate, axis=1)[:, -k:], axis=1)
+    return float(np.mean(np.all(ref_top == cand_top, axis=1)))
+
+
+def load_images(directory, count: int) -> np.ndarray:
+    if directory:
+        from app.skin_analysis.convert import iter_images
+
+        return np.stack(list(iter_images(directory, count)))
+    return np.random.default_rng(0).uniform(0, 255, (count, 224, 224, 3)).astype(np.float32)
+
+
+def run_backend(backend: str, images: np.ndarray, batch_size: int, output: str) -> dict:
+    from app.skin_analysis.skin_prediction import MODEL_PATH, TFLITE_MODEL_PATH
+
+    started = time.perf_counter()
+    model = load_backend(backend, MODEL_PATH, TFLITE_MODEL_PATH)
+    load_seconds = time.perf_counter() - started
+
+    model.predict_batch(images[:batch_size])  # warm-up: graph tracing / tensor allocation
+    latencies, outputs = [], []
+    for start in range(0, len(images), batch_size):
+        batch = images[start:start + batch_size]
+        started = time.perf_counter()
+        outputs.append(model.predict_batch(batch))
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    np.save(output, np.concatenate(outputs))
+    return {
+        "backend": backend,
+        "load_seconds": round(load_seconds, 2),
+        "batch_ms_p50": round(float(np.percentile(latencies, 50)), 1),
+        "batch_ms_p95": round(float(np.percentile(latencies, 95)), 1),
+        # ru_maxrss is KiB on Linux
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--images", help="directory of skin photos")
+    parser.add_argument("--count", type=int, default=64)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--backend", choices=BACKENDS, help=argparse.SUPPRESS)
+    parser.add_argument("--output", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.backend:
+        # Child process: one backend, results as JSON on stdout
+        images = load_images(args.images, args.count)
+        print(json.dumps(run_backend(args.backend, images, args.batch_size, args.output)))
+        return
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for backend in BACKENDS:
+            output = os.path.join(workdir, f"{backend}.npy")
+            command = [sys.executable, "-m", "app.skin_analysis.benchmark", "--backend", backend, "--output", output,
+                       "--count", str(args.count), "--batch-size", str(args.batch_size)]
+            if args.images:
+                command += ["--images", args.images]
+            completed = subprocess.run(command, capture_output=True, text=True, check=True)
+            results[backend] = json.loads(completed.stdout.strip().splitlines()[-1])
+            results[backend]["probabilities"] = np.load(output)
+
+    reference = results["keras"].pop("probabilities")
+    for backend in BACKENDS:
+        probabilities = results[backend].pop("probabilities", reference)
+        results[backend].update(
+            top1_agreement=top_k_agreement(reference, probabilities, 1),
+            top3_agreement=top_k_agreement(reference, probabilities, 3),
+            max_abs_diff=round(float(np.max(np.abs(reference - probabilities))), 4),
+        )
+        print(json.dumps(results[backend]))
+
+
+if __name__ == "__main__":
+    main()
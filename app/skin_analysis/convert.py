@@ -0,0 +1,42 @@
+# app/skin_analysis/convert.py
+"""
+Build the TFLite artifact served by SKIN_MODEL_BACKEND=tflite.
+
+    python -m app.skin_analysis.convert                      # float16
+    python -m app.skin_analysis.convert --quantization int8 --calibration-dir samples/
+
+Run it once at build time, wherever TensorFlow is installed; the server only
+needs the resulting `.tflite` file and a TFLite interpreter.
+"""
+import argparse
+import os
+
+from app.skin_analysis.backends import QUANTIZATIONS, convert_to_tflite
+from app.skin_analysis.preprocess import decode_image
+from app.skin_analysis.skin_prediction import MODEL_PATH, TFLITE_MODEL_PATH
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.bmp'}
+
+
+def iter_images(directory: str, limit: int):
+    names = sorted(name for name in os.listdir(directory) if os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS)
+    for name in names[:limit]:
+        with open(os.path.join(directory, name), "rb") as f:
+            yield decode_image(f.read())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default=MODEL_PATH)
+    parser.add_argument("--output", default=TFLITE_MODEL_PATH)
+    parser.add_argument("--quantization", choices=QUANTIZATIONS, default="float16")
+    parser.add_argument("--calibration-dir", help="skin photos used to calibrate int8 activations")
+    parser.add_argument("--calibration-limit", type=int, default=200)
+    args = parser.parse_args()
+
+    calibration = iter_images(args.calibration_dir, args.calibration_limit) if args.calibration_dir else None
+    convert_to_tflite(args.model, args.output, args.quantization, calibration)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# app/skin_analysis/inference.py
+"""
+Micro-batching inference engine for the skin model.
+
+Requests are queued; one worker task collects up to `max_batch_size` images
+(or whatever arrived within `max_wait_ms` of the first one), stacks them and
+runs a single forward pass on a dedicated thread. The event loop never runs
+the model, and concurrent uploads share forward passes instead of queueing
+behind each other.
+
+Images may arrive as uint8; each batch is copied into one preallocated
+float32 buffer (reused from batch to batch) rather than a fresh array.
+"""
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceQueueFull(Exception):
+    """The request queue is at capacity; callers should answer 429"""
+
+
+class BatchedInferenceEngine:
+    def __init__(
+        self,
+        predict_batch: Callable[[np.ndarray], np.ndarray],
+        max_batch_size: int = 8,
+        max_wait_ms: float = 10,
+        max_queue: int = 64,
+    ):
+        self.predict_batch = predict_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.max_queue = max_queue
+        # One thread: TensorFlow parallelises each batch internally, and a
+        # single runner keeps batches from competing for the same cores
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="skin-inference")
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._buffer: Optional[np.ndarray] = None
+        self._pending = 0
+
+    def start(self):
+        if self._worker is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def drain(self, timeout: float = 30):
+        """Wait until every submitted image has its result (or `timeout` passes), then stop"""
+        deadline = time.monotonic() + timeout
+        while self._pending and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        await self.stop()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue else 0
+
+    async def submit(self, image: np.ndarray) -> np.ndarray:
+        """
+        Probabilities for one (224, 224, 3) image.
+
+        Raises InferenceQueueFull instead of waiting when `max_queue` requests
+        are already pending.
+        """
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((image, future))
+        except asyncio.QueueFull:
+            raise InferenceQueueFull(f"{self.max_queue} skin analyses already queued")
+        self._pending += 1
+        try:
+            return await future
+        finally:
+            self._pending -= 1
+
+    async def _next_batch(self) -> List[Tuple[np.ndarray, asyncio.Future]]:
+        batch = [await self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        # Callers that gave up (client disconnected) don't need a slot
+        return [(image, future) for image, future in batch if not future.cancelled()]
+
+    def _stack(self, images: List[np.ndarray]) -> np.ndarray:
+        """float32 (N, ...) batch in the reusable buffer; safe because one batch runs at a time"""
+        shape = (self.max_batch_size,) + images[0].shape
+        if self._buffer is None or self._buffer.shape != shape:
+            self._buffer = np.empty(shape, dtype=np.float32)
+        return np.stack(images, out=self._buffer[:len(images)])
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._next_batch()
+            if not batch:
+                continue
+            try:
+                images = self._stack([image for image, _ in batch])
+                probabilities = await loop.run_in_executor(self._executor, self.predict_batch, images)
+                if np.may_share_memory(probabilities, self._buffer):
+                    # The next batch overwrites the buffer; results must not point into it
+                    probabilities = np.array(probabilities)
+                for (_, future), row in zip(batch, probabilities):
+                    if not future.done():
+                        future.set_result(row)
+                logger.debug(f"🧠 Ran skin batch of {len(batch)}")
+            except Exception as e:
+                logger.error(f"❌ Batched prediction failed: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
@@ -0,0 +1,148 @@
+# app/skin_analysis/jobs.py
+"""
+Skin-analysis results in the database, and analyses run as background jobs.
+
+Every analysis gets a `skin_analyses` row, so `GET /analysis/{id}` answers on
+any worker and results survive restarts. In job mode the upload is answered
+with 202 and the id straight away; the model runs in a task on the worker
+that took the upload and the row moves from `pending` to `done` / `failed`.
+Clients poll the row or follow it over server-sent events.
+
+A job whose worker died never finishes: pending rows older than
+SKIN_JOB_TIMEOUT are reported as failed. Old results are purged with
+
+    python -m app.skin_analysis.jobs [--days N]
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import SKIN_ANALYSIS_RETENTION_DAYS, SKIN_JOB_TIMEOUT
+from app.database import AsyncSessionLocal, get_async_engine
+from app.skin_analysis.models import SkinAnalysis
+
+logger = logging.getLogger(__name__)
+
+PENDING, DONE, FAILED = "pending", "done", "failed"
+
+
+def default_session_factory() -> AsyncSession:
+    return AsyncSessionLocal(bind=get_async_engine())
+
+
+def analysis_view(row: SkinAnalysis, timeout: float = SKIN_JOB_TIMEOUT) -> Dict[str, Any]:
+    status, error = row.status, row.error
+    if status == PENDING and row.created_at < datetime.utcnow() - timedelta(seconds=timeout):
+        status, error = FAILED, "Analysis did not finish; please upload the image again"
+    return {
+        "analysis_id": row.id,
+        "status": status,
+        "filename": row.filename,
+        "file_size": row.file_size,
+        "timestamp": row.created_at.isoformat(),
+        "completed_at": row.completed_at.isoformat() if row.completed_at else None,
+        "results": row.results,
+        "error": error,
+    }
+
+
+class AnalysisStore:
+    def __init__(self, session_factory: Callable[[], AsyncSession] = default_session_factory):
+        self.session_factory = session_factory
+
+    async def create(self, analysis_id: str, filename: Optional[str], file_size: int,
+                     results: Optional[Dict[str, Any]] = None):
+        """New analysis row: `done` when results are given, else `pending`"""
+        now = datetime.utcnow()
+        async with self.session_factory() as db:
+            db.add(SkinAnalysis(
+                id=analysis_id, status=DONE if results is not None else PENDING,
+                filename=filename, file_size=file_size, results=results,
+                created_at=now, completed_at=now if results is not None else None,
+            ))
+            await db.commit()
+
+    async def finish(self, analysis_id: str, results: Optional[Dict[str, Any]] = None,
+                     error: Optional[str] = None):
+        async with self.session_factory() as db:
+            row = await db.get(SkinAnalysis, analysis_id)
+            if row is None:
+                return
+            row.status = FAILED if error else DONE
+            row.results = results
+            row.error = error
+            row.completed_at = datetime.utcnow()
+            await db.commit()
+
+    async def get(self, analysis_id: str) -> Optional[Dict[str, Any]]:
+        async with self.session_factory() as db:
+            row = await db.get(SkinAnalysis, analysis_id)
+            return analysis_view(row) if row is not None else None
+
+    async def purge(self, days: int = SKIN_ANALYSIS_RETENTION_DAYS) -> int:
+        """Delete analyses older than `days`; returns how many"""
+        async with self.session_factory() as db:
+            result = await db.execute(
+                delete(SkinAnalysis).where(SkinAnalysis.created_at < datetime.utcnow() - timedelta(days=days))
+            )
+            await db.commit()
+        return result.rowcount
+
+
+class AnalysisJobs:
+    """Runs analyses in background tasks and records their outcome in the store"""
+
+    def __init__(self, store: AnalysisStore):
+        self.store = store
+        # Strong references: the event loop only keeps weak ones to tasks
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def running(self) -> int:
+        return len(self._tasks)
+
+    def start(self, analysis_id: str, work: Callable[[], Awaitable[Dict[str, Any]]]) -> asyncio.Task:
+        task = asyncio.get_running_loop().create_task(self._run(analysis_id, work))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _run(self, analysis_id: str, work: Callable[[], Awaitable[Dict[str, Any]]]):
+        try:
+            results = await work()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ Skin analysis job {analysis_id} failed: {e}")
+            await self.store.finish(analysis_id, error=str(e))
+        else:
+            await self.store.finish(analysis_id, results=results)
+
+    async def stop(self):
+        """Cancel unfinished jobs (shutdown); their rows expire as failed"""
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from app.database import dispose_async_engine
+
+    parser = argparse.ArgumentParser(description="Delete old skin-analysis results")
+    parser.add_argument("--days", type=int, default=SKIN_ANALYSIS_RETENTION_DAYS)
+    args = parser.parse_args()
+
+    async def main():
+        try:
+            print(f"{await AnalysisStore().purge(args.days)} skin analyses deleted")
+        finally:
+            await dispose_async_engine()
+
+    asyncio.run(main())
@@ -0,0 +1,24 @@
+# app/skin_analysis/models.py
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, Integer, JSON, String, Text
+
+from app.database_base import Base
+
+
+class SkinAnalysis(Base):
+    """One skin-analysis request and, once the model has run, its result"""
+    __tablename__ = "skin_analyses"
+    __table_args__ = (
+        # Retention purge and stale-job checks scan by age
+        Index("ix_skin_analyses_status_created", "status", "created_at"),
+    )
+
+    id = Column(String(36), primary_key=True)           # uuid4, the public analysis_id
+    status = Column(String(16), nullable=False)          # pending -> done | failed
+    filename = Column(String(255), nullable=True)
+    file_size = Column(Integer, nullable=True)
+    results = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    completed_at = Column(DateTime, nullable=True)
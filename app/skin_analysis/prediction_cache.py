@@ -0,0 +1,143 @@
+# app/skin_analysis/prediction_cache.py
+"""
+Content-addressed cache of skin predictions.
+
+The same photo is often uploaded again (retries, gallery and camera flows).
+Predictions are cached under two keys:
+
+- a hash of the uploaded bytes, checked before anything is decoded
+- a hash of the decoded 224x224 pixels, which also matches the same picture
+  re-saved in another container (PNG vs BMP, stripped metadata, ...)
+
+Keys include the model identity, so a different model never serves another
+model's predictions; loading a model also clears the memory tier. The memory
+tier is a bounded LRU (app.cache.backends.LRUCache); with
+SKIN_PREDICTION_CACHE_DIR set, predictions are also written there as small
+JSON files and survive restarts (oldest files are pruned past
+SKIN_PREDICTION_CACHE_DISK_ENTRIES).
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+
+from app.cache.backends import LRUCache
+from app.config import SKIN_PREDICTION_CACHE_DIR, SKIN_PREDICTION_CACHE_DISK_ENTRIES, SKIN_PREDICTION_CACHE_ENTRIES
+
+logger = logging.getLogger(__name__)
+
+# Predictions are deterministic for a model; only eviction or a model change drops them
+TTL = 365 * 24 * 3600.0
+
+
+def _digest(data) -> str:
+    # blake2b: faster than sha256 on multi-megabyte photos, same collision safety here
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+
+class DiskTier:
+    """One JSON file per key in `directory`; the least recently read are pruned past `max_entries`"""
+
+    def __init__(self, directory: str, max_entries: int = 20000):
+        self.directory = directory
+        self.max_entries = max_entries
+        os.makedirs(directory, exist_ok=True)
+        self._count = len(os.listdir(directory))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key.replace(":", "_") + ".json")
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = f.read()
+            os.utime(path)  # mtime doubles as last-read time for pruning
+            return value
+        except OSError:
+            return None
+
+    def set(self, key: str, value: bytes):
+        path = self._path(key)
+        temp = f"{path}.{os.getpid()}.tmp"
+        with open(temp, "wb") as f:
+            f.write(value)
+        os.replace(temp, path)  # readers in other workers never see a partial file
+        self._count += 1
+        if self._count > self.max_entries:
+            self.prune()
+
+    def prune(self):
+        """Drop the least recently used tenth below `max_entries`"""
+        entries = []
+        for entry in os.scandir(self.directory):
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                continue
+        entries.sort()
+        excess = len(entries) - int(self.max_entries * 0.9)
+        for _, path in entries[:max(excess, 0)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._count = len(entries) - max(excess, 0)
+
+
+class PredictionCache:
+    def __init__(self, max_entries: int = SKIN_PREDICTION_CACHE_ENTRIES,
+                 directory: Optional[str] = SKIN_PREDICTION_CACHE_DIR or None,
+                 disk_entries: int = SKIN_PREDICTION_CACHE_DISK_ENTRIES):
+        self.memory = LRUCache(max_entries)
+        self.disk = DiskTier(directory, disk_entries) if directory else None
+        self.model_key = ""
+        self.hits = 0
+        self.misses = 0
+
+    def use_model(self, model_key: str):
+        """Key predictions by this model from now on (called when a model is loaded)"""
+        self.model_key = model_key
+        self.memory.clear()
+
+    def content_key(self, contents: bytes) -> str:
+        return f"{_digest(self.model_key.encode())[:12]}:b:{_digest(contents)}"
+
+    def pixel_key(self, pixels: np.ndarray) -> str:
+        return f"{_digest(self.model_key.encode())[:12]}:p:{_digest(np.ascontiguousarray(pixels).data)}"
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        value = await self.memory.get(key)
+        if value is None and self.disk is not None:
+            value = await asyncio.to_thread(self.disk.get, key)
+            if value is not None:
+                await self.memory.set(key, value, TTL)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(value)
+
+    async def set(self, keys: Iterable[str], prediction: Dict[str, Any]):
+        value = json.dumps(prediction).encode()
+        for key in keys:
+            await self.memory.set(key, value, TTL)
+            if self.disk is not None:
+                try:
+                    await asyncio.to_thread(self.disk.set, key, value)
+                except OSError as e:
+                    logger.warning(f"⚠️ Skin prediction cache: disk write failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": self.memory.size(),
+            "disk": self.disk is not None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
@@ -0,0 +1,122 @@
+# app/skin_analysis/preprocess.py
+"""
+Upload reading and image decoding for the skin model.
+
+- uploads are read in chunks and refused once they pass SKIN_MAX_UPLOAD_BYTES,
+  before the rest is buffered
+- JPEGs are decoded at reduced size (`Image.draft`: the decoder skips DCT
+  coefficients and produces 1/2, 1/4 or 1/8 scale directly, never smaller
+  than 224x224), so a 12 MP phone photo is never materialised at full size
+- decoding runs on a small thread pool (Pillow releases the GIL while it
+  decodes), off the event loop and off the single inference thread
+- pixels stay uint8 until the inference engine copies the batch into its
+  reusable float32 buffer
+
+Compare against the previous full-resolution decode with
+
+    python -m app.skin_analysis.preprocess --images samples/
+"""
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from app.config import SKIN_DECODE_WORKERS, SKIN_MAX_UPLOAD_BYTES
+
+TARGET_SIZE = (224, 224)
+READ_CHUNK = 1024 * 1024
+
+decode_executor = ThreadPoolExecutor(max_workers=SKIN_DECODE_WORKERS, thread_name_prefix="skin-decode")
+
+
+class UploadTooLarge(ValueError):
+    """Upload bigger than SKIN_MAX_UPLOAD_BYTES; callers should answer 413"""
+
+
+async def read_upload(file, max_bytes: int = SKIN_MAX_UPLOAD_BYTES) -> bytes:
+    """Body of an UploadFile, read chunk by chunk up to `max_bytes`"""
+    chunks, size = [], 0
+    while True:
+        chunk = await file.read(READ_CHUNK)
+        if not chunk:
+            return b"".join(chunks)
+        size += len(chunk)
+        if size > max_bytes:
+            raise UploadTooLarge(f"Image is larger than {max_bytes // (1024 * 1024)} MB")
+        chunks.append(chunk)
+
+
+def decode_pixels(file_contents: bytes) -> np.ndarray:
+    """(224, 224, 3) uint8 RGB array; JPEGs are scaled while decoding"""
+    from PIL import Image
+
+    with Image.open(io.BytesIO(file_contents)) as img:
+        # No-op for PNG/BMP; for JPEG picks the smallest DCT scale >= TARGET_SIZE
+        img.draft("RGB", TARGET_SIZE)
+        # Nearest-neighbour like keras' load_img (tensorflow.keras.preprocessing)
+        img = img.convert("RGB").resize(TARGET_SIZE, Image.NEAREST)
+        return np.asarray(img, dtype=np.uint8)
+
+
+def decode_image(file_contents: bytes) -> np.ndarray:
+    """(224, 224, 3) float32 RGB array, as the backends take it"""
+    return decode_pixels(file_contents).astype(np.float32)
+
+
+def decode_full_resolution(file_contents: bytes) -> np.ndarray:
+    """The previous pipeline: full-size decode, then resize (benchmark reference)"""
+    from PIL import Image
+
+    with Image.open(io.BytesIO(file_contents)) as img:
+        img = img.convert("RGB").resize(TARGET_SIZE, Image.NEAREST)
+        return np.asarray(img, dtype=np.float32)
+
+
+def main():
+    import argparse
+    import json
+    import time
+
+    parser = argparse.ArgumentParser(description="Time the reduced-size decode against the full-resolution one")
+    parser.add_argument("--images", help="directory of phone photos (default: a synthetic 12 MP JPEG)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.images:
+        names = sorted(n for n in os.listdir(args.images) if n.lower().endswith((".jpg", ".jpeg", ".png", ".bmp")))
+        samples = []
+        for name in names:
+            with open(os.path.join(args.images, name), "rb") as f:
+                samples.append(f.read())
+    else:
+        from PIL import Image
+
+        # Smooth gradients plus noise compress like a photo, unlike pure noise
+        y, x = np.mgrid[0:3000, 0:4000]
+        pixels = np.stack([x % 256, y % 256, (x + y) % 256], axis=-1).astype(np.int16)
+        pixels += np.random.default_rng(0).integers(-4, 4, pixels.shape, dtype=np.int16)
+        buffer = io.BytesIO()
+        Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8)).save(buffer, format="JPEG", quality=90)
+        samples = [buffer.getvalue()]
+
+    results = {}
+    for name, decode in (("full_resolution", decode_full_resolution), ("draft", decode_image)):
+        timings = []
+        for _ in range(args.repeat):
+            for contents in samples:
+                started = time.perf_counter()
+                decode(contents)
+                timings.append((time.perf_counter() - started) * 1000)
+        results[name] = {
+            "ms_p50": round(float(np.percentile(timings, 50)), 1),
+            "ms_p95": round(float(np.percentile(timings, 95)), 1),
+        }
+    diffs = [np.abs(decode_full_resolution(c) - decode_image(c)).mean() for c in samples]
+    results["mean_abs_pixel_diff"] = round(float(np.mean(diffs)), 2)
+    results["images"] = len(samples)
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+# app/skin_analysis/registry.py
+"""
+Versions of the skin model and the one that serves.
+
+A version is a model file in SKIN_MODEL_DIR named after it:
+`<version>.keras` for the keras backend, `<version>.tflite` for tflite, with
+an optional `<version>.classes.json` when its classes differ from
+class_indices.json.
+
+Activating a version loads it in a worker thread and runs warm-up batches (at
+batch size 1 and the engine's largest) so graph tracing and tensor
+allocation happen before the first upload. Only then does it replace the
+active version, in one assignment: new uploads go to the new model, and
+batches already queued on the old one finish there before its engine stops.
+Each version has its own batching engine, so a prediction is always
+formatted with the classes of the model that produced it.
+
+Swaps are per worker process; with several workers, call the admin endpoint
+on each or set SKIN_MODEL_VERSION and restart.
+"""
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional, Set
+
+import numpy as np
+
+from app.skin_analysis.inference import BatchedInferenceEngine
+
+logger = logging.getLogger(__name__)
+
+EXTENSIONS = {"keras": ".keras", "tflite": ".tflite"}
+
+# Batch latencies kept per version for the p50/p95 on /health
+LATENCY_WINDOW = 500
+
+
+class ModelVersion:
+    def __init__(self, version: str, path: str, predictor: Any, engine_factory: Callable[..., BatchedInferenceEngine]):
+        self.version = version
+        self.path = path
+        self.predictor = predictor
+        self.engine = engine_factory(self.predict_batch)
+        self.loaded_at = datetime.utcnow()
+        self.warmup_ms: Optional[float] = None
+        self.batches = 0
+        self.images = 0
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    def predict_batch(self, batch: np.ndarray) -> np.ndarray:
+        """The predictor's forward pass, timed (runs on the engine's thread)"""
+        started = time.perf_counter()
+        probabilities = self.predictor.predict_batch(batch)
+        self._latencies.append((time.perf_counter() - started) * 1000)
+        self.batches += 1
+        self.images += len(batch)
+        return probabilities
+
+    def warm_up(self, image_shape, batch_sizes):
+        started = time.perf_counter()
+        for size in batch_sizes:
+            self.predictor.predict_batch(np.zeros((size,) + tuple(image_shape), dtype=np.float32))
+        self.warmup_ms = round((time.perf_counter() - started) * 1000, 1)
+
+    def stats(self) -> Dict[str, Any]:
+        latencies = list(self._latencies)
+        return {
+            "version": self.version,
+            "loaded_at": self.loaded_at.isoformat(),
+            "warmup_ms": self.warmup_ms,
+            "batches": self.batches,
+            "images": self.images,
+            "batch_ms_p50": round(float(np.percentile(latencies, 50)), 1) if latencies else None,
+            "batch_ms_p95": round(float(np.percentile(latencies, 95)), 1) if latencies else None,
+            "queue_depth": self.engine.queue_depth,
+        }
+
+
+class ModelRegistry:
+    def __init__(
+        self,
+        directory: str,
+        backend: str,
+        load_predictor: Callable[[str, str], Any],
+        class_json_path: str,
+        engine_factory: Callable[..., BatchedInferenceEngine],
+        warmup_batch_sizes=(1,),
+        image_shape=(224, 224, 3),
+        paths: Optional[Dict[str, str]] = None,
+        on_activate: Optional[Callable[[ModelVersion], None]] = None,
+    ):
+        self.directory = directory
+        self.backend = backend
+        self.load_predictor = load_predictor      # (model path, class json path) -> predictor
+        self.class_json_path = class_json_path
+        self.engine_factory = engine_factory
+        self.warmup_batch_sizes = sorted(set(warmup_batch_sizes))
+        self.image_shape = image_shape
+        self.paths = dict(paths or {})            # versions stored outside `directory`
+        self.on_activate = on_activate
+        self.active: Optional[ModelVersion] = None
+        self.status = "not_loaded"                # not_loaded -> loading -> ready | failed
+        self.loading: Optional[str] = None
+        self.retired: Dict[str, Dict[str, Any]] = {}  # last stats of versions swapped out
+        self._swap_lock = asyncio.Lock()
+        self._draining: Set[asyncio.Task] = set()
+
+    # ------------------------------------------------------------ versions
+
+    def available(self) -> List[str]:
+        extension = EXTENSIONS.get(self.backend, "")
+        found = set(self.paths)
+        if os.path.isdir(self.directory):
+            found.update(name[:-len(extension)] for name in os.listdir(self.directory) if name.endswith(extension))
+        return sorted(found)
+
+    def model_path(self, version: str) -> str:
+        if version not in self.available():
+            raise KeyError(f"Unknown skin model version {version!r}")
+        return self.paths.get(version) or os.path.join(self.directory, version + EXTENSIONS[self.backend])
+
+    def _class_path(self, version: str) -> str:
+        own = os.path.join(os.path.dirname(self.model_path(version)), f"{version}.classes.json")
+        return own if os.path.exists(own) else self.class_json_path
+
+    def _load(self, version: str) -> ModelVersion:
+        """Blocking: load and warm up; run it off the event loop"""
+        path = self.model_path(version)
+        model = ModelVersion(version, path, self.load_predictor(path, self._class_path(version)), self.engine_factory)
+        model.warm_up(self.image_shape, self.warmup_batch_sizes)
+        logger.info(f"🔥 Skin model {version} warmed up in {model.warmup_ms} ms")
+        return model
+
+    # ------------------------------------------------------------ swapping
+
+    async def activate(self, version: str) -> ModelVersion:
+        """Load `version` and make it serve; the current version keeps serving if loading fails"""
+        async with self._swap_lock:
+            if self.active is not None and self.active.version == version:
+                return self.active
+            self.model_path(version)  # KeyError before any work
+            self.loading = version
+            if self.active is None:
+                self.status = "loading"
+            try:
+                model = await asyncio.to_thread(self._load, version)
+            except Exception:
+                if self.active is None:
+                    self.status = "failed"
+                raise
+            finally:
+                self.loading = None
+
+            previous, self.active = self.active, model
+            self.status = "ready"
+            if self.on_activate:
+                self.on_activate(model)
+            if previous is not None:
+                self.retired[previous.version] = previous.stats()
+                task = asyncio.get_running_loop().create_task(previous.engine.drain())
+                self._draining.add(task)
+                task.add_done_callback(self._draining.discard)
+            self.retired.pop(version, None)
+            logger.info(f"🔀 Skin model {version} is active" + (f" (was {previous.version})" if previous else ""))
+            return model
+
+    async def close(self):
+        for task in list(self._draining):
+            task.cancel()
+        await asyncio.gather(*self._draining, return_exceptions=True)
+        if self.active is not None:
+            await self.active.engine.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        versions = dict(self.retired)
+        if self.active is not None:
+            versions[self.active.version] = self.active.stats()
+        return {
+            "active_version": self.active.version if self.active else None,
+            "loading_version": self.loading,
+            "available_versions": self.available(),
+            "versions": versions,
+        }
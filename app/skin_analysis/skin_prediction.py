@@ -1,10 +1,8 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Form
-from fastapi.responses import JSONResponse
-from typing import Optional, List, Dict
-import tensorflow as tf
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Form, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import Optional, List, Dict, Tuple
 import numpy as np
-from tensorflow.keras.preprocessing import image
-from tensorflow.keras.applications.efficientnet_v2 import preprocess_input
+import asyncio
 import json
 import os
 from pathlib import Path
@@ -15,86 +13,168 @@ import logging
 import tempfile
 from datetime import datetime
 
+from app.authentication.dependencies import require_admin
+from app.cache.services import cached_route, invalidate
+from app.config import (
+    SKIN_BATCH_SIZE, SKIN_BATCH_WAIT_MS, SKIN_MODEL_BACKEND, SKIN_MODEL_DIR, SKIN_MODEL_VERSION, SKIN_QUEUE_DEPTH,
+    SKIN_TFLITE_MODEL_PATH,
+)
+from app.models import User
+from app.skin_analysis.backends import load_backend
+from app.skin_analysis.inference import BatchedInferenceEngine, InferenceQueueFull
+from app.skin_analysis.jobs import DONE, PENDING, AnalysisJobs, AnalysisStore
+from app.skin_analysis.prediction_cache import PredictionCache
+from app.skin_analysis.registry import ModelRegistry, ModelVersion
+from app.skin_analysis.preprocess import UploadTooLarge, decode_executor, decode_pixels, read_upload
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Skin Analysis"])  # Remove the prefix
+# Where main.py mounts the router; used for the result URLs of queued jobs
+router_prefix = "/api/skin-analysis"
 
 class SkinDiseasePredictor:
-    def __init__(self, model_path: str, class_json_path: str):
+    def __init__(self, model_path: str, class_json_path: str, backend: str = "keras", tflite_path: Optional[str] = None):
         try:
-            self.model = tf.keras.models.load_model(model_path)
+            self.model = load_backend(backend, model_path, tflite_path or TFLITE_MODEL_PATH)
             with open(class_json_path, 'r') as f:
                 self.class_indices = json.load(f)
             self.class_names = {v: k for k, v in self.class_indices.items()}
-            logger.info(f"✅ Model loaded successfully. Classes: {len(self.class_names)}")
+            logger.info(f"✅ Model loaded successfully ({backend}). Classes: {len(self.class_names)}")
         except Exception as e:
             logger.error(f"❌ Failed to load model: {e}")
             raise
 
+    def predict_batch(self, batch: np.ndarray) -> np.ndarray:
+        """Class probabilities for a (N, 224, 224, 3) batch, one forward pass"""
+        return self.model.predict_batch(batch)
+
+    def format_prediction(self, probabilities: np.ndarray, top_k: int = 3) -> Dict:
+        """Response dict for the probabilities of one image"""
+        predicted_class_idx = int(np.argmax(probabilities))
+        confidence = probabilities[predicted_class_idx]
+        
+        # Get top K predictions
+        top_k_indices = np.argsort(probabilities)[-top_k:][::-1]
+        top_k_predictions = []
+        
+        for idx in top_k_indices:
+            top_k_predictions.append({
+                'class_name': self.class_names[int(idx)],
+                'confidence': float(probabilities[idx])
+            })
+        
+        return {
+            'primary_prediction': {
+                'class_name': self.class_names[predicted_class_idx],
+                'confidence': float(confidence)
+            },
+            'top_predictions': top_k_predictions,
+            'all_predictions': {self.class_names[i]: float(pred) for i, pred in enumerate(probabilities)}
+        }
+
     def predict_image(self, img_array: np.ndarray, top_k: int = 3) -> Dict:
         """Predict skin disease from image array"""
         try:
-            # Preprocess image
-            img_array = preprocess_input(img_array)
-            
-            # Make prediction
-            predictions = self.model.predict(img_array, verbose=0)
-            predicted_class_idx = np.argmax(predictions[0])
-            confidence = predictions[0][predicted_class_idx]
-            
-            # Get top K predictions
-            top_k_indices = np.argsort(predictions[0])[-top_k:][::-1]
-            top_k_predictions = []
-            
-            for idx in top_k_indices:
-                top_k_predictions.append({
-                    'class_name': self.class_names[idx],
-                    'confidence': float(predictions[0][idx])
-                })
-            
-            return {
-                'primary_prediction': {
-                    'class_name': self.class_names[predicted_class_idx],
-                    'confidence': float(confidence)
-                },
-                'top_predictions': top_k_predictions,
-                'all_predictions': {self.class_names[i]: float(pred) for i, pred in enumerate(predictions[0])}
-            }
+            return self.format_prediction(self.predict_batch(img_array)[0], top_k=top_k)
         except Exception as e:
             logger.error(f"Prediction error: {e}")
             raise
 current_dir = os.path.dirname(os.path.abspath(__file__))           
 
-# Initialize the predictor
+# Default model files; other versions sit next to them (SKIN_MODEL_DIR)
 MODEL_PATH = os.path.join(current_dir, "skin_model_finetuned_20251023-225002.keras")
+TFLITE_MODEL_PATH = SKIN_TFLITE_MODEL_PATH or os.path.join(current_dir, "skin_model_finetuned_20251023-225002.tflite")
 CLASS_JSON_PATH = os.path.join(current_dir, "class_indices.json")
+DEFAULT_MODEL_VERSION = SKIN_MODEL_VERSION or Path(MODEL_PATH).stem
+
+
+def _model_activated(model: ModelVersion):
+    prediction_cache.use_model(f"{SKIN_MODEL_BACKEND}:{model.version}")
+    invalidate(["skin_model"])
 
-try:
-    predictor = SkinDiseasePredictor(MODEL_PATH, CLASS_JSON_PATH)
-    logger.info("🚀 Skin Disease Predictor initialized successfully!")
-except Exception as e:
-    logger.error(f"Failed to initialize predictor: {e}")
-    predictor = None
 
-# In-memory storage for analysis results
-analysis_storage = {}
+# Loaded in the background once the server is up, swapped by the admin endpoint
+registry = ModelRegistry(
+    SKIN_MODEL_DIR or current_dir,
+    SKIN_MODEL_BACKEND,
+    lambda path, class_path: SkinDiseasePredictor(path, class_path, backend=SKIN_MODEL_BACKEND, tflite_path=path),
+    CLASS_JSON_PATH,
+    lambda predict_batch: BatchedInferenceEngine(
+        predict_batch,
+        max_batch_size=SKIN_BATCH_SIZE,
+        max_wait_ms=SKIN_BATCH_WAIT_MS,
+        max_queue=SKIN_QUEUE_DEPTH,
+    ),
+    warmup_batch_sizes=(1, SKIN_BATCH_SIZE),
+    paths={Path(TFLITE_MODEL_PATH).stem: TFLITE_MODEL_PATH} if SKIN_MODEL_BACKEND == "tflite" else None,
+    on_activate=_model_activated,
+)
+_load_task: Optional[asyncio.Task] = None
+
+
+async def load_default_model():
+    try:
+        await registry.activate(DEFAULT_MODEL_VERSION)
+        logger.info("🚀 Skin Disease Predictor initialized successfully!")
+    except Exception as e:
+        registry.status = "failed"
+        logger.error(f"Failed to initialize predictor: {e}")
+
+
+def start_background_load():
+    """Load and warm up the default model without blocking startup (called from the app lifespan)"""
+    global _load_task
+    if _load_task is None and registry.active is None:
+        _load_task = asyncio.get_running_loop().create_task(load_default_model())
+
+
+def require_model() -> ModelVersion:
+    """The serving model version; 503 while none is ready"""
+    model = registry.active
+    if model is None:
+        if registry.status in ("not_loaded", "loading"):
+            raise HTTPException(
+                status_code=503,
+                detail="Skin analysis model is still loading, retry shortly",
+                headers={"Retry-After": "5"},
+            )
+        raise HTTPException(status_code=503, detail="Skin analysis service is not available")
+    return model
+
+
+async def shutdown():
+    """Stop pending jobs and the batching workers (called from the app lifespan)"""
+    await analysis_jobs.stop()
+    await registry.close()
+
+# Analysis results, shared by every worker through the database
+analysis_store = AnalysisStore()
+analysis_jobs = AnalysisJobs(analysis_store)
+
+# Seconds between database reads while an /events stream waits for a job
+JOB_POLL_SECONDS = 0.5
+
+# Predictions of images seen before, by content hash
+prediction_cache = PredictionCache()
+
+def validate_extension(filename: str):
+    valid_extensions = {'.jpg', '.jpeg', '.png', '.bmp'}
+    file_ext = Path(filename).suffix.lower()
+    if file_ext not in valid_extensions:
+        raise HTTPException(status_code=400, detail=f"Invalid file type. Supported types: {', '.join(valid_extensions)}")
 
 def validate_and_process_image(file_contents: bytes, filename: str) -> np.ndarray:
     """Validate and process uploaded image file for model prediction"""
     try:
         # Validate file extension
-        valid_extensions = {'.jpg', '.jpeg', '.png', '.bmp'}
-        file_ext = Path(filename).suffix.lower()
-        if file_ext not in valid_extensions:
-            raise HTTPException(status_code=400, detail=f"Invalid file type. Supported types: {', '.join(valid_extensions)}")
+        validate_extension(filename)
         
         # Try to open and process the image
         try:
-            img = image.load_img(io.BytesIO(file_contents), target_size=(224, 224))
-            img_array = image.img_to_array(img)
-            img_array = np.expand_dims(img_array, axis=0)
+            img_array = np.expand_dims(decode_pixels(file_contents), axis=0)
             return img_array
         except Exception as img_error:
             raise HTTPException(status_code=400, detail=f"Invalid image file: {str(img_error)}")
@@ -104,7 +184,35 @@ def validate_and_process_image(file_contents: bytes, filename: str) -> np.ndarra
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error processing image: {str(e)}")
 
+async def process_image(file_contents: bytes, filename: str) -> np.ndarray:
+    """validate_and_process_image on the decode thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(decode_executor, validate_and_process_image, file_contents, filename)
+
+async def read_image_upload(file: UploadFile) -> bytes:
+    """Upload body; 413 as soon as it passes SKIN_MAX_UPLOAD_BYTES"""
+    try:
+        return await read_upload(file)
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+
+
 
+async def predict_pixels(img_array: np.ndarray, content_key: str) -> Tuple[Dict, bool]:
+    """(prediction, cached) for a decoded image; the model only runs for pixels not seen before"""
+    pixel_key = prediction_cache.pixel_key(img_array)
+    result = await prediction_cache.get(pixel_key)
+    cached = result is not None
+    if not cached:
+        model = require_model()
+        # Queued and batched with concurrent uploads, run off the event loop
+        probabilities = await model.engine.submit(img_array[0])
+        result = model.predictor.format_prediction(probabilities, top_k=3)
+        if registry.active is not model:
+            # Swapped meanwhile: the cache keys now belong to the new version
+            return result, False
+    await prediction_cache.set([content_key, pixel_key] if not cached else [content_key], result)
+    return result, cached
 
 
 # CHANGE ONLY THESE ENDPOINT NAMES:
@@ -114,52 +222,55 @@ async def predict_from_upload(file: UploadFile = File(...)):
     """
     Predict from uploaded image (gallery)
     """
-    if predictor is None:
-        raise HTTPException(status_code=503, detail="Skin analysis service is not available")
+    require_model()
+    
+    logger.debug(f"🔍 File received - name: {file.filename}, type: {file.content_type}")
     
-    print(f"🔍 DEBUG: File received - name: {file.filename}, type: {file.content_type}")
+    # Read file contents (size-capped)
+    contents = await read_image_upload(file)
     
     try:
-        # Read file contents
-        contents = await file.read()
-        print(f"🔍 DEBUG: File size: {len(contents)} bytes")
+        logger.debug(f"🔍 File size: {len(contents)} bytes")
         
         if len(contents) == 0:
             raise HTTPException(status_code=400, detail="Uploaded file is empty")
         
-        # Debug: Check first few bytes
-        print(f"🔍 DEBUG: First 10 bytes: {contents[:10]}")
+        logger.debug(f"🔍 First 10 bytes: {contents[:10]}")
         
-        # Validate and process image
-        img_array = validate_and_process_image(contents, file.filename)
-        print(f"🔍 DEBUG: Image processed successfully, array shape: {img_array.shape}")
-        
-        # Make prediction
-        result = predictor.predict_image(img_array, top_k=3)
-        print(f"🔍 DEBUG: Prediction completed successfully")
+        # Same bytes as an earlier upload: answer from the cache without decoding
+        validate_extension(file.filename)
+        content_key = prediction_cache.content_key(contents)
+        result = await prediction_cache.get(content_key)
+        cached = result is not None
+        if not cached:
+            # Validate and process image
+            img_array = await process_image(contents, file.filename)
+            logger.debug(f"🔍 Image processed successfully, array shape: {img_array.shape}")
+            result, cached = await predict_pixels(img_array, content_key)
+        logger.debug(f"🔍 Prediction completed successfully (cached: {cached})")
         
         # Generate analysis ID
         analysis_id = str(uuid.uuid4())
         
         # Store analysis result
-        analysis_storage[analysis_id] = {
-            'analysis_id': analysis_id,
-            'filename': file.filename,
-            'timestamp': datetime.now().isoformat(),
-            'results': result,
-            'file_size': len(contents)
-        }
+        await analysis_store.create(analysis_id, file.filename, len(contents), results=result)
         
         return {
             'success': True,
             'analysis_id': analysis_id,
             'primary_prediction': result['primary_prediction'],
             'top_predictions': result['top_predictions'],
-            'filename': file.filename
+            'filename': file.filename,
+            'cached': cached
         }
         
+    except HTTPException:
+        # Empty upload, bad extension, undecodable image: keep the status code
+        raise
+    except InferenceQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "1"})
     except Exception as e:
-        print(f"❌ DEBUG: Prediction failed: {e}")
+        logger.error(f"❌ Prediction failed: {e}")
         return {
             'success': False,
             'error': str(e)
@@ -177,20 +288,130 @@ async def predict_from_camera(file: UploadFile = File(...)):
     return await predict_from_upload(file)
 
 
+@router.post("/jobs", status_code=202)
+async def submit_analysis_job(file: UploadFile = File(...)):
+    """
+    Queue an uploaded image for analysis and answer at once with its
+    analysis_id; the result is read from /analysis/{id} (poll) or
+    /analysis/{id}/events (server-sent events) when the model has run.
+    """
+    engine = require_model().engine
+    if engine.queue_depth >= engine.max_queue:
+        raise HTTPException(status_code=429, detail="Skin analysis queue is full", headers={"Retry-After": "1"})
+
+    contents = await read_image_upload(file)
+    if len(contents) == 0:
+        raise HTTPException(status_code=400, detail="Uploaded file is empty")
+    validate_extension(file.filename)
+    analysis_id = str(uuid.uuid4())
+
+    # Seen before: the job is done before it starts
+    content_key = prediction_cache.content_key(contents)
+    result = await prediction_cache.get(content_key)
+    if result is not None:
+        await analysis_store.create(analysis_id, file.filename, len(contents), results=result)
+    else:
+        img_array = await process_image(contents, file.filename)
+
+        async def analyse():
+            prediction, _ = await predict_pixels(img_array, content_key)
+            return prediction
+
+        await analysis_store.create(analysis_id, file.filename, len(contents))
+        analysis_jobs.start(analysis_id, analyse)
+    return {
+        'analysis_id': analysis_id,
+        'status': PENDING if result is None else DONE,
+        'cached': result is not None,
+        'result_url': f"{router_prefix}/analysis/{analysis_id}",
+        'events_url': f"{router_prefix}/analysis/{analysis_id}/events",
+    }
+
+
+@router.get("/analysis/{analysis_id}")
+async def get_analysis(analysis_id: str):
+    """Stored result of an analysis (any mode, any worker); status pending, done or failed"""
+    analysis = await analysis_store.get(analysis_id)
+    if analysis is None:
+        raise HTTPException(status_code=404, detail="Analysis not found")
+    return analysis
+
+
+@router.get("/analysis/{analysis_id}/events")
+async def stream_analysis(analysis_id: str, request: Request):
+    """
+    Server-sent events for one analysis: `pending` right away, then a single
+    `done` or `failed` event carrying the analysis, after which the stream ends.
+    """
+    analysis = await analysis_store.get(analysis_id)
+    if analysis is None:
+        raise HTTPException(status_code=404, detail="Analysis not found")
+
+    async def events():
+        current = analysis
+        yield f"event: {current['status']}\ndata: {json.dumps(current)}\n\n"
+        while current['status'] == PENDING:
+            await asyncio.sleep(JOB_POLL_SECONDS)
+            if await request.is_disconnected():
+                return
+            current = await analysis_store.get(analysis_id)
+            if current['status'] != PENDING:
+                yield f"event: {current['status']}\ndata: {json.dumps(current)}\n\n"
+            else:
+                yield ": keep-alive\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/health")
 async def health_check():
-    status = "healthy" if predictor is not None else "unhealthy"
+    model = registry.active
+    status = "healthy" if model is not None else "unhealthy"
     return {
         'status': status,
-        'total_classes': len(predictor.class_names) if predictor else 0,
-        'model_loaded': predictor is not None,
+        'model_status': registry.status,
+        'model_backend': SKIN_MODEL_BACKEND,
+        'model_version': model.version if model else None,
+        'queue_depth': model.engine.queue_depth if model else 0,
+        'running_jobs': analysis_jobs.running,
+        'prediction_cache': prediction_cache.stats(),
+        'models': registry.stats()['versions'],
+        'total_classes': len(model.predictor.class_names) if model else 0,
+        'model_loaded': model is not None,
         'timestamp': datetime.now().isoformat()
     }
 
+
+@router.get("/models")
+async def list_models(current_user: User = Depends(require_admin)):
+    """Model versions found in the model directory, and which one serves"""
+    return registry.stats()
+
+
+@router.post("/models/{version}/activate")
+async def activate_model(version: str, current_user: User = Depends(require_admin)):
+    """
+    Load a model version, warm it up and make it serve on this worker. The
+    current version keeps answering until the new one is ready, and stays
+    active if the new one fails to load.
+    """
+    try:
+        model = await registry.activate(version)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e.args[0]))
+    except Exception as e:
+        logger.error(f"❌ Activating skin model {version} failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Could not load model {version}: {e}")
+    return {'active_version': model.version, 'model': model.stats()}
+
 @router.get("/classes")
+@cached_route("skin.classes", tags=["skin_model"], ttl=3600)
 async def get_available_classes():
-    if predictor is None:
-        raise HTTPException(status_code=503, detail="Skin analysis service is not available")
+    predictor = require_model().predictor
     
     classes = [
         {
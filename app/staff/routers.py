@@ -3,6 +3,7 @@ from fastapi.responses import HTMLResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
+from app.cache.services import get_or_set
 from app.database import get_db
 from app.models import User, Appointment
 from app.authentication.dependencies import require_admin, require_staff, require_doctor
@@ -149,14 +150,17 @@ async def get_staff_dashboard_data(
     db: Session = Depends(get_db)
 ):
     """Get staff dashboard statistics - Staff only"""
-    total_patients = db.query(User).filter(User.role == "patient").count()
-    total_appointments = db.query(Appointment).count()
-    pending_appointments = db.query(Appointment).filter(Appointment.status == "pending").count()
-    
+    def count():
+        return {
+            "total_patients": db.query(User).filter(User.role == "patient").count(),
+            "total_appointments": db.query(Appointment).count(),
+            "pending_appointments": db.query(Appointment).filter(Appointment.status == "pending").count(),
+        }
+
+    # Same counts for every staff member; recomputed after user/appointment writes
+    counts = await get_or_set("staff.dashboard_counts", count, tags=["users", "appointments"])
     return {
-        "total_patients": total_patients,
-        "total_appointments": total_appointments,
-        "pending_appointments": pending_appointments,
+        **counts,
         "user_role": current_user.role.value
     }
 
@@ -1,143 +1,57 @@
-from app.database import engine, Base
+from contextlib import asynccontextmanager
+import asyncio
 from app import models
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, HTMLResponse
 import os
-from app.database import engine, Base
-from sqlalchemy import inspect
-from app.health_progress.urological.models import UrologicalSurgeryEntry
-from app.health_progress.gynecologic.models import GynecologicSurgeryEntry
-from app.models import User
-from app.medical_record.models import MedicalRecord
-from app.health_progress.cesarean.models import CesareanSectionEntry
-from app.health_progress.hypertension.models import HypertensionEntry
-from app.health_progress.diabetes.models import DiabetesEntry
-from app.health_progress.orthopedic.models import OrthopedicSurgeryEntry
-from app.health_progress.bariatric.models import BariatricEntry
-from app.health_progress.burn_care.models import BurnCareEntry
+from app.config import RUN_MIGRATIONS_ON_STARTUP
+from app.database import SessionLocal, dispose_async_engine
+from app.schema import migrate_database
+from app.cache.services import close_backend as close_cache, install_cache_hooks
+from app.health_progress.hooks import install_write_hooks
+from app.health_progress.events.broker import close_broker
+from app.chatbot.llm import close_chat_client
 from app.health_progress.general.models import GeneralHealthEntry
-from app.health_progress.heart.models import HeartEntry
 from app.health_progress.diabetes.routers import router as diabetes_router
 from app.health_progress.hypertension.routers import router as hypertension_router
 from app.health_progress.heart.routers import router as heart_router
-from app.health_progress.kidney.models import KidneyEntry
-from app.health_progress.cancer.models import CancerEntry
 from app.health_progress.kidney.routers import router as kidney_router
 from app.health_progress.cancer.routers import router as cancer_router
+from app.skin_analysis import skin_prediction
 from app.skin_analysis.skin_prediction import router as skin_analysis_router
-from app.prenatal.models import PrenatalEntry
-from app.postnatal.models import PostnatalEntry, PostnatalProfile  # ✅ Only once
 from app.postnatal.routers import router as postnatal_router  # ✅ Only once
 
-# Create tables
-Base.metadata.create_all(bind=engine)
-
-# Create postnatal tables
-try:
-    PostnatalEntry.__table__.create(engine, checkfirst=True)
-    print("✅ postnatal_entries table created successfully")
-except Exception as e:
-    print(f"⚠️ Postnatal entries table creation note: {e}")
-
-try:
-    PostnatalProfile.__table__.create(engine, checkfirst=True)
-    print("✅ postnatal_profiles table created successfully")
-except Exception as e:
-    print(f"⚠️ Postnatal profiles table creation note: {e}")
-
-
-# ✅ ADD MISSING TABLE CREATIONS HERE:
-try:
-    OrthopedicSurgeryEntry.__table__.create(engine, checkfirst=True)
-    print("✅ orthopedic_surgery_entries table created successfully")
-except Exception as e:
-    print(f"⚠️ Orthopedic entries table creation note: {e}")
-
-try:
-    UrologicalSurgeryEntry.__table__.create(engine, checkfirst=True)
-    print("✅ urological_surgery_entries table created successfully")
-except Exception as e:
-    print(f"⚠️ Urological entries table creation note: {e}")
-
-try:
-    GynecologicSurgeryEntry.__table__.create(engine, checkfirst=True)
-    print("✅ gynecologic_surgery_entries table created successfully")
-except Exception as e:
-    print(f"⚠️ Gynecologic entries table creation note: {e}")
-
-try:
-    CesareanSectionEntry.__table__.create(engine, checkfirst=True)
-    print("✅ cesarean_section_entries table created successfully")
-except Exception as e:
-    print(f"⚠️ Cesarean entries table creation note: {e}")
-
-try:
-    HypertensionEntry.__table__.create(engine, checkfirst=True)
-    print("✅ hypertension_entries table created successfully")
-except Exception as e:
-    print(f"⚠️ Hypertension entries table creation note: {e}")
-
-try:
-    DiabetesEntry.__table__.create(engine, checkfirst=True)
-    print("✅ diabetes_entries table created successfully")
-except Exception as e:
-    print(f"⚠️ Diabetes entries table creation note: {e}")
-
-try:
-    BariatricEntry.__table__.create(engine, checkfirst=True)
-    print("✅ bariatric_entries table created successfully")
-except Exception as e:
-    print(f"⚠️ Bariatric entries table creation note: {e}")
-
-try:
-    BurnCareEntry.__table__.create(engine, checkfirst=True)
-    print("✅ burn_care_entries table created successfully")
-except Exception as e:
-    print(f"⚠️ Burn care entries table creation note: {e}")
-
-try:
-    GeneralHealthEntry.__table__.create(engine, checkfirst=True)
-    print("✅ general_health_entries table created successfully")
-except Exception as e:
-    print(f"⚠️ General health entries table creation note: {e}")
-
-try:
-    HeartEntry.__table__.create(engine, checkfirst=True)
-    print("✅ heart_entries table created successfully")
-except Exception as e:
-    print(f"⚠️ Heart entries table creation note: {e}")
-
-try:
-    KidneyEntry.__table__.create(engine, checkfirst=True)
-    print("✅ kidney_entries table created successfully")
-except Exception as e:
-    print(f"⚠️ Kidney entries table creation note: {e}")
-
-try:
-    CancerEntry.__table__.create(engine, checkfirst=True)
-    print("✅ cancer_entries table created successfully")
-except Exception as e:
-    print(f"⚠️ Cancer entries table creation note: {e}")
-
-try:
-    PrenatalEntry.__table__.create(engine, checkfirst=True)
-    print("✅ prenatal_entries table created successfully")
-except Exception as e:
-    print(f"⚠️ Prenatal entries table creation note: {e}")
-
-# Check users
-from app.database import SessionLocal
-db = SessionLocal()
-users = db.query(User).all()
-db.close()    
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup work runs here, never at import: importing main.py is free"""
+    print("Healthcare Management API starting up...")
+    if RUN_MIGRATIONS_ON_STARTUP:
+        await asyncio.to_thread(migrate_database)
+    # Committed writes invalidate the cached reads of the tables they touched
+    install_cache_hooks()
+    # Every tracker write from here on also updates the triage queue and
+    # version counters, and is announced to live dashboards once it commits
+    install_write_hooks()
+    # TensorFlow and the Keras model load in a worker thread while the
+    # server already answers requests; skin routes return 503 until ready
+    skin_prediction.start_background_load()
+    yield
+    print("Healthcare Management API shutting down...")
+    await skin_prediction.shutdown()
+    await close_broker()
+    await close_chat_client()
+    await close_cache()
+    await dispose_async_engine()
 
 
 app = FastAPI(
     title="Healthcare Management API",
     description="A comprehensive healthcare management system with progress tracking, appointments, and medical records",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Import all routers
@@ -161,6 +75,14 @@ from app.health_progress.cesarean.routers import router as cesarean_router
 from app.health_progress.gynecologic.routers import router as gynecologic_router
 from app.health_progress.orthopedic.routers import router as orthopedic_router
 from app.health_progress.urological.routers import router as urological_router
+from app.health_progress.feed.routers import router as feed_router
+from app.health_progress.triage.routers import router as triage_router
+from app.health_progress.events.routers import router as events_router
+from app.health_progress.bulk.routers import router as bulk_router
+from app.health_progress.export.routers import router as export_router
+from app.health_progress.timeline.routers import router as timeline_router
+from app.health_progress.vitals.routers import router as vitals_router
+from app.cache.routers import router as cache_router
 from app.health_progress.abdominal.models import AbdominalEntry
 
 # CORS middleware for ngrok
@@ -604,6 +526,7 @@ async def staff_health_progress(request: Request):
             <div id="entriesContainer">
                 <div class="loading">Loading health entries...</div>
             </div>
+            <button id="loadMoreButton" class="control-button" style="display:none" onclick="loadMoreEntries()">Load more</button>
         </div>
     </div>
 
@@ -2717,97 +2640,138 @@ function renderDashboard(entries) {{
 
 
     
- async function loadHealthData() {{
-    
-    try {{
-        console.log("🔄 Fetching health data from individual endpoints...");
-
-        const responses = await Promise.all([
-            fetch('/api/health-progress/abdominal/entries'),
-            fetch('/api/health-progress/cesarean/entries'),
-            fetch('/api/health-progress/diabetes/entries'),
-            fetch('/api/health-progress/hypertension/entries'),
-            fetch('/api/health-progress/orthopedic/entries'),
-            fetch('/api/health-progress/cardiac/entries'),
-            fetch('/api/health-progress/urological/entries'),
-            fetch('/api/health-progress/heart/entries'),
-            fetch('/api/health-progress/general/entries'),
-            fetch('/api/health-progress/burn-care/entries'),
-            fetch('/api/health-progress/gynecologic/entries'),
-            fetch('/api/health-progress/bariatric-entries'),
-            fetch('/api/health-progress/lifelong/entries'),
-            fetch('/api/health-progress/kidney/entries'),  
-            fetch('/api/health-progress/cancer/entries'),
-            fetch('/api/prenatal/entries'),
-
-        ]);
-
-   
-        const [
-            abdominalRes, cesareanRes, diabetesRes, hypertensionRes,
-            orthopedicRes, cardiacRes, urologicalRes, heartRes, generalRes, 
-            burnCareRes, gynecologicRes, bariatricRes, lifelongRes, kidneyRes, cancerRes, prenatalRes
-        ] = responses;
-
-        // ✅ DEBUG: Check what the APIs actually return - AFTER variable definitions
-        console.log("=== EXACT API RESPONSE ===");
-        
-        const abdominalData = await abdominalRes.json();
-        const cesareanData = await cesareanRes.json();
-        const diabetesData = await diabetesRes.json();
-        const hypertensionData = await hypertensionRes.json();
-        const orthopedicData = await orthopedicRes.json();
-        const cardiacData = await cardiacRes.json();
-        const urologicalData = await urologicalRes.json();
-        const heartData = await heartRes.json();
-        const generalData = await generalRes.json();
-        const burnCareData = await burnCareRes.json();
-        const gynecologicData = await gynecologicRes.json();
-        const bariatricData = await bariatricRes.json();
-        const lifelongData = await lifelongRes.json();
-        const kidneyData = await kidneyRes.json();
-        const cancerData = await cancerRes.json();
-        const prenatalData = await prenatalRes.json();
-
+ let nextCursor = null;
 
+ // The feed is staff-only: send the token /api/auth/login issued
+ function authHeaders() {{
+    const token = localStorage.getItem('access_token');
+    return token ? {{ 'Authorization': 'Bearer ' + token }} : {{}};
+}}
 
-        console.log("🔍 PRENATAL API DEBUG:");
-console.log("🔍 Prenatal response status:", prenatalRes.status);
-console.log("🔍 Prenatal data:", prenatalData);
-console.log("🔍 Prenatal entries:", prenatalData.entries);
-console.log("🔍 Prenatal entries length:", prenatalData.entries ? prenatalData.entries.length : 0);
+ function feedQuery() {{
+    const params = new URLSearchParams({{ limit: '200' }});
+    const conditionFilter = document.getElementById('conditionFilter').value;
+    const dateFilter = document.getElementById('dateFilter').value;
+    if (conditionFilter !== 'all') params.append('condition', conditionFilter);
+    if (dateFilter) params.append('date', dateFilter);
+    return params;
+}}
 
+ async function fetchFeedPage(cursor) {{
+    const params = feedQuery();
+    if (cursor) params.append('after', cursor);
+    const response = await fetch('/api/health-progress/feed?' + params.toString(), {{ headers: authHeaders() }});
+    if (!response.ok) throw new Error('Feed request failed with status ' + response.status);
+    const page = await response.json();
+    nextCursor = page.next_cursor;
+    document.getElementById('loadMoreButton').style.display = page.has_more ? 'inline-block' : 'none';
+    return page.entries;
+}}
 
+ async function loadHealthData() {{
+    try {{
+        // One request for every tracker: filtered, merged and paginated server-side
+        allEntries = await fetchFeedPage(null);
+        renderDashboard(allEntries);
+    }} catch (error) {{
+        console.error("❌ Error loading health data:", error);
+        showError('Failed to load health data: ' + error.message);
+    }}
+}}
 
+ async function loadMoreEntries() {{
+    if (!nextCursor) return;
+    try {{
+        allEntries = allEntries.concat(await fetchFeedPage(nextCursor));
+        renderDashboard(allEntries);
+    }} catch (error) {{
+        console.error("❌ Error loading more entries:", error);
+        showError('Failed to load more entries: ' + error.message);
+    }}
+}}
 
+ // Live updates: apply committed tracker writes instead of reloading everything
+ function entryKey(conditionType, entryId) {{
+    return conditionType + ':' + entryId;
+}}
 
-     
+ function matchesFilters(event) {{
+    const conditionFilter = document.getElementById('conditionFilter').value;
+    const dateFilter = document.getElementById('dateFilter').value;
+    if (conditionFilter !== 'all' && event.condition_type !== conditionFilter) return false;
+    if (dateFilter && event.submission_date && event.submission_date !== dateFilter) return false;
+    return true;
+}}
 
-        allEntries = [
-            ...(abdominalData.entries ? abdominalData.entries.map(e => ({{ ...e, condition_type: 'abdominal' }})) : []),
-            ...(cesareanData.entries ? cesareanData.entries.map(e => ({{ ...e, condition_type: 'cesarean' }})) : []),
-            ...(diabetesData.entries ? diabetesData.entries.map(e => ({{ ...e, condition_type: 'diabetes' }})) : []),
-            ...(hypertensionData.entries ? hypertensionData.entries.map(e => ({{ ...e, condition_type: 'hypertension' }})) : []),
-            ...(orthopedicData.entries ? orthopedicData.entries.map(e => ({{ ...e, condition_type: 'orthopedic' }})) : []),
-            ...(cardiacData.entries ? cardiacData.entries.map(e => ({{ ...e, condition_type: 'cardiac' }})) : []),
-            ...(urologicalData.entries ? urologicalData.entries.map(e => ({{ ...e, condition_type: 'urological' }})) : []),
-            ...(heartData.entries ? heartData.entries.map(e => ({{ ...e, condition_type: 'heart' }})) : []),
-            ...(generalData.entries ? generalData.entries.map(e => ({{ ...e, condition_type: 'general_health' }})) : []),
-            ...(burnCareData.entries ? burnCareData.entries.map(e => ({{ ...e, condition_type: 'burn_care' }})) : []),
-            ...(gynecologicData.entries ? gynecologicData.entries.map(e => ({{ ...e, condition_type: 'gynecologic' }})) : []),
-            ...(bariatricData.entries ? bariatricData.entries.map(e => ({{ ...e, condition_type: 'bariatric' }})) : []),
-            ...(lifelongData.entries ? lifelongData.entries.map(e => ({{ ...e, condition_type: 'lifelong' }})) : []),
-            ...(kidneyData.entries ? kidneyData.entries.map(e => ({{ ...e, condition_type: 'kidney' }})) : []), 
-            ...(cancerData.entries ? cancerData.entries.map(e => ({{ ...e, condition_type: 'cancer' }})) : []),
-            ...(prenatalData.entries ? prenatalData.entries.map(e => ({{ ...e, condition_type: 'prenatal' }})) : [])
-        ];
+ async function applyTrackerEvent(event) {{
+    const key = entryKey(event.condition_type, event.entry_id);
+    const others = allEntries.filter(function(e) {{ return entryKey(e.condition_type, e.id) !== key; }});
+    if (event.type === 'deleted') {{
+        allEntries = others;
+    }} else {{
+        if (!matchesFilters(event)) return;
+        const response = await fetch('/api/health-progress/feed/' + event.condition_type + '/' + event.entry_id, {{ headers: authHeaders() }});
+        if (!response.ok) return;
+        const entry = await response.json();
+        const index = allEntries.findIndex(function(e) {{ return entryKey(e.condition_type, e.id) === key; }});
+        if (index >= 0) {{
+            allEntries[index] = entry;
+        }} else {{
+            allEntries = [entry].concat(others);
+        }}
+    }}
+    renderDashboard(allEntries);
+}}
 
-       
+ function handleStreamEvent(type, data) {{
+    // The server could not replay what we missed: start over from the feed
+    if (type === 'reset') return loadHealthData();
+    if (!['created', 'updated', 'saved', 'deleted'].includes(type)) return;
+    applyTrackerEvent(JSON.parse(data)).catch(function(error) {{
+        console.error("❌ Error applying live update:", error);
+    }});
+}}
 
-        renderDashboard(allEntries);
-    }} catch (error) {{
-        console.error("❌ Error loading health data:", error);
-        showError('Failed to load health data: ' + error.message);
+ // EventSource cannot send the Authorization header, so read the event
+ // stream with fetch and do its reconnect-with-Last-Event-ID by hand
+ async function subscribeToUpdates() {{
+    if (!window.ReadableStream || !window.TextDecoder) return;
+    let lastEventId = null;
+    let retryMs = 3000;
+    while (true) {{
+        try {{
+            const headers = authHeaders();
+            if (lastEventId) headers['Last-Event-ID'] = lastEventId;
+            const response = await fetch('/api/health-progress/events', {{ headers: headers }});
+            // Not signed in as staff: reconnecting will not help
+            if (response.status === 401 || response.status === 403) return;
+            if (!response.ok) throw new Error('Event stream failed with status ' + response.status);
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+            while (true) {{
+                const {{ value, done }} = await reader.read();
+                if (done) break;
+                buffer += decoder.decode(value, {{ stream: true }});
+                let end;
+                while ((end = buffer.indexOf('\\n\\n')) >= 0) {{
+                    const block = buffer.slice(0, end);
+                    buffer = buffer.slice(end + 2);
+                    let type = 'message';
+                    const data = [];
+                    block.split('\\n').forEach(function(line) {{
+                        if (line.startsWith('id: ')) lastEventId = line.slice(4);
+                        else if (line.startsWith('event: ')) type = line.slice(7);
+                        else if (line.startsWith('data: ')) data.push(line.slice(6));
+                        else if (line.startsWith('retry: ')) retryMs = parseInt(line.slice(7), 10) || retryMs;
+                    }});
+                    if (data.length) handleStreamEvent(type, data.join('\\n'));
+                }}
+            }}
+        }} catch (error) {{
+            console.error("❌ Live update stream dropped:", error);
+        }}
+        await new Promise(function(resolve) {{ setTimeout(resolve, retryMs); }});
     }}
 }}
 
@@ -2818,29 +2782,8 @@ console.log("🔍 Prenatal entries length:", prenatalData.entries ? prenatalData
 
 
 function filterEntries() {{
-    const conditionFilter = document.getElementById('conditionFilter').value;
-    const dateFilter = document.getElementById('dateFilter').value;
-    
-    let filtered = allEntries;
-    
-    // Filter by condition
-    if (conditionFilter !== 'all') {{
-        filtered = filtered.filter(entry => entry.condition_type === conditionFilter);
-    }}
-    
-    // Simple date filter - just check if the date string exists in any format
-    if (dateFilter) {{
-        // Convert filter date to DD/MM/YYYY format for comparison
-        const [year, month, day] = dateFilter.split('-');
-        const ddMmYyyy = `${{day}}/${{month}}/${{year}}`;
-        
-        filtered = filtered.filter(entry => {{
-            const entryDate = entry.submission_date || entry.created_at?.split('T')[0] || '';
-            return entryDate.includes(dateFilter) || entryDate.includes(ddMmYyyy);
-        }});
-    }}
-    
-    renderEntries(filtered);
+    // Filters are applied by the feed endpoint, so just reload the first page
+    loadHealthData();
 }}
 
 
@@ -3012,6 +2955,7 @@ function renderEntries(entries) {{
 document.addEventListener('DOMContentLoaded', function() {{
     console.log("=== PAGE LOADED ===");
     loadHealthData();
+    subscribeToUpdates();
 }});
 
 
@@ -3137,135 +3081,11 @@ document.addEventListener('DOMContentLoaded', function() {{
 
 
 
-        function filterEntries() {{
-    console.log("=== 🚨 FILTER DEBUG START ===");
-    
-    const conditionFilter = document.getElementById('conditionFilter');
-    const dateFilter = document.getElementById('dateFilter');
-    
-    console.log("1. Filter elements found:", {{
-        conditionFilter: !!conditionFilter,
-        dateFilter: !!dateFilter
-    }});
-    
-    if (!conditionFilter) {{
-        console.error("❌ conditionFilter element not found!");
-        return;
-    }}
-    
-    const filterValue = conditionFilter.value;
-    const dateValue = dateFilter.value;
-    
-    console.log("2. Filter values:", {{
-        condition: filterValue,
-        date: dateValue
-    }});
-    
-    console.log("3. allEntries status:", {{
-        exists: !!allEntries,
-        type: typeof allEntries,
-        length: allEntries ? allEntries.length : 'undefined'
-    }});
-    
-    if (!allEntries || !Array.isArray(allEntries)) {{
-        console.error("❌ allEntries is not a valid array");
-        showError('Data not loaded properly. Please refresh the page.');
-        return;
-    }}
-    
-    console.log("4. Current allEntries content:", {{
-        total: allEntries.length,
-        conditionTypes: [...new Set(allEntries.map(e => e.condition_type))],
-        sampleEntries: allEntries.slice(0, 3).map(e => ({{
-            id: e.id,
-            condition_type: e.condition_type,
-            patient_name: e.patient_name
-        }}))
-    }});
-    
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-    let filtered = allEntries;
-    
-    // Filter by condition
-    if (filterValue !== 'all') {{
-        const before = filtered.length;
-        filtered = filtered.filter(entry => {{
-            const matches = entry.condition_type === filterValue;
-            console.log(`   Checking ${{entry.condition_type}} === ${{filterValue}}: ${{matches}}`);
-            return matches;
-        }});
-        console.log(`5. Condition filter result: ${{before}} → ${{filtered.length}}`);
-    }}
-    
 
 
 
 
 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-    // Filter by date
-    if (dateValue) {{
-        const before = filtered.length;
-        filtered = filtered.filter(entry => {{
-            if (!entry.created_at) {{
-                console.log(`   Entry ${{entry.id}} has no created_at`);
-                return false;
-            }}
-            const entryDate = new Date(entry.created_at).toISOString().split('T')[0];
-            const matches = entryDate === dateValue;
-            console.log(`   Date check: ${{entryDate}} === ${{dateValue}}: ${{matches}}`);
-            return matches;
-        }});
-        console.log(`6. Date filter result: ${{before}} → ${{filtered.length}}`);
-    }}
-    
-    console.log("7. Final filtered data:", {{
-        count: filtered.length,
-        entries: filtered.map(e => ({{
-            id: e.id,
-            condition_type: e.condition_type,
-            patient_name: e.patient_name
-        }}))
-    }});
-    
-    console.log("=== 🚨 FILTER DEBUG END ===");
-    
-    renderEntries(filtered);
-}}
-
-
-
-
     </script>
 </body>
 </html>
@@ -3292,6 +3112,14 @@ app.include_router(gynecologic_router, prefix="/api/health-progress", tags=["Hea
 app.include_router(orthopedic_router, prefix="/api/health-progress", tags=["Health Progress"])
 app.include_router(urological_router, prefix="/api/health-progress", tags=["Health Progress"])
 app.include_router(lifelong_router, prefix="/api/health-progress", tags=["Health Progress"])
+app.include_router(feed_router, prefix="/api/health-progress/feed", tags=["Health Progress Feed"])
+app.include_router(triage_router, prefix="/api/health-progress/triage", tags=["Triage"])
+app.include_router(events_router, prefix="/api/health-progress/events", tags=["Health Progress Events"])
+app.include_router(bulk_router, prefix="/api/health-progress/bulk", tags=["Health Progress Bulk"])
+app.include_router(export_router, prefix="/api/health-progress/export", tags=["Health Progress Export"])
+app.include_router(timeline_router, prefix="/api/patients", tags=["Patient Timeline"])
+app.include_router(vitals_router, prefix="/api/health-progress/vitals", tags=["Vital Trends"])
+app.include_router(cache_router, prefix="/api/cache", tags=["Cache"])
 app.include_router(diabetes_router, prefix="/api/health-progress/diabetes", tags=["diabetes"])
 app.include_router(hypertension_router, prefix="/api/health-progress/hypertension", tags=["hypertension"])
 app.include_router(skin_analysis_router, prefix="/api/skin-analysis", tags=["Skin Analysis"]) 
@@ -3300,13 +3128,3 @@ app.include_router(kidney_router, prefix="/api/health-progress/kidney", tags=["K
 app.include_router(cancer_router, prefix="/api/health-progress/cancer", tags=["Cancer"])
 app.include_router(prenatal_router, prefix="/api/prenatal", tags=["Prenatal"])
 app.include_router(postnatal_router, prefix="/api/postnatal", tags=["Postnatal"])
-
-
-# Optional events (keep these)
-@app.on_event("startup")
-async def startup_event():
-    print("Healthcare Management API starting up...")
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    print("Healthcare Management API shutting down...")
\ No newline at end of file
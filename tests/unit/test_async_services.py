@@ -0,0 +1,72 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.health_progress.kidney.models import KidneyEntry
+from app.health_progress.kidney.services import AsyncKidneyProgressService
+from app.health_progress.pagination import PageParams
+
+
+def async_db_override(path):
+    """get_async_db replacement on the SQLite file at `path` (a fresh connection per request)"""
+    async def get_async_db():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            yield session
+        await engine.dispose()
+    return get_async_db
+
+
+@pytest_asyncio.fixture
+async def db():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(KidneyEntry.__table__.create)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+def kidney_payload(day, **overrides):
+    payload = dict(patient_id=1, patient_name="A", submission_date=f"2025-05-{day:02d}",
+                   blood_pressure_systolic="120", blood_pressure_diastolic="80")
+    payload.update(overrides)
+    return payload
+
+
+@pytest.mark.asyncio
+async def test_async_service_creates_with_calculated_urgency(db):
+    service = AsyncKidneyProgressService(db)
+    entry = await service.create_entry(kidney_payload(1, blood_pressure_systolic="185", blood_pressure_diastolic="125"))
+
+    assert entry.id is not None
+    assert entry.urgency_status == "high"
+    assert await service.check_existing_entry(1, "2025-05-01")
+    assert not await service.check_existing_entry(1, "2025-05-02")
+
+
+@pytest.mark.asyncio
+async def test_async_service_pages_newest_first(db):
+    service = AsyncKidneyProgressService(db)
+    for day in range(1, 6):
+        await service.create_entry(kidney_payload(day))
+
+    first, cursor = await service.get_all_entries(PageParams(limit=3))
+    rest, last_cursor = await service.get_all_entries(PageParams(limit=3, after=cursor))
+
+    assert [e.submission_date[-2:] for e in first + rest] == ["05", "04", "03", "02", "01"]
+    assert last_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_async_service_runs_the_repository_methods(db):
+    service = AsyncKidneyProgressService(db)
+    entry = await service.create_entry(kidney_payload(1))
+
+    page, _ = await service.get_patient_page(1, PageParams(limit=5), columns=["id", "submitted_at"])
+    recent = await service.get_recent_entries(limit=5)
+
+    assert [e.id for e in page] == [e.id for e in recent] == [entry.id]
+    assert await service.delete_entry(entry.id)
+    assert await service.get_entry_by_id(entry.id) is None
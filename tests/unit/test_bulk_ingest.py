@@ -0,0 +1,74 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import get_db
+from app.health_progress.bulk.routers import router as bulk_router
+from app.health_progress.cardiac.models import CardiacSurgeryEntry
+from app.health_progress.hooks import install_write_hooks, remove_write_hooks
+from app.health_progress.kidney.models import KidneyEntry
+from app.health_progress.triage.models import TriageItem
+from app.health_progress.versions.models import TrackerVersion
+from app.health_progress.versions.services import current_versions
+from app.health_progress.vitals.models import VitalObservation
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    for model in (KidneyEntry, CardiacSurgeryEntry, TriageItem, TrackerVersion, VitalObservation):
+        model.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    install_write_hooks()
+    yield session
+    remove_write_hooks()
+    session.close()
+
+
+@pytest.fixture
+def client(db):
+    app = FastAPI()
+    app.include_router(bulk_router, prefix="/bulk")
+    app.dependency_overrides[get_db] = lambda: db
+    return TestClient(app)
+
+
+def kidney(day, patient_id=7, **fields):
+    return {"condition_type": "kidney", "client_id": f"k-{day}",
+            "entry": {"patient_id": patient_id, "patient_name": "A", "submission_date": day, **fields}}
+
+
+def test_mixed_batch_is_validated_deduped_and_stored(client, db):
+    entries = [
+        kidney("2025-05-01", swelling_level=9, breathing_difficulty=8),
+        kidney("2025-05-02"),
+        {"condition_type": "cardiac", "entry": {"patient_id": "7", "submission_date": "2025-05-01",
+                                                "common_data": {"status": "urgent"}}},
+        kidney("2025-05-02"),                                   # repeats item 1
+        kidney("05/03/2025"),                                   # bad date
+        {"condition_type": "teeth", "entry": {"patient_id": 7}},
+    ]
+    body = client.post("/bulk", json={"entries": entries}).json()
+
+    assert [r["status"] for r in body["results"]] == ["created", "created", "created", "duplicate", "invalid", "invalid"]
+    assert (body["created"], body["duplicate"], body["invalid"]) == (3, 1, 2)
+    assert body["results"][0]["client_id"] == "k-2025-05-01"
+
+    stored = db.scalars(select(KidneyEntry).order_by(KidneyEntry.id)).all()
+    assert [(e.submission_date, e.urgency_status) for e in stored] == [("2025-05-01", "medium"), ("2025-05-02", "low")]
+    assert db.scalar(select(CardiacSurgeryEntry.submission_date)).isoformat() == "2025-05-01"
+    assert db.query(TriageItem).count() == 3
+    assert current_versions(db, ["kidney:patient:7"])["kidney:patient:7"][0] == 1
+
+    # A retried sync stores nothing twice
+    replay = client.post("/bulk", json={"entries": entries[:3]}).json()
+    assert [r["status"] for r in replay["results"]] == ["exists"] * 3
+    assert [r["id"] for r in replay["results"]] == [r["id"] for r in body["results"][:3]]
+    assert db.query(KidneyEntry).count() == 2
+
+
+def test_oversized_batches_are_rejected(client):
+    assert client.post("/bulk", json={"entries": [kidney("2025-05-01")] * 2001}).status_code == 422
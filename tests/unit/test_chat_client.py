@@ -0,0 +1,63 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.chatbot import llm
+from app.chatbot.fake_llm import create_app
+from app.chatbot.llm import ChatClient, ChatUnavailable
+
+MESSAGES = [{"role": "system", "content": "Be brief."}, {"role": "user", "content": "hello there"}]
+
+
+def client_for(fake, **options):
+    http = httpx.AsyncClient(transport=httpx.ASGITransport(app=fake), base_url="http://fake")
+    return ChatClient(api_key="test", base_url="http://fake/v1", http_client=http, **options)
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(llm, "BACKOFF_BASE", 0.001)
+
+
+@pytest.mark.asyncio
+async def test_completion_from_the_fake_server():
+    client = client_for(create_app())
+    assert await client.complete(MESSAGES) == "echo: hello there"
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_server_errors_are_retried_then_given_up():
+    fake = create_app(failures=2)
+    client = client_for(fake, max_retries=2)
+    assert await client.complete(MESSAGES) == "echo: hello there"
+    assert fake.state.calls == 3
+
+    fake.state.failures = 5
+    with pytest.raises(ChatUnavailable):
+        await client.complete(MESSAGES)
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_capped_without_blocking_the_loop():
+    client = client_for(create_app(delay=0.1), concurrency=2)
+
+    started = time.perf_counter()
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while time.perf_counter() - started < 0.25:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    replies, _ = await asyncio.gather(asyncio.gather(*(client.complete(MESSAGES) for _ in range(4))), ticker())
+    elapsed = time.perf_counter() - started
+
+    assert len(replies) == 4
+    assert elapsed >= 0.2          # 4 calls, 2 at a time, 0.1 s each
+    assert ticks >= 10             # the event loop kept serving other work meanwhile
+    await client.close()
@@ -0,0 +1,101 @@
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import get_async_db, get_db
+from app.health_progress.heart.models import HeartEntry
+from app.health_progress.heart.routers import router as heart_router
+from app.health_progress.heart.services import HeartProgressService
+from app.health_progress.versions.conditional import last_modified, not_modified_since
+from app.health_progress.versions.models import TrackerVersion
+from app.health_progress.versions.services import current_versions, install_version_hooks, remove_version_hooks
+from app.prenatal.models import PrenatalEntry
+from app.prenatal.services import PrenatalService
+from tests.unit.test_async_services import async_db_override
+from tests.unit.test_daily_upsert import prenatal_payload
+
+
+@pytest.fixture
+def db(tmp_path):
+    # A file, so the async routes' sessions see what the test writes
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}", connect_args={"check_same_thread": False})
+    for model in (HeartEntry, PrenatalEntry, TrackerVersion):
+        model.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    install_version_hooks()
+    yield session
+    remove_version_hooks()
+    session.close()
+
+
+@pytest.fixture
+def client(db):
+    app = FastAPI()
+    app.include_router(heart_router, prefix="/heart")
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_async_db] = async_db_override(db.get_bind().url.database)
+    return TestClient(app)
+
+
+def add_heart_entry(db, patient_id):
+    return HeartProgressService(db).create_entry(
+        dict(patient_id=patient_id, patient_name="A", submission_date="2025-05-01", status="good")
+    )
+
+
+def test_unchanged_listing_is_answered_with_304(client, db):
+    add_heart_entry(db, 1)
+    first = client.get("/heart/entries")
+    etag = first.headers["etag"]
+
+    again = client.get("/heart/entries", headers={"If-None-Match": etag})
+    assert again.status_code == 304 and again.content == b""
+    assert again.headers["etag"] == etag
+
+    # Another page is another representation
+    assert client.get("/heart/entries?limit=1", headers={"If-None-Match": etag}).status_code == 200
+
+    add_heart_entry(db, 2)
+    changed = client.get("/heart/entries", headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
+    assert len(changed.json()["entries"]) == 2
+
+
+def test_patient_etag_only_changes_for_that_patient(client, db):
+    add_heart_entry(db, 1)
+    etag = client.get("/heart/patient/1").headers["etag"]
+
+    add_heart_entry(db, 2)
+    assert client.get("/heart/patient/1", headers={"If-None-Match": etag}).status_code == 304
+
+    entry = add_heart_entry(db, 1)
+    assert client.get("/heart/patient/1", headers={"If-None-Match": etag}).status_code == 200
+
+    etag = client.get("/heart/patient/1").headers["etag"]
+    HeartProgressService(db).delete_entry(entry.id)
+    assert client.get("/heart/patient/1", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_core_upserts_bump_versions(db):
+    PrenatalService.create_prenatal_entry(db, prenatal_payload())
+    PrenatalService.create_prenatal_entry(db, prenatal_payload(status="urgent"))
+
+    versions = current_versions(db, ["prenatal", "prenatal:patient:p1", "prenatal:patient:p2"])
+    assert {scope: version for scope, (version, _) in versions.items()} == {
+        "prenatal": 2, "prenatal:patient:p1": 2, "prenatal:patient:p2": 0,
+    }
+
+
+def test_last_modified_is_withheld_within_the_current_second():
+    written = datetime(2025, 5, 1, 9, 0, 0, 400000)
+    versions = {"heart": (3, written)}
+
+    assert last_modified(versions, datetime(2025, 5, 1, 9, 0, 0, 900000)) is None
+    assert last_modified(versions, datetime(2025, 5, 1, 9, 0, 1)) == datetime(2025, 5, 1, 9, 0, 0)
+    assert not_modified_since("Thu, 01 May 2025 09:00:00 GMT", datetime(2025, 5, 1, 9, 0, 0))
+    assert not not_modified_since("Thu, 01 May 2025 08:59:59 GMT", datetime(2025, 5, 1, 9, 0, 0))
+    assert not not_modified_since("garbage", datetime(2025, 5, 1, 9, 0, 0))
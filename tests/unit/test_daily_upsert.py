@@ -0,0 +1,70 @@
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.prenatal.models import PrenatalEntry
+from app.prenatal.schemas import PrenatalCreate
+from app.prenatal.services import PrenatalService
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    PrenatalEntry.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def prenatal_payload(**overrides):
+    payload = dict(
+        patient_id="p1", patient_name="A", gestational_age="30", condition_type="prenatal",
+        submission_date=date(2025, 5, 1), submitted_at=datetime(2025, 5, 1, 9), status="good",
+        high_risk=False, maternal_temperature="36.8", blood_pressure_systolic="120",
+        blood_pressure_diastolic="80", maternal_heart_rate="80", respiratory_rate="16",
+        oxygen_saturation="98", weight="70", edema="none", edema_location=["ankles", "hands"],
+        headache="none", visual_disturbances=False, epigastric_pain=False, nausea_level="none",
+        vomiting_episodes=0, fetal_movement="normal", movement_count=10, movement_duration="1h",
+        contractions=False, contraction_frequency="", contraction_duration="",
+        contraction_intensity="mild", vaginal_bleeding="none", bleeding_color="pink",
+        fluid_leak=False, fluid_color="clear", fluid_amount="small", urinary_frequency="normal",
+        dysuria="none", urinary_incontinence=False, appetite="normal", heartburn="none",
+        constipation="none", medications_taken=True, missed_medications="", additional_notes="",
+    )
+    payload.update(overrides)
+    return PrenatalCreate(**payload)
+
+
+def test_same_day_submission_updates_the_existing_row(db):
+    first = PrenatalService.create_prenatal_entry(db, prenatal_payload())
+    second = PrenatalService.create_prenatal_entry(db, prenatal_payload(status="urgent", weight="71"))
+
+    assert second.id == first.id
+    assert db.query(PrenatalEntry).count() == 1
+    saved = db.query(PrenatalEntry).one()
+    assert (saved.status, saved.weight, saved.edema_location) == ("urgent", "71", "ankles,hands")
+    assert saved.submission_date == "2025-05-01"
+
+
+def test_new_day_inserts_a_new_row(db):
+    PrenatalService.create_prenatal_entry(db, prenatal_payload())
+    PrenatalService.create_prenatal_entry(db, prenatal_payload(submission_date=date(2025, 5, 2)))
+
+    assert db.query(PrenatalEntry).count() == 2
+
+
+def test_table_without_the_unique_index_falls_back_to_select_then_write():
+    engine = create_engine("sqlite://")
+    PrenatalEntry.__table__.create(engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX uq_prenatal_entries_patient_day"))
+    db = sessionmaker(bind=engine)()
+
+    first = PrenatalService.create_prenatal_entry(db, prenatal_payload())
+    second = PrenatalService.create_prenatal_entry(db, prenatal_payload(status="urgent"))
+
+    assert second.id == first.id
+    assert db.query(PrenatalEntry).one().status == "urgent"
+    db.close()
@@ -0,0 +1,89 @@
+import csv
+import io
+import json
+from datetime import date
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.authentication.dependencies import require_staff
+from app.database import get_db
+from app.health_progress.cardiac.models import CardiacSurgeryEntry
+from app.health_progress.export.routers import router as export_router
+from app.health_progress.export.services import ExportService
+from app.health_progress.heart.models import HeartEntry
+from app.health_progress.registry import get_tracker
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    for model in (CardiacSurgeryEntry, HeartEntry):
+        model.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        CardiacSurgeryEntry(patient_id=1, patient_name="A", submission_date=date(2025, 5, 1),
+                            common_data={"temperature": 37.2, "vitals": {"heartRate": 80}},
+                            condition_data={"incisionCare": ["clean", "dry"]}),
+        CardiacSurgeryEntry(patient_id=2, patient_name="B", submission_date=date(2025, 6, 1),
+                            common_data={"status": "good"}, condition_data={}),
+        HeartEntry(patient_id=1, patient_name="A", submission_date="2025-05-02", status="urgent"),
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client(db):
+    app = FastAPI()
+    app.include_router(export_router, prefix="/export")
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[require_staff] = lambda: None
+    return TestClient(app)
+
+
+def test_ndjson_flattens_json_columns(client):
+    response = client.get("/export?condition=cardiac&condition=heart&to_date=2025-05-31")
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+
+    assert [(r["condition_type"], r["patient_id"]) for r in rows] == [("cardiac", 1), ("heart", 1)]
+    assert rows[0]["common_data.vitals.heartRate"] == 80
+    assert rows[0]["condition_data.incisionCare"] == '["clean", "dry"]'
+    assert rows[0]["submission_date"] == "2025-05-01"
+
+
+def test_csv_has_one_header_for_every_tracker(client):
+    response = client.get("/export?format=csv&condition=cardiac&condition=heart&patient_id=1")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+
+    assert len(rows) == 2
+    assert {"common_data.temperature", "common_data.vitals.heartRate", "chest_pain_level"} <= set(rows[0])
+    assert rows[0]["common_data.temperature"] == "37.2" and rows[1]["common_data.temperature"] == ""
+    assert rows[1]["status"] == "urgent"
+
+
+def test_rows_are_read_in_chunks(db):
+    service = ExportService(db, chunk_size=1)
+    assert len(list(service.rows([get_tracker("cardiac")]))) == 2
+    assert "common_data.status" in service.columns([get_tracker("cardiac")])
+    kinds = service.column_types([get_tracker("cardiac"), get_tracker("heart"), get_tracker("burn_care")],
+                                 ["patient_id", "id", "common_data.status"])
+    assert kinds["patient_id"] is None and kinds["common_data.status"] is None and kinds["id"] is not None
+
+
+def test_bad_requests_are_rejected_before_streaming(client):
+    assert client.get("/export?condition=teeth").status_code == 400
+    assert client.get("/export?format=xlsx").status_code == 400
+
+
+def test_export_requires_authentication(db):
+    app = FastAPI()
+    app.include_router(export_router, prefix="/export")
+    app.dependency_overrides[get_db] = lambda: db
+    assert TestClient(app).get("/export").status_code == 401
@@ -0,0 +1,82 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.authentication.dependencies import require_staff
+from app.database import get_db
+from app.health_progress.diabetes.models import DiabetesEntry
+from app.health_progress.feed.routers import router as feed_router
+from app.health_progress.feed.services import HealthFeedService
+from app.health_progress.kidney.models import KidneyEntry
+from app.health_progress.registry import TRACKERS
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    for spec in TRACKERS:
+        spec.model.__table__.create(engine, checkfirst=True)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def seed(db):
+    start = datetime(2025, 1, 1, 8, 0)
+    for i in range(6):
+        db.add(DiabetesEntry(
+            patient_id=1, patient_name="A", submission_date=f"2025-01-0{i + 1}",
+            status="urgent" if i % 2 else "good", created_at=start + timedelta(hours=i),
+        ))
+        db.add(KidneyEntry(
+            patient_id="2", patient_name="B", submission_date=date(2025, 1, i + 1),
+            urgency_status="high", submitted_at=start + timedelta(hours=i),
+        ))
+    db.commit()
+
+
+def test_feed_pages_cover_every_row_once_newest_first(db):
+    seed(db)
+    service = HealthFeedService(db)
+
+    seen, cursor = [], None
+    while True:
+        page = service.get_feed(limit=5, after=cursor)
+        seen.extend(page["entries"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert len(seen) == 12
+    assert len({(e["condition_type"], e["id"]) for e in seen}) == 12
+    timestamps = [e["timestamp"] for e in seen]
+    assert timestamps == sorted(timestamps, reverse=True)
+
+
+def test_feed_filters_are_applied_per_tracker(db):
+    seed(db)
+    service = HealthFeedService(db)
+
+    assert service.get_feed(urgency="high")["count"] == 9
+    assert service.get_feed(conditions=["kidney"], submission_date="2025-01-03")["count"] == 1
+    assert service.get_feed(patient_id="1")["count"] == 6
+
+
+def test_feed_routes_require_staff(db):
+    seed(db)
+    app = FastAPI()
+    app.include_router(feed_router, prefix="/feed")
+    app.dependency_overrides[get_db] = lambda: db
+    client = TestClient(app)
+
+    assert client.get("/feed").status_code == 401
+    assert client.get("/feed/kidney/1").status_code == 401
+
+    app.dependency_overrides[require_staff] = lambda: None
+    assert client.get("/feed").json()["count"] == 12
+    assert client.get("/feed/kidney/1").json()["condition_type"] == "kidney"
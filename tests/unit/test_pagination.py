@@ -0,0 +1,47 @@
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.health_progress.pagination import PageParams, page_params, paginate
+from app.prenatal.models import PrenatalEntry
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    PrenatalEntry.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def test_paginate_walks_ties_and_null_timestamps_without_gaps(db):
+    same_time = datetime(2025, 3, 1, 9, 30)
+    for i in range(7):
+        # Three rows share a timestamp and two legacy rows have none
+        submitted_at = None if i < 2 else (same_time if i < 5 else datetime(2025, 3, i, 8))
+        db.add(PrenatalEntry(
+            patient_id="p1", patient_name="A", submission_date=f"2025-03-0{i + 1}",
+            status="good", submitted_at=submitted_at,
+        ))
+    db.commit()
+
+    seen, after = [], None
+    while True:
+        entries, after = paginate(
+            db.query(PrenatalEntry), PrenatalEntry.submitted_at, PrenatalEntry.id, PageParams(limit=2, after=after)
+        )
+        seen.extend(entries)
+        if after is None:
+            break
+
+    assert [e.id for e in seen] == [7, 6, 5, 4, 3, 2, 1]
+
+
+def test_page_params_rejects_malformed_cursor():
+    with pytest.raises(HTTPException) as exc:
+        page_params(limit=10, after="not-a-cursor")
+    assert exc.value.status_code == 400
@@ -0,0 +1,91 @@
+from datetime import datetime
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.authentication.auth import get_current_user
+from app.health_progress.heart.models import HeartEntry
+from app.health_progress.kidney.models import KidneyEntry
+from app.health_progress.timeline.routers import get_timeline_service, router as timeline_router
+from app.health_progress.timeline.services import SOURCES, PatientTimelineService
+from app.medical_record.models import MedicalRecord
+from app.models import User, UserRole
+
+
+@pytest_asyncio.fixture
+async def service(tmp_path):
+    url = tmp_path / "timeline.db"
+    engine = create_engine(f"sqlite:///{url}")
+    for source in SOURCES:
+        source.model.__table__.create(engine)
+    db = sessionmaker(bind=engine)()
+    db.add_all([
+        HeartEntry(patient_id=1, patient_name="A", submission_date="2025-05-01", status="urgent",
+                   created_at=datetime(2025, 5, 1, 9)),
+        HeartEntry(patient_id=2, patient_name="B", submission_date="2025-05-01", created_at=datetime(2025, 5, 1, 10)),
+        KidneyEntry(patient_id=1, patient_name="A", submission_date="2025-05-02", urgency_status="medium",
+                    submitted_at=datetime(2025, 5, 2, 9)),
+        KidneyEntry(patient_id=1, patient_name="A", submission_date="2025-05-03", urgency_status="low",
+                    submitted_at=datetime(2025, 5, 3, 9)),
+        MedicalRecord(patient_id="1", patient_name="A", type="Blood Test", category="Lab Results", doctor="D",
+                      date="2025-05-02", status="Completed", details={}, created_at=datetime(2025, 5, 2, 12)),
+    ])
+    db.commit()
+    db.close()
+    engine.dispose()
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{url}")
+    yield PatientTimelineService(async_sessionmaker(async_engine, expire_on_commit=False), concurrency=3)
+    await async_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_timeline_merges_every_source_newest_first(service):
+    timeline = await service.get_timeline("1")
+
+    assert [(e["condition_type"], e["submission_date"] if "submission_date" in e else e["date"])
+            for e in timeline["entries"]] == [
+        ("kidney", "2025-05-03"), ("medical_record", "2025-05-02"), ("kidney", "2025-05-02"), ("heart", "2025-05-01"),
+    ]
+    assert [e["urgency"] for e in timeline["entries"]] == ["low", None, "medium", "high"]
+    assert not timeline["has_more"]
+
+
+@pytest.mark.asyncio
+async def test_timeline_pages_follow_the_cursor(service):
+    seen = []
+    after = None
+    while True:
+        page = await service.get_timeline("1", limit=1, after=after)
+        seen += [(e["condition_type"], e["id"]) for e in page["entries"]]
+        if not page["has_more"]:
+            break
+        after = page["next_cursor"]
+
+    everything = await service.get_timeline("1")
+    assert seen == [(e["condition_type"], e["id"]) for e in everything["entries"]]
+    assert (await service.get_timeline("1", conditions=["heart"]))["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_timeline_is_for_staff_or_the_patient(service):
+    app = FastAPI()
+    app.include_router(timeline_router, prefix="/patients")
+    app.dependency_overrides[get_timeline_service] = lambda: service
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+    async def status_as(user, patient_id="1"):
+        if user is not None:
+            app.dependency_overrides[get_current_user] = lambda: user
+        return (await client.get(f"/patients/{patient_id}/timeline")).status_code
+
+    assert await status_as(None) == 401
+    assert await status_as(User(id=1, username="a", role=UserRole.PATIENT)) == 200
+    assert await status_as(User(id=1, username="a", role=UserRole.PATIENT), patient_id="2") == 403
+    assert await status_as(User(id=9, username="dr", role=UserRole.DOCTOR), patient_id="2") == 200
+    await client.aclose()
@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.authentication.dependencies import require_staff
+from app.cache import services as cache
+from app.cache.backends import LRUCache
+from app.cache.routers import router as cache_router
+from app.database import get_async_db, get_db
+from app.health_progress.heart.models import HeartEntry
+from app.health_progress.heart.routers import router as heart_router
+from app.health_progress.heart.services import HeartProgressService
+from app.health_progress.versions.models import TrackerVersion
+from tests.unit.test_async_services import async_db_override
+
+
+@pytest.fixture
+def backend():
+    backend = LRUCache(max_entries=100)
+    cache.set_backend(backend)
+    cache.install_cache_hooks()
+    yield backend
+    cache.remove_cache_hooks()
+    cache.set_backend(None)
+
+
+@pytest.fixture
+def db(tmp_path):
+    # A file, so the async routes' sessions see what the test writes
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}", connect_args={"check_same_thread": False})
+    for model in (HeartEntry, TrackerVersion):
+        model.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def add_heart_entry(db):
+    HeartProgressService(db).create_entry(dict(patient_id=1, patient_name="A", submission_date="2025-05-01", status="good"))
+
+
+def test_cached_route_is_invalidated_by_commits(backend, db):
+    app = FastAPI()
+    app.include_router(heart_router, prefix="/heart")
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_async_db] = async_db_override(db.get_bind().url.database)
+    client = TestClient(app)
+    add_heart_entry(db)
+
+    first, second = client.get("/heart/entries"), client.get("/heart/entries")
+    assert (first.headers["x-cache"], second.headers["x-cache"]) == ("MISS", "HIT")
+    assert second.content == first.content and second.headers["etag"] == first.headers["etag"]
+    assert client.get("/heart/entries?limit=1").headers["x-cache"] == "MISS"
+
+    add_heart_entry(db)
+    third = client.get("/heart/entries")
+    assert third.headers["x-cache"] == "MISS" and len(third.json()["entries"]) == 2
+    assert cache.cache_stats()["namespaces"]["heart.entries"] == {"hits": 1, "misses": 3}
+
+    db.add(HeartEntry(patient_id=2, patient_name="B", submission_date="2025-05-02", status="good"))
+    db.flush()
+    db.rollback()  # rolled-back writes invalidate nothing
+    assert client.get("/heart/entries").headers["x-cache"] == "HIT"
+
+
+def test_concurrent_misses_share_one_computation(backend):
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"count": len(calls)}
+
+    async def scenario():
+        return await asyncio.gather(*[cache.get_or_set("counts", compute, tags=["users"]) for _ in range(5)])
+
+    assert asyncio.run(scenario()) == [{"count": 1}] * 5
+    assert len(calls) == 1
+
+    cache.invalidate(["users"])
+    assert asyncio.run(cache.get_or_set("counts", compute, tags=["users"])) == {"count": 2}
+
+
+def test_lru_evicts_and_expires():
+    backend = LRUCache(max_entries=2)
+
+    async def scenario():
+        await backend.set("a", b"1", ttl=60)
+        await backend.set("b", b"2", ttl=60)
+        await backend.get("a")  # b is now least recently used
+        await backend.set("c", b"3", ttl=60)
+        await backend.set("d", b"4", ttl=-1)
+        return [await backend.get(key) for key in "abcd"]
+
+    assert asyncio.run(scenario()) == [None, None, b"3", None]
+    assert backend.evictions == 2
+
+
+def test_stats_require_staff(backend):
+    app = FastAPI()
+    app.include_router(cache_router, prefix="/cache")
+    client = TestClient(app)
+
+    assert client.get("/cache/stats").status_code == 401
+
+    app.dependency_overrides[require_staff] = lambda: None
+    assert client.get("/cache/stats").json() == cache.cache_stats()
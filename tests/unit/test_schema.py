@@ -0,0 +1,59 @@
+import pytest
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, inspect, text
+
+from app.schema import SchemaError, alembic_config, migrate_database
+
+
+def head_revision():
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def test_empty_database_is_created_and_stamped(tmp_path):
+    url = f"sqlite:///{tmp_path / 'fresh.db'}"
+    migrate_database(url)
+    migrate_database(url)  # second start is a no-op upgrade
+
+    engine = create_engine(url)
+    tables = set(inspect(engine).get_table_names())
+    with engine.connect() as conn:
+        version = conn.execute(text("SELECT version_num FROM alembic_version")).scalar_one()
+    engine.dispose()
+
+    assert {"users", "kidney_entries", "prenatal_entries", "postnatal_profiles"} <= tables
+    assert version == head_revision()
+
+
+def test_unversioned_database_is_upgraded_from_the_legacy_revision(tmp_path):
+    url = f"sqlite:///{tmp_path / 'legacy.db'}"
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE kidney_entries (id INTEGER PRIMARY KEY, patient_id INTEGER, "
+            "submission_date VARCHAR, submitted_at DATETIME)"
+        ))
+
+    migrate_database(url)
+
+    indexes = {ix["name"] for ix in inspect(engine).get_indexes("kidney_entries")}
+    tables = set(inspect(engine).get_table_names())
+    engine.dispose()
+    assert "ix_kidney_entries_patient_day" in indexes
+    # Tables no revision creates are added after the upgrade
+    assert {"heart_entries", "prenatal_entries", "users"} <= tables
+
+
+def test_pending_destructive_revision_is_refused(tmp_path):
+    url = f"sqlite:///{tmp_path / 'old.db'}"
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY)"))
+        conn.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) PRIMARY KEY)"))
+        conn.execute(text("INSERT INTO alembic_version VALUES ('4d830a281d39')"))
+
+    with pytest.raises(SchemaError, match="623c30ce9e64"):
+        migrate_database(url)
+
+    tables = set(inspect(engine).get_table_names())
+    engine.dispose()
+    assert "users" in tables
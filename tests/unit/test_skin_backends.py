@@ -0,0 +1,58 @@
+import numpy as np
+
+from app.skin_analysis.backends import TFLiteBackend
+from app.skin_analysis.benchmark import top_k_agreement
+
+
+class FakeInterpreter:
+    """Mimics tflite's Interpreter for a uint8-quantized model whose output is its input's first 3 pixels"""
+
+    def __init__(self):
+        self.shape = [1, 2, 2, 3]
+        self.allocations = 0
+
+    def allocate_tensors(self):
+        self.allocations += 1
+
+    def get_input_details(self):
+        return [{"index": 0, "shape": np.array(self.shape), "dtype": np.uint8, "quantization": (1.0, 0)}]
+
+    def get_output_details(self):
+        return [{"index": 1, "dtype": np.uint8, "quantization": (0.5, 10)}]
+
+    def resize_tensor_input(self, index, shape):
+        self.shape = list(shape)
+
+    def set_tensor(self, index, value):
+        assert value.dtype == np.uint8 and list(value.shape) == self.shape
+        self.input = value
+
+    def invoke(self):
+        self.output = self.input.reshape(len(self.input), -1)[:, :3]
+
+    def get_tensor(self, index):
+        return self.output
+
+
+def test_tflite_backend_resizes_for_batches_and_dequantizes():
+    interpreter = FakeInterpreter()
+    backend = TFLiteBackend("unused.tflite", interpreter=interpreter)
+    batch = np.stack([np.full((2, 2, 3), value, dtype=np.float32) for value in (12, 300, 20)])
+
+    probabilities = backend.predict_batch(batch)
+
+    assert interpreter.shape[0] == 3
+    assert probabilities.dtype == np.float32
+    # 300 saturates at 255 on the way in; output is (q - 10) * 0.5
+    np.testing.assert_allclose(probabilities[:, 0], [1.0, 122.5, 5.0])
+
+    backend.predict_batch(batch)
+    assert interpreter.allocations == 2  # same batch size, no re-allocation
+
+
+def test_top_k_agreement_ignores_order_within_top_k():
+    reference = np.array([[0.5, 0.3, 0.1, 0.1], [0.7, 0.2, 0.05, 0.05]])
+    candidate = np.array([[0.3, 0.5, 0.1, 0.1], [0.1, 0.2, 0.6, 0.1]])
+
+    assert top_k_agreement(reference, candidate, 1) == 0.0
+    assert top_k_agreement(reference, candidate, 2) == 0.5
@@ -0,0 +1,49 @@
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from app.skin_analysis.inference import BatchedInferenceEngine, InferenceQueueFull
+
+
+def image(value):
+    return np.full((2, 2, 3), value, dtype=np.float32)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_forward_pass():
+    batch_sizes = []
+
+    def predict_batch(batch):
+        batch_sizes.append(len(batch))
+        return batch.reshape(len(batch), -1)[:, :2]
+
+    engine = BatchedInferenceEngine(predict_batch, max_batch_size=4, max_wait_ms=50)
+    results = await asyncio.gather(*(engine.submit(image(i)) for i in range(4)))
+    await engine.stop()
+
+    assert batch_sizes == [4]
+    assert [row[0] for row in results] == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_is_rejected_instead_of_waiting():
+    release = threading.Event()
+
+    def predict_batch(batch):
+        release.wait(5)
+        return np.zeros((len(batch), 2))
+
+    engine = BatchedInferenceEngine(predict_batch, max_batch_size=1, max_wait_ms=0, max_queue=1)
+    running = asyncio.ensure_future(engine.submit(image(0)))
+    await asyncio.sleep(0.05)  # first image is in the model, the queue is empty again
+    queued = asyncio.ensure_future(engine.submit(image(1)))
+    await asyncio.sleep(0)
+
+    with pytest.raises(InferenceQueueFull):
+        await engine.submit(image(2))
+
+    release.set()
+    await asyncio.gather(running, queued)
+    await engine.stop()
@@ -0,0 +1,68 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.skin_analysis.jobs import AnalysisJobs, AnalysisStore
+from app.skin_analysis.models import SkinAnalysis
+
+
+@pytest_asyncio.fixture
+async def store(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'skin.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(SkinAnalysis.__table__.create)
+    yield AnalysisStore(async_sessionmaker(engine, expire_on_commit=False))
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_job_moves_from_pending_to_done(store):
+    release = asyncio.Event()
+
+    async def work():
+        await release.wait()
+        return {"primary_prediction": {"class_name": "eczema", "confidence": 0.9}}
+
+    jobs = AnalysisJobs(store)
+    await store.create("a1", "photo.jpg", 1234)
+    task = jobs.start("a1", work)
+    assert (await store.get("a1"))["status"] == "pending"
+
+    release.set()
+    await task
+    analysis = await store.get("a1")
+    assert analysis["status"] == "done"
+    assert analysis["results"]["primary_prediction"]["class_name"] == "eczema"
+    assert jobs.running == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_and_abandoned_jobs_read_as_failed(store):
+    async def work():
+        raise RuntimeError("model crashed")
+
+    await store.create("a2", "photo.jpg", 1)
+    await AnalysisJobs(store).start("a2", work)
+    assert (await store.get("a2"))["error"] == "model crashed"
+
+    # A pending row whose worker went away
+    async with store.session_factory() as db:
+        db.add(SkinAnalysis(id="a3", status="pending", created_at=datetime.utcnow() - timedelta(hours=1)))
+        await db.commit()
+    assert (await store.get("a3"))["status"] == "failed"
+    assert await store.get("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_purge_removes_old_results(store):
+    await store.create("new", "a.jpg", 1, results={})
+    async with store.session_factory() as db:
+        db.add(SkinAnalysis(id="old", status="done", created_at=datetime.utcnow() - timedelta(days=40)))
+        await db.commit()
+
+    assert await store.purge(days=30) == 1
+    assert await store.get("old") is None
+    assert (await store.get("new"))["status"] == "done"
@@ -0,0 +1,77 @@
+import io
+import os
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from PIL import Image
+
+from app.skin_analysis import skin_prediction
+from app.skin_analysis.prediction_cache import DiskTier, PredictionCache
+from app.skin_analysis.preprocess import decode_image
+
+PREDICTION = {"primary_prediction": {"class_name": "eczema", "confidence": 0.9}}
+
+
+def encoded(fmt):
+    pixels = (np.arange(32 * 32 * 3) % 251).astype(np.uint8).reshape(32, 32, 3)
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_same_bytes_and_same_pixels_hit():
+    cache = PredictionCache(max_entries=8)
+    png, bmp = encoded("PNG"), encoded("BMP")
+    assert await cache.get(cache.content_key(png)) is None
+
+    await cache.set([cache.content_key(png), cache.pixel_key(decode_image(png))], PREDICTION)
+
+    assert await cache.get(cache.content_key(png)) == PREDICTION
+    # Other container, same picture: the bytes differ, the decoded pixels do not
+    assert await cache.get(cache.content_key(bmp)) is None
+    assert await cache.get(cache.pixel_key(decode_image(bmp))) == PREDICTION
+    assert cache.stats()["hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_a_new_model_does_not_see_old_predictions(tmp_path):
+    cache = PredictionCache(directory=str(tmp_path))
+    cache.use_model("keras:v1")
+    key = cache.content_key(b"photo")
+    await cache.set([key], PREDICTION)
+
+    restarted = PredictionCache(directory=str(tmp_path))
+    restarted.use_model("keras:v1")
+    assert await restarted.get(key) == PREDICTION              # from disk
+
+    restarted.use_model("keras:v2")
+    assert await restarted.get(restarted.content_key(b"photo")) is None
+
+
+def test_disk_tier_prunes_least_recently_read(tmp_path):
+    disk = DiskTier(str(tmp_path), max_entries=10)
+    for i in range(10):
+        disk.set(f"k{i}", b"{}")
+        os.utime(disk._path(f"k{i}"), (i, i))
+    disk.get("k0")                                             # read recently
+    disk.set("k10", b"{}")
+
+    remaining = sorted(os.listdir(tmp_path))
+    assert len(remaining) == 9
+    assert "k0.json" in remaining and "k1.json" not in remaining
+
+
+def test_upload_errors_keep_their_status_code(monkeypatch):
+    # Rejected before the model runs, so any active version will do
+    monkeypatch.setattr(skin_prediction.registry, "active", object())
+    app = FastAPI()
+    app.include_router(skin_prediction.router)
+    client = TestClient(app)
+
+    empty = client.post("/predict-from-upload", files={"file": ("a.png", b"", "image/png")})
+    assert empty.status_code == 400 and empty.json()["detail"] == "Uploaded file is empty"
+    wrong_type = client.post("/predict-from-upload", files={"file": ("a.gif", encoded("GIF"), "image/gif")})
+    assert wrong_type.status_code == 400
@@ -0,0 +1,63 @@
+import asyncio
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from app.skin_analysis.inference import BatchedInferenceEngine
+from app.skin_analysis.preprocess import UploadTooLarge, decode_full_resolution, decode_image, read_upload
+
+
+class FakeUpload:
+    def __init__(self, data: bytes):
+        self._stream = io.BytesIO(data)
+        self.reads = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        self.reads += 1
+        return self._stream.read(size)
+
+
+def jpeg(width, height):
+    y, x = np.mgrid[0:height, 0:width]
+    pixels = np.stack([x * 255 // width, y * 255 // height, np.full_like(x, 128)], axis=-1).astype(np.uint8)
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format="JPEG", quality=95)
+    return buffer.getvalue()
+
+
+def test_reduced_size_decode_matches_the_full_decode():
+    contents = jpeg(2000, 1500)
+    fast, reference = decode_image(contents), decode_full_resolution(contents)
+
+    assert fast.shape == (224, 224, 3) and fast.dtype == np.float32
+    assert np.abs(fast - reference).mean() < 3
+
+
+@pytest.mark.asyncio
+async def test_uploads_past_the_cap_are_refused_early():
+    upload = FakeUpload(b"x" * (5 * 1024 * 1024))
+    with pytest.raises(UploadTooLarge):
+        await read_upload(upload, max_bytes=2 * 1024 * 1024)
+    assert upload.reads == 3
+
+    assert await read_upload(FakeUpload(b"small"), max_bytes=10) == b"small"
+
+
+@pytest.mark.asyncio
+async def test_uint8_images_are_batched_into_the_float32_buffer():
+    seen = []
+
+    def predict_batch(batch):
+        seen.append(batch.dtype)
+        return batch.reshape(len(batch), -1)[:, :2]
+
+    engine = BatchedInferenceEngine(predict_batch, max_batch_size=4, max_wait_ms=20)
+    images = [np.full((2, 2, 3), i, dtype=np.uint8) for i in range(2)]
+    first = await asyncio.gather(*(engine.submit(image) for image in images))
+    await engine.submit(np.full((2, 2, 3), 9, dtype=np.uint8))    # reuses the buffer
+    await engine.stop()
+
+    assert seen[0] == np.float32
+    assert [row[0] for row in first] == [0, 1]                    # not overwritten by the later batch
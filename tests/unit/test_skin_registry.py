@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from app.skin_analysis.inference import BatchedInferenceEngine
+from app.skin_analysis.registry import ModelRegistry
+
+
+class FakePredictor:
+    """Answers with its version number for every image"""
+
+    def __init__(self, path):
+        if "broken" in path:
+            raise OSError("corrupt model file")
+        self.value = float(path.rsplit("v", 1)[-1].split(".")[0])
+        self.batch_sizes = []
+
+    def predict_batch(self, batch):
+        self.batch_sizes.append(len(batch))
+        return np.full((len(batch), 2), self.value)
+
+
+@pytest.fixture
+def registry(tmp_path):
+    for name in ("v1.keras", "v2.keras", "broken.keras", "notes.txt"):
+        (tmp_path / name).write_bytes(b"")
+    activated = []
+    registry = ModelRegistry(
+        str(tmp_path), "keras", lambda path, classes: FakePredictor(path), "classes.json",
+        lambda predict_batch: BatchedInferenceEngine(predict_batch, max_batch_size=4, max_wait_ms=1),
+        warmup_batch_sizes=(1, 4), image_shape=(2, 2, 3),
+        on_activate=lambda model: activated.append(model.version),
+    )
+    registry.activated = activated
+    return registry
+
+
+@pytest.mark.asyncio
+async def test_versions_are_warmed_up_then_swapped(registry):
+    assert registry.available() == ["broken", "v1", "v2"]
+
+    v1 = await registry.activate("v1")
+    assert registry.status == "ready"
+    assert v1.predictor.batch_sizes == [1, 4]              # warm-up before serving
+    assert (await v1.engine.submit(np.zeros((2, 2, 3))))[0] == 1
+
+    v2 = await registry.activate("v2")
+    assert registry.active is v2 and registry.activated == ["v1", "v2"]
+    assert (await registry.active.engine.submit(np.zeros((2, 2, 3))))[0] == 2
+
+    stats = registry.stats()
+    assert stats["active_version"] == "v2"
+    assert stats["versions"]["v1"]["images"] == 1 and stats["versions"]["v1"]["batch_ms_p50"] is not None
+    await registry.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_or_unknown_versions_leave_the_active_one(registry):
+    await registry.activate("v1")
+    with pytest.raises(OSError):
+        await registry.activate("broken")
+    with pytest.raises(KeyError):
+        await registry.activate("v9")
+
+    assert registry.active.version == "v1" and registry.status == "ready"
+    await registry.close()
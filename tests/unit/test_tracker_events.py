@@ -0,0 +1,139 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.health_progress.events import broker as broker_module
+from app.health_progress.events.broker import InProcessBroker
+from app.health_progress.events.routers import format_event, router as events_router
+from app.health_progress.events.services import install_event_hooks, remove_event_hooks
+from app.health_progress.heart.models import HeartEntry
+from app.health_progress.heart.services import HeartProgressService
+from app.prenatal.models import PrenatalEntry
+from app.prenatal.services import PrenatalService
+from tests.unit.test_daily_upsert import prenatal_payload
+
+
+class RecordingBroker:
+    def __init__(self):
+        self.events = []
+
+    def publish(self, event):
+        self.events.append(event)
+
+
+@pytest.fixture
+def published(monkeypatch):
+    recording = RecordingBroker()
+    monkeypatch.setattr(broker_module, "_broker", recording)
+    install_event_hooks()
+    yield recording.events
+    remove_event_hooks()
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    HeartEntry.__table__.create(engine)
+    PrenatalEntry.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def heart_payload(status="good"):
+    return dict(patient_id=1, patient_name="A", submission_date="2025-05-01", status=status)
+
+
+def test_committed_writes_are_published_once(db, published):
+    service = HeartProgressService(db)
+    entry = service.create_entry(heart_payload("urgent"))
+    service.update_entry(entry.id, {"status": "good"})
+    service.delete_entry(entry.id)
+
+    assert [(e["type"], e["entry_id"], e["urgency"]) for e in published] == [
+        ("created", entry.id, "high"), ("updated", entry.id, "low"), ("deleted", entry.id, None),
+    ]
+    assert published[0]["condition_type"] == "heart" and published[0]["patient_id"] == "1"
+
+
+def test_rolled_back_writes_are_not_published(db, published):
+    db.add(HeartEntry(**heart_payload()))
+    db.flush()
+    db.rollback()
+    assert published == []
+
+
+def test_core_upserts_are_published(db, published):
+    saved = PrenatalService.create_prenatal_entry(db, prenatal_payload(status="monitor"))
+    assert [(e["type"], e["entry_id"], e["urgency"], e["submission_date"]) for e in published] == [
+        ("saved", saved.id, "medium", "2025-05-01"),
+    ]
+
+
+def test_broker_delivers_across_threads_and_replays_after_reconnect():
+    broker = InProcessBroker(history=3)
+
+    async def scenario():
+        subscription = broker.subscribe(heartbeat=0.05)
+        assert await anext(subscription) is None  # heartbeat while idle
+
+        thread = threading.Thread(target=broker.publish, args=({"type": "created", "entry_id": 1},))
+        thread.start()
+        thread.join()
+        first = await anext(subscription)
+        await subscription.aclose()
+        assert broker.subscriber_count == 0
+
+        for entry_id in (2, 3):
+            broker.publish({"type": "created", "entry_id": entry_id})
+        replay = broker.subscribe(first["id"])
+        missed = [await anext(replay), await anext(replay)]
+        await replay.aclose()
+
+        for entry_id in (4, 5, 6):
+            broker.publish({"type": "created", "entry_id": entry_id})
+        stale = broker.subscribe(first["id"])  # entries 2 and 3 fell out of the history
+        gap = await anext(stale)
+        await stale.aclose()
+        return first, missed, gap
+
+    first, missed, gap = asyncio.run(scenario())
+
+    assert first["entry_id"] == 1
+    assert [event["entry_id"] for event in missed] == [2, 3]
+    assert gap["type"] == "reset"
+    # ids from before a restart
+    assert InProcessBroker()._missed("0-1") == [{"type": "reset"}]
+
+
+def test_slow_subscriber_gets_a_reset():
+    broker = InProcessBroker(queue_size=2)
+
+    async def scenario():
+        subscription = broker.subscribe(heartbeat=0.01)
+        await anext(subscription)  # subscribed
+        for entry_id in range(5):
+            broker.publish({"type": "created", "entry_id": entry_id})
+        await asyncio.sleep(0)
+        event = await anext(subscription)
+        await subscription.aclose()
+        return event
+
+    assert asyncio.run(scenario())["type"] == "reset"
+
+
+def test_sse_framing():
+    assert format_event({"id": "a-1", "type": "created", "entry_id": 3}) == (
+        'id: a-1\nevent: created\ndata: {"id": "a-1", "type": "created", "entry_id": 3}\n\n'
+    )
+
+
+def test_stream_requires_staff():
+    app = FastAPI()
+    app.include_router(events_router, prefix="/events")
+    assert TestClient(app).get("/events").status_code == 401
@@ -0,0 +1,68 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.orm import sessionmaker
+
+from app.health_progress.cardiac.models import CardiacSurgeryEntry
+from app.health_progress.cardiac.services import CardiacProgressService
+from app.health_progress.heart.models import HeartEntry
+from app.health_progress.heart.services import HeartProgressService
+from app.health_progress.pagination import PageParams
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    CardiacSurgeryEntry.__table__.create(engine)
+    HeartEntry.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def cardiac_payload(day, patient_id=1):
+    return dict(patient_id=patient_id, patient_name="A", submission_date=f"2025-05-{day:02d}",
+                common_data={"pain_level": day}, condition_data={"incision": "clean"})
+
+
+def test_batched_create_and_date_lookup(db):
+    service = CardiacProgressService(db)
+    entries = service.create_entries([cardiac_payload(day) for day in range(1, 4)])
+
+    assert [entry.id for entry in entries] == [1, 2, 3]
+    assert entries[0].submission_date == date(2025, 5, 1)
+    # "YYYY-MM-DD" is parsed for trackers that store a Date
+    assert service.check_existing_entry(1, "2025-05-02")
+    assert not service.check_existing_entry(1, "2025-05-09")
+
+
+def test_projection_loads_only_requested_columns(db):
+    service = CardiacProgressService(db)
+    service.create_entries([cardiac_payload(day) for day in range(1, 4)])
+    db.expunge_all()
+
+    entries, next_cursor = service.get_all_entries(PageParams(limit=2), columns=["patient_id", "created_at"])
+
+    assert len(entries) == 2 and next_cursor is not None
+    assert "common_data" in inspect(entries[0]).unloaded
+    assert "patient_id" not in inspect(entries[0]).unloaded
+
+
+def test_patient_page_and_limit(db):
+    service = CardiacProgressService(db)
+    service.create_entries([cardiac_payload(day, patient_id=day % 2) for day in range(1, 6)])
+
+    page, _ = service.get_patient_page(1, PageParams(limit=10))
+    assert sorted(entry.submission_date.day for entry in page) == [1, 3, 5]
+    assert len(service.get_patient_entries(1, limit=2)) == 2
+
+
+def test_update_is_restricted_and_delete_reports_missing(db):
+    service = HeartProgressService(db)
+    entry = service.create_entry(dict(patient_id=1, patient_name="A", submission_date="2025-05-01", status="good"))
+    service.update_entry(entry.id, {"status": "urgent", "patient_id": 99})
+    assert service.delete_entry(entry.id)
+    assert not service.delete_entry(entry.id)
+
+    assert entry.status == "urgent" and entry.patient_id == 1
@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.authentication.dependencies import require_staff
+from app.database import get_db
+
+from app.health_progress.heart.models import HeartEntry
+from app.health_progress.heart.services import HeartProgressService
+from app.health_progress.kidney.models import KidneyEntry
+from app.health_progress.triage.models import TriageItem
+from app.health_progress.triage.routers import router as triage_router
+from app.health_progress.triage.services import (
+    TriageService, backfill, install_triage_hooks, remove_triage_hooks
+)
+from app.health_progress.urgency import rescore
+from app.models import User, UserRole
+from app.prenatal.models import PrenatalEntry
+from app.prenatal.services import PrenatalService
+from tests.unit.test_daily_upsert import prenatal_payload
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    for model in (HeartEntry, KidneyEntry, PrenatalEntry, TriageItem):
+        model.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    install_triage_hooks()
+    yield session
+    remove_triage_hooks()
+    session.close()
+
+
+def heart_entry(status, hours_ago=0):
+    return HeartEntry(patient_id=1, patient_name="A", submission_date="2025-05-01", status=status,
+                      created_at=datetime.utcnow() - timedelta(hours=hours_ago))
+
+
+def queue(db, **filters):
+    return [(item["condition_type"], item["entry_id"], item["urgency"])
+            for item in TriageService(db).get_queue(**filters)["items"]]
+
+
+def test_writes_keep_the_queue_in_step(db):
+    service = HeartProgressService(db)
+    entry = service.create_entry(dict(patient_id=1, patient_name="A", submission_date="2025-05-01", status="good"))
+    assert queue(db) == [("heart", entry.id, "low")]
+
+    service.update_entry(entry.id, {"status": "urgent"})
+    assert queue(db) == [("heart", entry.id, "high")]
+
+    service.delete_entry(entry.id)
+    assert queue(db) == []
+
+
+def test_queue_is_most_urgent_then_newest(db):
+    old_high, low, new_high, medium = entries = [
+        heart_entry("urgent", hours_ago=30), heart_entry("good"),
+        heart_entry("urgent", hours_ago=1), heart_entry("monitor", hours_ago=2),
+    ]
+    db.add_all(entries)
+    db.commit()
+
+    assert [entry_id for _, entry_id, _ in queue(db)] == [new_high.id, old_high.id, medium.id, low.id]
+    assert queue(db, urgency=["high"], hours=24) == [("heart", new_high.id, "high")]
+    assert queue(db, conditions=["kidney"]) == []
+
+    item_id = TriageService(db).get_queue(limit=1)["items"][0]["id"]
+    assert TriageService(db).resolve(item_id, "nurse")["resolved_by"] == "nurse"
+    assert TriageService(db).resolve(9999) is None
+    assert queue(db, urgency=["high"]) == [("heart", old_high.id, "high")]
+
+
+def test_routes_require_staff_and_record_the_resolver(db):
+    db.add(heart_entry("urgent"))
+    db.commit()
+    app = FastAPI()
+    app.include_router(triage_router, prefix="/triage")
+    app.dependency_overrides[get_db] = lambda: db
+    client = TestClient(app)
+
+    assert client.get("/triage").status_code == 401
+    assert client.post("/triage/1/resolve").status_code == 401
+
+    app.dependency_overrides[require_staff] = lambda: User(username="dr.house", role=UserRole.DOCTOR)
+    item_id = client.get("/triage").json()["items"][0]["id"]
+    assert client.post(f"/triage/{item_id}/resolve?resolved_by=someone").json()["resolved_by"] == "dr.house"
+
+
+def test_core_writes_update_the_queue(db):
+    saved = PrenatalService.create_prenatal_entry(db, prenatal_payload(status="monitor"))
+    PrenatalService.create_prenatal_entry(db, prenatal_payload(status="urgent"))  # same day: upsert
+    assert queue(db) == [("prenatal", saved.id, "high")]
+
+    db.add(KidneyEntry(patient_id=1, patient_name="A", submission_date="2025-05-01", swelling_level=9,
+                       breathing_difficulty=8, urgency_status="low"))
+    db.commit()
+    rescore(db, "kidney")
+    assert ("kidney", 1, "medium") in queue(db)
+
+
+def test_backfill_queues_entries_written_without_hooks(db):
+    remove_triage_hooks()
+    db.add_all([heart_entry("urgent"), heart_entry("good", hours_ago=24 * 60)])
+    db.commit()
+    install_triage_hooks()
+
+    assert backfill(db, days=30, conditions=["heart"]) == 1
+    assert backfill(db, days=None, conditions=["heart"]) == 1
+    assert backfill(db, days=None, conditions=["heart"]) == 0
+    assert len(queue(db)) == 2
+
+
+def test_queue_reads_the_partial_index(db):
+    plan = db.execute(text(
+        "EXPLAIN QUERY PLAN SELECT id FROM triage_items WHERE resolved_at IS NULL AND urgency_rank = 2 "
+        "ORDER BY urgency_rank DESC, submitted_at DESC, id DESC LIMIT 50"
+    )).all()
+    assert "ix_triage_items_open_queue" in str(plan)
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.health_progress.kidney.models import KidneyEntry
+from app.health_progress.urgency import urgency_level, urgency_levels, rescore
+
+
+@pytest.mark.parametrize("condition, entry, expected", [
+    ("kidney", {"blood_pressure_systolic": "185", "blood_pressure_diastolic": "125"}, "high"),
+    ("kidney", {"blood_pressure_systolic": "145", "swelling_level": 6, "fatigue_level": 8}, "medium"),
+    ("kidney", {"urine_output": "Decreased, very low"}, "low"),  # first matching group wins: 2 points
+    ("kidney", {"urine_output": None, "breathing_difficulty": None, "blood_pressure_systolic": "abc"}, "low"),
+    ("cancer", {"pain_level": 8, "side_effects": 6, "energy_level": 3}, "high"),
+    ("cancer", {"pain_level": 4, "blood_pressure_systolic": "160", "energy_level": 2}, "medium"),
+    ("general_health", {"health_trend": "significantly_worse", "overall_wellbeing": 4, "primary_symptom_severity": 5}, "high"),
+    ("general_health", {"health_trend": "slightly_worse", "overall_wellbeing": 3}, "low"),
+])
+def test_single_entry_levels(condition, entry, expected):
+    assert urgency_level(condition, entry) == expected
+
+
+def test_batch_matches_single_entry_scoring():
+    rng = np.random.default_rng(0)
+    n = 500
+    columns = {
+        "blood_pressure_systolic": [None if v % 5 == 0 else str(v) for v in rng.integers(100, 200, n)],
+        "blood_pressure_diastolic": [str(v) for v in rng.integers(60, 130, n)],
+        "swelling_level": rng.integers(0, 11, n).tolist(),
+        "urine_output": rng.choice(["normal", "decreased", "none", ""], n).tolist(),
+        "nausea_level": [None] * n,
+    }
+
+    batch = urgency_levels("kidney", columns)
+    single = [urgency_level("kidney", {k: v[i] for k, v in columns.items()}) for i in range(n)]
+
+    assert batch.tolist() == single
+
+
+def test_rescore_updates_only_changed_rows():
+    engine = create_engine("sqlite://")
+    KidneyEntry.__table__.create(engine)
+    db = sessionmaker(bind=engine)()
+    db.add_all([
+        KidneyEntry(patient_id=1, patient_name="A", submission_date="2025-05-01", swelling_level=9,
+                    breathing_difficulty=8, urgency_status="low"),
+        KidneyEntry(patient_id=1, patient_name="A", submission_date="2025-05-02", urgency_status="low"),
+    ])
+    db.commit()
+
+    assert rescore(db, "kidney", chunk_size=1) == 1
+    assert [e.urgency_status for e in db.query(KidneyEntry).order_by(KidneyEntry.id)] == ["medium", "low"]
+    db.close()
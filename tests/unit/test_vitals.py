@@ -0,0 +1,116 @@
+from datetime import date, datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.authentication.auth import get_current_user
+from app.database import get_db
+from app.health_progress.cardiac.models import CardiacSurgeryEntry
+from app.health_progress.heart.models import HeartEntry
+from app.health_progress.vitals.models import VitalObservation
+from app.health_progress.vitals.routers import router as vitals_router
+from app.health_progress.vitals.services import (
+    VitalsService, backfill, extract_vitals, install_vital_hooks, remove_vital_hooks
+)
+from app.models import User, UserRole
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    for model in (HeartEntry, CardiacSurgeryEntry, VitalObservation):
+        model.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    install_vital_hooks()
+    yield session
+    remove_vital_hooks()
+    session.close()
+
+
+def heart_entry(day, systolic, **fields):
+    return HeartEntry(patient_id=7, patient_name="A", submission_date=day.isoformat(),
+                      blood_pressure_systolic=systolic, created_at=datetime.combine(day, datetime.min.time()),
+                      **fields)
+
+
+def stored(db):
+    return sorted((o.condition_type, o.vital, o.value) for o in db.scalars(select(VitalObservation)))
+
+
+def test_values_are_found_parsed_and_normalized():
+    data = {
+        "blood_pressure_systolic": "130 mmHg",
+        "weight": "",
+        "common_data": {"bloodPressureDiastolic": "85", "temperature": "100.4", "heartRate": 72, "weight": "80,5"},
+        "condition_data": {"oxygenSaturation": "140"},           # implausible, dropped
+    }
+    assert extract_vitals(data) == {
+        "bp_systolic": 130, "bp_diastolic": 85, "heart_rate": 72, "temperature": 38.0, "weight": 80.5,
+    }
+
+
+def test_orm_writes_keep_observations_in_step(db):
+    entry = heart_entry(date(2025, 5, 5), "120", blood_pressure_diastolic="80")
+    cardiac = CardiacSurgeryEntry(patient_id=7, submission_date=date(2025, 5, 5),
+                                  common_data={"temperature": "37.2"}, condition_data={})
+    db.add_all([entry, cardiac])
+    db.commit()
+    assert stored(db) == [("cardiac", "temperature", 37.2), ("heart", "bp_diastolic", 80), ("heart", "bp_systolic", 120)]
+
+    entry.blood_pressure_systolic = "150"
+    entry.blood_pressure_diastolic = None
+    db.commit()
+    assert stored(db) == [("cardiac", "temperature", 37.2), ("heart", "bp_systolic", 150)]
+
+    db.delete(cardiac)
+    db.commit()
+    assert stored(db) == [("heart", "bp_systolic", 150)]
+
+
+def test_backfill_rebuilds_from_the_trackers(db):
+    remove_vital_hooks()
+    db.add_all([heart_entry(date(2025, 5, 5), "120"), heart_entry(date(2025, 5, 6), "n/a", weight="81 kg")])
+    db.commit()
+    assert stored(db) == []
+
+    assert backfill(db, conditions=["heart"], chunk_size=1) == 2
+    assert backfill(db, conditions=["heart"]) == 2                                     # idempotent
+    assert stored(db) == [("heart", "bp_systolic", 120), ("heart", "weight", 81)]
+
+
+def test_trend_buckets_by_week(db):
+    for day, systolic in ((date(2025, 5, 5), "120"), (date(2025, 5, 11), "140"), (date(2025, 5, 12), "125")):
+        db.add(heart_entry(day, systolic))
+    db.commit()
+
+    trend = VitalsService(db).get_trend("7", ["bp_systolic", "weight"], bucket="week",
+                                        from_date=date(2025, 5, 1), to_date=date(2025, 5, 31))
+
+    assert trend["vitals"]["weight"] == {"unit": "kg", "buckets": []}
+    assert trend["vitals"]["bp_systolic"]["buckets"] == [
+        {"start": "2025-05-05", "min": 120, "max": 140, "avg": 130, "count": 2},
+        {"start": "2025-05-12", "min": 125, "max": 125, "avg": 125, "count": 1},
+    ]
+    with pytest.raises(ValueError):
+        VitalsService(db).get_trend("7", ["pulse"])
+
+
+def test_trend_is_for_staff_or_the_patient(db):
+    db.add(heart_entry(date.today(), "120"))
+    db.commit()
+    app = FastAPI()
+    app.include_router(vitals_router, prefix="/vitals")
+    app.dependency_overrides[get_db] = lambda: db
+    client = TestClient(app)
+
+    assert client.get("/vitals/7/trend").status_code == 401
+
+    app.dependency_overrides[get_current_user] = lambda: User(id=8, username="b", role=UserRole.PATIENT)
+    assert client.get("/vitals/7/trend").status_code == 403
+
+    app.dependency_overrides[get_current_user] = lambda: User(id=7, username="a", role=UserRole.PATIENT)
+    assert client.get("/vitals/7/trend?vital=bp_systolic").json()["vitals"]["bp_systolic"]["buckets"][0]["max"] == 120